@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import random
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Set, Tuple
 
-from src.core.data_structures import Barang, Kontainer, State
+import numpy as np
+
+from src.core.data_structures import State
 from src.core.objective_function import ObjectiveConfig, calculate_objective
-from src.core.initial_state import generate_random_state
-from src.utils.state_utils import renumber_container_ids, extract_all_items, resolve_capacity
+from src.core.lower_bound import reached_lower_bound
+from src.algorithms.utils.genome import GenomeSpace
+from src.algorithms.utils.fitness_cache import FitnessCache
+from src.utils.state_utils import extract_all_items, resolve_capacity
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
+
+# Jumlah mutasi ulang untuk klon sebelum diganti genom acak (opsi deduplicate)
+PERCOBAAN_DEDUP = 5
 
 
 def genetic_algorithm(
@@ -21,10 +30,23 @@ def genetic_algorithm(
     tournament_size: int = 3,
     elitism: int = 1,
     rng: Optional[random.Random] = None,
-) -> Tuple[State, List[float]]:
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    fitness_cache: Optional[FitnessCache] = None,
+    deduplicate: bool = False,
+) -> Tuple[State, History]:
     """
     Menjalankan Genetic Algorithm untuk masalah Bin Packing.
 
+    Individu direpresentasikan sebagai genom array integer (indeks barang -> label
+    kontainer, lihat `GenomeSpace`), sehingga populasi berupa satu array 2D dan
+    crossover, mutasi, perbaikan, serta penilaian berjalan langsung di atas array.
+    Genom hanya diubah menjadi State untuk hasil akhir. Skor setiap genom melewati
+    `FitnessCache`, sehingga individu duplikat (elit, anak tanpa crossover/mutasi)
+    tidak dinilai ulang.
+
     Args:
         initial_state: State awal yang digunakan sebagai baseline populasi.
         config: Konfigurasi fungsi objektif.
@@ -36,206 +58,181 @@ def genetic_algorithm(
         tournament_size: Ukuran turnamen untuk seleksi.
         elitism: Jumlah individu terbaik yang dibawa langsung ke generasi berikutnya.
         rng: Random generator agar eksperimen dapat direplikasi.
+        lower_bound: Batas bawah jumlah kontainer; evolusi berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; diperiksa setiap generasi.
+        cancel_token: Token pembatalan kooperatif (opsional).
+        fitness_cache: Cache skor fitness (opsional); berikan instance sendiri untuk
+            membaca penghitung `hits`/`misses` setelah GA selesai.
+        deduplicate: Jika True, setiap generasi baru tidak berisi individu dengan
+            pengepakan yang sama (dibandingkan lewat hash Zobrist genom). Klon dimutasi
+            ulang, atau diganti genom acak bila tetap klon.
 
     Returns:
         Pasangan (State terbaik, histori skor terbaik per generasi).
     """
-    if population_size < 2:
-        raise ValueError("population_size minimal bernilai 2 agar GA dapat bekerja.")
-    if max_generations < 0:
-        raise ValueError("max_generations tidak boleh negatif.")
-    if tournament_size < 1:
-        raise ValueError("tournament_size minimal bernilai 1.")
-    if elitism < 0:
-        raise ValueError("elitism tidak boleh negatif.")
+    _validate_parameters(population_size, max_generations, tournament_size, elitism)
 
     rng = rng or random.Random()
+    budget = Budget(time_limit, cancel_token)
     items = extract_all_items(initial_state)
+    history: History = recorder if recorder is not None else []
     if not items:
-        base_score = calculate_objective(initial_state, config)
-        return initial_state.salin(), [base_score]
+        history.append(calculate_objective(initial_state, config))
+        return initial_state.salin(), history
 
     kapasitas = resolve_capacity(initial_state, kapasitas_kontainer)
+    space = GenomeSpace(items, kapasitas, config)
+    cache = fitness_cache if fitness_cache is not None else FitnessCache()
 
-    population: List[State] = [initial_state.salin()]
-    while len(population) < population_size:
-        population.append(generate_random_state(items, kapasitas, rng))
-
-    scores = [calculate_objective(individu, config) for individu in population]
+    population = _initial_population(initial_state, space, population_size, rng)
+    scores = _evaluate(population, space, cache)
     best_idx = min(range(len(population)), key=lambda idx: scores[idx])
-    best_state = population[best_idx].salin()
+    best_genome = population[best_idx].copy()
     best_score = scores[best_idx]
-    history: List[float] = [best_score]
+    best_containers = _jumlah_label(best_genome)
+    history.append(best_score)
 
     for _ in range(max_generations):
-        new_population: List[State] = []
-        if elitism > 0:
-            elite_indices = _top_indices(scores, elitism)
-            for idx in elite_indices:
-                new_population.append(population[idx].salin())
-
-        while len(new_population) < population_size:
-            parent1 = _tournament_selection(population, scores, tournament_size, rng)
-            parent2 = _tournament_selection(population, scores, tournament_size, rng)
-
-            if rng.random() < crossover_rate:
-                child1, child2 = _crossover(parent1, parent2, items, kapasitas, rng)
-            else:
-                child1, child2 = parent1.salin(), parent2.salin()
-
-            if rng.random() < mutation_rate:
-                _mutate_state(child1, kapasitas, rng)
-            if rng.random() < mutation_rate:
-                _mutate_state(child2, kapasitas, rng)
-
-            new_population.append(child1)
-            if len(new_population) < population_size:
-                new_population.append(child2)
-
-        population = new_population
-        scores = [calculate_objective(individu, config) for individu in population]
+        if reached_lower_bound(best_score, best_containers, lower_bound):
+            break
+        if budget.exhausted():
+            break
+
+        population, scores = _next_generation(
+            population, scores, space, cache,
+            crossover_rate, mutation_rate, tournament_size, elitism, rng, deduplicate,
+        )
         generation_best_idx = min(range(len(population)), key=lambda idx: scores[idx])
         generation_best_score = scores[generation_best_idx]
 
         if generation_best_score < best_score:
             best_score = generation_best_score
-            best_state = population[generation_best_idx].salin()
+            best_genome = population[generation_best_idx].copy()
+            best_containers = _jumlah_label(best_genome)
 
         history.append(best_score)
 
-    return best_state, history
+    return space.decode(best_genome), history
 
 
+def _validate_parameters(population_size: int, max_generations: int, tournament_size: int, elitism: int) -> None:
+    if population_size < 2:
+        raise ValueError("population_size minimal bernilai 2 agar GA dapat bekerja.")
+    if max_generations < 0:
+        raise ValueError("max_generations tidak boleh negatif.")
+    if tournament_size < 1:
+        raise ValueError("tournament_size minimal bernilai 1.")
+    if elitism < 0:
+        raise ValueError("elitism tidak boleh negatif.")
 
 
+def _jumlah_label(genome: np.ndarray) -> int:
+    # Jumlah kontainer pada genom kanonik (label 0..k-1).
+    return int(genome.max()) + 1 if len(genome) else 0
 
 
-def _tournament_selection(
-    population: Sequence[State],
+def _evaluate(population: np.ndarray, space: GenomeSpace, cache: FitnessCache) -> List[float]:
+    # Skor setiap genom dalam populasi; genom yang sudah pernah dinilai diambil dari cache.
+    return [cache.get_or_compute(genome, space.score) for genome in population]
+
+
+def _initial_population(
+    initial_state: State,
+    space: GenomeSpace,
+    population_size: int,
+    rng: random.Random,
+) -> np.ndarray:
+    # Populasi berupa array (population_size x jumlah barang); baris pertama adalah state awal.
+    population = np.empty((population_size, len(space)), dtype=np.int32)
+    population[0] = space.encode(initial_state)
+    for idx in range(1, population_size):
+        population[idx] = space.random_genome(rng)
+    return population
+
+
+def _next_generation(
+    population: np.ndarray,
     scores: Sequence[float],
+    space: GenomeSpace,
+    cache: FitnessCache,
+    crossover_rate: float,
+    mutation_rate: float,
     tournament_size: int,
+    elitism: int,
     rng: random.Random,
-) -> State:
-    size = min(tournament_size, len(population))
-    kandidat_idx = rng.sample(range(len(population)), size)
-    best_idx = min(kandidat_idx, key=lambda idx: scores[idx])
-    return population[best_idx]
-
-
-def _crossover(
-    parent1: State,
-    parent2: State,
-    items: Sequence[Barang],
-    kapasitas: int,
-    rng: random.Random,
-) -> Tuple[State, State]:
-    if len(items) < 2:
-        return parent1.salin(), parent2.salin()
-
-    assignment1 = _item_assignment(parent1)
-    assignment2 = _item_assignment(parent2)
-    cut_point = rng.randint(1, len(items) - 1)
-
-    child1_map: Dict[str, Optional[int]] = {}
-    child2_map: Dict[str, Optional[int]] = {}
-    for idx, barang in enumerate(items):
-        if idx < cut_point:
-            child1_map[barang.id] = assignment1.get(barang.id)
-            child2_map[barang.id] = assignment2.get(barang.id)
+    deduplicate: bool = False,
+) -> Tuple[np.ndarray, List[float]]:
+    # Membentuk satu generasi baru (elitisme, seleksi, crossover, mutasi) beserta skornya.
+    population_size = len(population)
+    new_population = np.empty_like(population)
+    filled = 0
+    # Hash Zobrist individu yang sudah masuk generasi baru (hanya bila deduplicate)
+    seen: Optional[Set[int]] = set() if deduplicate else None
+    if elitism > 0:
+        for idx in _top_indices(scores, population_size if deduplicate else elitism):
+            if filled == min(elitism, population_size):
+                break
+            if seen is not None:
+                kode = space.kode_hash(population[idx])
+                if kode in seen:
+                    continue
+                seen.add(kode)
+            new_population[filled] = population[idx]
+            filled += 1
+
+    while filled < population_size:
+        parent1 = population[_tournament_selection(scores, tournament_size, rng)]
+        parent2 = population[_tournament_selection(scores, tournament_size, rng)]
+
+        if rng.random() < crossover_rate:
+            child1, child2 = space.crossover(parent1, parent2, rng)
         else:
-            child1_map[barang.id] = assignment2.get(barang.id)
-            child2_map[barang.id] = assignment1.get(barang.id)
-
-    return (
-        _build_state_from_assignment(child1_map, items, kapasitas),
-        _build_state_from_assignment(child2_map, items, kapasitas),
-    )
-
-
-def _item_assignment(state: State) -> Dict[str, Optional[int]]:
-    assignment: Dict[str, Optional[int]] = {}
-    for kontainer in state.kontainer_list:
-        for barang in kontainer.barang_di_dalam:
-            assignment[barang.id] = kontainer.id
-    for barang in state.barang_belum_dialokasi:
-        assignment[barang.id] = None
-    return assignment
-
-
-def _build_state_from_assignment(
-    assignment_map: Dict[str, Optional[int]],
-    items: Sequence[Barang],
-    kapasitas: int,
-) -> State:
-    grouped: Dict[Optional[int], List[Barang]] = {}
-    for barang in items:
-        key = assignment_map.get(barang.id)
-        grouped.setdefault(key, []).append(barang)
-
-    kontainer_list: List[Kontainer] = []
-    for _, group_items in sorted(grouped.items(), key=lambda item: str(item[0])):
-        if not group_items:
-            continue
-        kontainer = Kontainer(id=len(kontainer_list), kapasitas=kapasitas, barang_di_dalam=[])
-        for barang in group_items:
-            if kontainer.bisa_tambah_barang(barang):
-                kontainer.barang_di_dalam.append(barang)
-            else:
-                kontainer_list.append(kontainer)
-                kontainer = Kontainer(id=len(kontainer_list), kapasitas=kapasitas, barang_di_dalam=[barang])
-        kontainer_list.append(kontainer)
-
-    renumber_container_ids(kontainer_list)
-    return State(kontainer_list=kontainer_list, barang_belum_dialokasi=[])
-
-def _mutate_state(state: State, kapasitas: int, rng: random.Random) -> None:
-    if not state.kontainer_list:
-        return
-
-    operasi_pindah = rng.random() < 0.5
-
-    if operasi_pindah:
-        kontainer_dengan_barang = [k for k in state.kontainer_list if k.barang_di_dalam]
-        if not kontainer_dengan_barang:
-            return
-        sumber = rng.choice(kontainer_dengan_barang)
-        barang = rng.choice(sumber.barang_di_dalam)
-        sumber.barang_di_dalam.remove(barang)
-
-        kandidat = [k for k in state.kontainer_list if k is not sumber and k.bisa_tambah_barang(barang)]
-        if kandidat:
-            tujuan = rng.choice(kandidat)
-            tujuan.barang_di_dalam.append(barang)
+            child1, child2 = parent1.copy(), parent2.copy()
+
+        if rng.random() < mutation_rate:
+            space.mutate(child1, rng)
+        if rng.random() < mutation_rate:
+            space.mutate(child2, rng)
+
+        for child in (child1, child2):
+            if filled == population_size:
+                break
+            if seen is not None:
+                child = _make_unique(child, space, seen, rng)
+            new_population[filled] = child
+            filled += 1
+
+    new_scores = _evaluate(new_population, space, cache)
+    return new_population, new_scores
+
+
+def _make_unique(genome: np.ndarray, space: GenomeSpace, seen: Set[int], rng: random.Random) -> np.ndarray:
+    # Memutasi ulang klon hingga pengepakannya belum ada di `seen`, lalu mencatatnya.
+    # Ruang solusi yang sangat kecil bisa kehabisan individu unik; setelah semua
+    # percobaan gagal, klon tetap diterima agar generasi selalu terisi.
+    kode = space.kode_hash(genome)
+    for percobaan in range(PERCOBAAN_DEDUP + 1):
+        if kode not in seen:
+            break
+        if percobaan < PERCOBAAN_DEDUP:
+            space.mutate(genome, rng)
         else:
-            kontainer_baru = Kontainer(id=len(state.kontainer_list), kapasitas=kapasitas, barang_di_dalam=[barang])
-            state.kontainer_list.append(kontainer_baru)
-
-        if not sumber.barang_di_dalam:
-            state.kontainer_list.remove(sumber)
-    else:
-        if len(state.kontainer_list) < 2:
-            return
-        kontainer_dengan_barang = [k for k in state.kontainer_list if k.barang_di_dalam]
-        if len(kontainer_dengan_barang) < 2:
-            return
-        c1, c2 = rng.sample(kontainer_dengan_barang, 2)
-        b1 = rng.choice(c1.barang_di_dalam)
-        b2 = rng.choice(c2.barang_di_dalam)
-        muatan1 = c1.muatan_saat_ini - b1.ukuran + b2.ukuran
-        muatan2 = c2.muatan_saat_ini - b2.ukuran + b1.ukuran
-        if muatan1 <= kapasitas and muatan2 <= kapasitas:
-            c1.barang_di_dalam.remove(b1)
-            c2.barang_di_dalam.remove(b2)
-            c1.barang_di_dalam.append(b2)
-            c2.barang_di_dalam.append(b1)
-
-    _remove_empty_and_renumber(state)
-
-
-def _remove_empty_and_renumber(state: State) -> None:
-    state.kontainer_list = [k for k in state.kontainer_list if k.barang_di_dalam]
-    renumber_container_ids(state.kontainer_list)
+            genome = space.random_genome(rng)
+        kode = space.kode_hash(genome)
+    seen.add(kode)
+    return genome
+
 
+def _tournament_selection(
+    scores: Sequence[float],
+    tournament_size: int,
+    rng: random.Random,
+) -> int:
+    # Mengembalikan indeks pemenang turnamen.
+    size = min(tournament_size, len(scores))
+    kandidat_idx = rng.sample(range(len(scores)), size)
+    return min(kandidat_idx, key=lambda idx: scores[idx])
 
 
 def _top_indices(scores: Sequence[float], jumlah: int) -> List[int]:
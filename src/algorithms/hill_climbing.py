@@ -1,49 +1,71 @@
 import random
-from typing import List, Tuple, Optional
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterator, List, Tuple, Optional
 
 from src.core.data_structures import State, Barang
-from src.core.objective_function import calculate_objective, ObjectiveConfig
-from src.algorithms.utils.moves import get_all_neighbors
+from src.core.objective_function import ObjectiveConfig, ScoreComponents, compute_components
+from src.algorithms.utils.moves import Move, best_move, iter_all_moves, iter_prioritized_moves
+from src.algorithms.utils.vectorized import best_move_vectorized
 from src.core.initial_state import generate_random_state
+from src.core.lower_bound import reached_lower_bound
 from src.utils.state_utils import extract_all_items, resolve_capacity
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
 
 def steepest_ascent_hill_climbing(
     initial_state: State,
     config: ObjectiveConfig,
-    max_iter: int
-) -> Tuple[State, List[float]]:
+    max_iter: int,
+    vectorized: bool = True,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History]:
     """
     Mengimplementasikan Steepest Ascent Hill Climbing.
     
     Pada setiap iterasi, algoritma ini mengevaluasi semua keadaan tetangga dan
     memilih yang memberikan penurunan skor terbesar (paling curam). Pencarian
     berhenti jika tidak ada tetangga yang lebih baik atau iterasi maksimum tercapai.
+    Tetangga dinilai secara malas melalui evaluasi delta, sehingga hanya satu
+    state yang disimpan di memori.
 
     Args:
         initial_state: Keadaan awal untuk memulai pencarian.
         config: Konfigurasi untuk fungsi objektif.
         max_iter: Jumlah iterasi maksimum.
+        vectorized: Nilai seluruh lingkungan sekaligus dengan NumPy (hasil identik dengan jalur skalar).
+        lower_bound: Batas bawah jumlah kontainer; pencarian berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+        cancel_token: Token pembatalan kooperatif (opsional).
 
     Returns:
         Tuple berisi (keadaan terbaik yang ditemukan, histori skor).
     """
     current_state = initial_state.salin()
-    current_score = calculate_objective(current_state, config)
-    score_history = [current_score]
+    current_components = compute_components(current_state, config)
+    current_score = current_components.score()
+    score_history = recorder if recorder is not None else []
+    score_history.append(current_score)
+    find_best = best_move_vectorized if vectorized else best_move
+    budget = Budget(time_limit, cancel_token)
 
     for _ in range(max_iter):
-        neighbors = get_all_neighbors(current_state)
-        if not neighbors:
+        if reached_lower_bound(current_score, current_components.jumlah_kontainer, lower_bound):
+            break
+        if budget.exhausted():
+            break
+        chosen_move, best_components, best_neighbor_score = find_best(current_state, current_components, config)
+        if chosen_move is None:
             break
-
-        neighbor_scores = [calculate_objective(n, config) for n in neighbors]
-        
-        best_neighbor_score = min(neighbor_scores)
-        best_neighbor_index = neighbor_scores.index(best_neighbor_score)
-        best_neighbor = neighbors[best_neighbor_index]
 
         if best_neighbor_score < current_score:
-            current_state = best_neighbor
+            chosen_move.apply(current_state)
+            current_components = best_components
             current_score = best_neighbor_score
             score_history.append(current_score)
         else:
@@ -57,8 +79,12 @@ def steepest_ascent_hill_climbing(
 def stochastic_hill_climbing(
     initial_state: State,
     config: ObjectiveConfig,
-    max_iter: int
-) -> Tuple[State, List[float]]:
+    max_iter: int,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History]:
     """
     Mengimplementasikan Stochastic Hill Climbing.
 
@@ -70,28 +96,41 @@ def stochastic_hill_climbing(
         initial_state: Keadaan awal untuk memulai pencarian.
         config: Konfigurasi untuk fungsi objektif.
         max_iter: Jumlah iterasi maksimum.
+        lower_bound: Batas bawah jumlah kontainer; pencarian berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+        cancel_token: Token pembatalan kooperatif (opsional).
 
     Returns:
         Tuple berisi (keadaan terbaik yang ditemukan, histori skor).
     """
     current_state = initial_state.salin()
-    current_score = calculate_objective(current_state, config)
-    score_history = [current_score]
+    current_components = compute_components(current_state, config)
+    current_score = current_components.score()
+    score_history = recorder if recorder is not None else []
+    score_history.append(current_score)
+    budget = Budget(time_limit, cancel_token)
 
     for _ in range(max_iter):
-        neighbors = get_all_neighbors(current_state)
-        if not neighbors:
+        if reached_lower_bound(current_score, current_components.jumlah_kontainer, lower_bound):
             break
-
-        better_neighbors = []
-        for neighbor in neighbors:
-            neighbor_score = calculate_objective(neighbor, config)
+        if budget.exhausted():
+            break
+        has_neighbors = False
+        better_moves = []
+        for move in iter_all_moves(current_state):
+            has_neighbors = True
+            neighbor_components = move.evaluate(current_state, current_components, config)
+            neighbor_score = neighbor_components.score()
             if neighbor_score < current_score:
-                better_neighbors.append((neighbor, neighbor_score))
+                better_moves.append((move, neighbor_components, neighbor_score))
+        if not has_neighbors:
+            break
 
-        if better_neighbors:
-            chosen_neighbor, chosen_score = random.choice(better_neighbors)
-            current_state = chosen_neighbor
+        if better_moves:
+            chosen_move, chosen_components, chosen_score = random.choice(better_moves)
+            chosen_move.apply(current_state)
+            current_components = chosen_components
             current_score = chosen_score
             score_history.append(current_score)
         else:
@@ -105,48 +144,77 @@ def hill_climbing_with_sideways_moves(
     initial_state: State,
     config: ObjectiveConfig,
     max_iter: int,
-    max_sideways_moves: int
-) -> Tuple[State, List[float]]:
+    max_sideways_moves: int,
+    vectorized: bool = True,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History]:
     """
     Mengimplementasikan Hill Climbing yang mengizinkan sideways moves.
 
     Varian ini mirip dengan Steepest Ascent, tetapi jika tidak ada tetangga yang
     lebih baik, ia akan menerima tetangga dengan skor yang sama. Ini berguna
     untuk melintasi 'plateau' dalam lanskap pencarian. Jumlah sideways moves
-    dibatasi oleh `max_sideways_moves`.
+    dibatasi oleh `max_sideways_moves`. Hash Zobrist setiap state yang dikunjungi
+    (`State.kode_hash`) disimpan, sehingga gerakan menyamping tidak pernah kembali ke
+    pengepakan yang sudah dikunjungi; jika gerakan terbaik menuju state lama, dipilih
+    gerakan lain dengan skor sama yang belum dikunjungi, dan pencarian berhenti bila
+    tidak ada.
 
     Args:
         initial_state: Keadaan awal untuk memulai pencarian.
         config: Konfigurasi untuk fungsi objektif.
         max_iter: Jumlah iterasi maksimum.
         max_sideways_moves: Jumlah maksimum gerakan menyamping yang diizinkan secara berurutan.
+        vectorized: Nilai seluruh lingkungan sekaligus dengan NumPy (hasil identik dengan jalur skalar).
+        lower_bound: Batas bawah jumlah kontainer; pencarian berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+        cancel_token: Token pembatalan kooperatif (opsional).
 
     Returns:
         Tuple berisi (keadaan terbaik yang ditemukan, histori skor).
     """
     current_state = initial_state.salin()
-    current_score = calculate_objective(current_state, config)
-    score_history = [current_score]
+    current_components = compute_components(current_state, config)
+    current_score = current_components.score()
+    score_history = recorder if recorder is not None else []
+    score_history.append(current_score)
     sideways_moves_count = 0
+    find_best = best_move_vectorized if vectorized else best_move
+    budget = Budget(time_limit, cancel_token)
+    visited = {current_state.kode_hash}
 
     for _ in range(max_iter):
-        neighbors = get_all_neighbors(current_state)
-        if not neighbors:
+        if reached_lower_bound(current_score, current_components.jumlah_kontainer, lower_bound):
+            break
+        if budget.exhausted():
+            break
+        chosen_move, best_components, best_neighbor_score = find_best(current_state, current_components, config)
+        if chosen_move is None:
             break
-
-        neighbor_scores = [calculate_objective(n, config) for n in neighbors]
-        
-        best_neighbor_score = min(neighbor_scores)
-        best_neighbor_index = neighbor_scores.index(best_neighbor_score)
-        best_neighbor = neighbors[best_neighbor_index]
 
         if best_neighbor_score < current_score:
-            current_state = best_neighbor
+            chosen_move.apply(current_state)
+            visited.add(current_state.kode_hash)
+            current_components = best_components
             current_score = best_neighbor_score
             score_history.append(current_score)
             sideways_moves_count = 0
         elif best_neighbor_score == current_score and sideways_moves_count < max_sideways_moves:
-            current_state = best_neighbor
+            if chosen_move.resulting_hash(current_state) in visited:
+                chosen_move, best_components = _unvisited_sideways_move(
+                    current_state, current_components, current_score, config, visited
+                )
+                if chosen_move is None:
+                    # Seluruh plateau di sekitar state ini sudah dikunjungi.
+                    score_history.append(current_score)
+                    break
+            chosen_move.apply(current_state)
+            visited.add(current_state.kode_hash)
+            current_components = best_components
             # Catat skor untuk menunjukkan iterasi terjadi, meskipun skornya sama.
             score_history.append(current_score)
             sideways_moves_count += 1
@@ -157,21 +225,247 @@ def hill_climbing_with_sideways_moves(
             
     return current_state, score_history
 
+def _unvisited_sideways_move(
+    state: State,
+    components: ScoreComponents,
+    score: float,
+    config: ObjectiveConfig,
+    visited: set
+) -> Tuple[Optional[Move], Optional[ScoreComponents]]:
+    # Gerakan pertama dengan skor sama yang menuju state yang belum pernah dikunjungi.
+    for move in iter_all_moves(state):
+        neighbor_components = move.evaluate(state, components, config)
+        if neighbor_components.score() == score and move.resulting_hash(state) not in visited:
+            return move, neighbor_components
+    return None, None
+
+def first_improvement_hill_climbing(
+    initial_state: State,
+    config: ObjectiveConfig,
+    max_iter: int,
+    rng: Optional[random.Random] = None,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History]:
+    """
+    Mengimplementasikan First-Improvement Hill Climbing.
+
+    Berbeda dengan Steepest Ascent, tetangga tidak dinilai semuanya: gerakan dibangkitkan
+    secara malas oleh `iter_prioritized_moves` (barang dari kontainer paling kosong ke
+    kontainer dengan sisa kapasitas paling pas, urutan diacak setiap iterasi) dan gerakan
+    pertama yang menurunkan skor langsung diambil. Pencarian berhenti jika seluruh
+    lingkungan sudah diperiksa tanpa perbaikan atau iterasi maksimum tercapai.
+
+    Args:
+        initial_state: Keadaan awal untuk memulai pencarian.
+        config: Konfigurasi untuk fungsi objektif.
+        max_iter: Jumlah iterasi maksimum.
+        rng: Generator angka acak untuk mengacak urutan gerakan (opsional, default modul `random`).
+        lower_bound: Batas bawah jumlah kontainer; pencarian berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+        cancel_token: Token pembatalan kooperatif (opsional).
+
+    Returns:
+        Tuple berisi (keadaan terbaik yang ditemukan, histori skor).
+    """
+    rng = rng if rng is not None else random
+    current_state = initial_state.salin()
+    current_components = compute_components(current_state, config)
+    current_score = current_components.score()
+    score_history = recorder if recorder is not None else []
+    score_history.append(current_score)
+    budget = Budget(time_limit, cancel_token)
+
+    for _ in range(max_iter):
+        if reached_lower_bound(current_score, current_components.jumlah_kontainer, lower_bound):
+            break
+        if budget.exhausted():
+            break
+        chosen = None
+        for move in iter_prioritized_moves(current_state, rng):
+            neighbor_components = move.evaluate(current_state, current_components, config)
+            neighbor_score = neighbor_components.score()
+            if neighbor_score < current_score:
+                chosen = (move, neighbor_components, neighbor_score)
+                break
+
+        if chosen is not None:
+            chosen_move, current_components, current_score = chosen
+            chosen_move.apply(current_state)
+            score_history.append(current_score)
+        else:
+            # Optimum lokal: tidak ada tetangga yang lebih baik.
+            score_history.append(current_score)
+            break
+
+    return current_state, score_history
+
+@dataclass
+class RestartResult:
+    """Hasil satu proses pencarian dalam Random-Restart Hill Climbing."""
+    index: int
+    state: State
+    history: List[float]
+
+    @property
+    def score(self) -> float:
+        return self.history[-1] if self.history else float('inf')
+
+
+def _run_restart(
+    index: int,
+    start_state: Optional[State],
+    all_items: List[Barang],
+    kapasitas: int,
+    seed: Optional[int],
+    config: ObjectiveConfig,
+    max_iter: int,
+    lower_bound: Optional[int],
+    deadline: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> RestartResult:
+    # Dijalankan di proses worker; state awal acak dibuat dari seed agar deterministik.
+    # Tenggat dikirim sebagai waktu absolut agar restart yang mulai belakangan tidak mendapat waktu penuh.
+    if start_state is None:
+        start_state = generate_random_state(all_items, kapasitas, random.Random(seed))
+    state, history = steepest_ascent_hill_climbing(
+        initial_state=start_state,
+        config=config,
+        max_iter=max_iter,
+        lower_bound=lower_bound,
+        time_limit=Budget(deadline=deadline).remaining(),
+        cancel_token=cancel_token
+    )
+    return RestartResult(index, state, history)
+
+
+def iter_random_restarts(
+    initial_state: State,
+    config: ObjectiveConfig,
+    num_restarts: int,
+    max_iter_per_restart: int,
+    rng: Optional[random.Random] = None,
+    kapasitas_kontainer: Optional[int] = None,
+    lower_bound: Optional[int] = None,
+    workers: int = 1,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Iterator[RestartResult]:
+    """
+    Menjalankan semua pencarian Random-Restart dan menghasilkan hasilnya satu per satu.
+
+    Pencarian ke-0 dimulai dari `initial_state`, pencarian ke-1..`num_restarts` dari
+    state acak. Seed setiap restart diturunkan dari `rng` sebelum pencarian dimulai,
+    sehingga hasil tiap restart tidak bergantung pada jumlah worker. Dengan
+    `workers > 1`, restart diajukan bertahap ke `ProcessPoolExecutor` dan hasil
+    dikirim sesuai urutan selesai; sisa restart dilewati begitu batas bawah tercapai.
+
+    Bila batas waktu habis atau token dibatalkan, restart yang belum dimulai tidak
+    dijalankan. Pencarian ke-0 selalu menghasilkan hasil (paling tidak state awal).
+    Dengan `workers > 1`, worker hanya menerima tenggat waktu; token diperiksa proses
+    induk setiap kali satu restart selesai.
+
+    Args:
+        initial_state: Keadaan awal untuk pencarian pertama.
+        config: Konfigurasi untuk fungsi objektif.
+        num_restarts: Jumlah restart setelah pencarian awal.
+        max_iter_per_restart: Jumlah iterasi maksimum untuk setiap proses Hill Climbing.
+        rng: Generator angka acak induk untuk menurunkan seed restart.
+        kapasitas_kontainer: Kapasitas kontainer (opsional).
+        lower_bound: Batas bawah jumlah kontainer; restart dihentikan begitu batas ini tercapai.
+        workers: Jumlah proses worker (1 = dijalankan berurutan di proses ini).
+        time_limit: Batas waktu total dalam detik untuk semua restart.
+        cancel_token: Token pembatalan kooperatif (opsional).
+
+    Yields:
+        RestartResult untuk setiap pencarian yang selesai.
+    """
+    budget = Budget(time_limit, cancel_token)
+    rng = rng or random.Random()
+    all_items = extract_all_items(initial_state)
+    if not all_items:
+        num_restarts = 0
+        kapasitas = kapasitas_kontainer or 0
+    else:
+        kapasitas = resolve_capacity(initial_state, kapasitas_kontainer)
+    seeds = [rng.getrandbits(64) for _ in range(num_restarts)]
+
+    # Argumen untuk _run_restart: pencarian 0 memakai initial_state, sisanya seed turunan
+    tasks = [(0, initial_state, all_items, kapasitas, None, config, max_iter_per_restart, lower_bound, budget.deadline)]
+    tasks += [
+        (i + 1, None, all_items, kapasitas, seed, config, max_iter_per_restart, lower_bound, budget.deadline)
+        for i, seed in enumerate(seeds)
+    ]
+
+    def selesai(result: RestartResult) -> bool:
+        return reached_lower_bound(result.score, len(result.state.kontainer_list), lower_bound)
+
+    if workers <= 1:
+        for task in tasks:
+            if task[0] > 0 and budget.exhausted():
+                return
+            result = _run_restart(*task, cancel_token=cancel_token)
+            yield result
+            if selesai(result):
+                return
+        return
+
+    # Executor dikelola manual: begitu batas bawah tercapai, generator kembali tanpa
+    # menunggu restart yang masih berjalan (shutdown tanpa wait membatalkan antrean)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # Restart diajukan bertahap (paling banyak 2x jumlah worker) agar restart yang
+        # belum dimulai dapat dilewati begitu batas bawah atau batas waktu tercapai
+        antrean = iter(tasks)
+        pertama = executor.submit(_run_restart, *next(antrean))
+        berjalan = {pertama}
+        while True:
+            if budget.exhausted():
+                # Restart yang sudah berjalan dibiarkan selesai (worker menghormati tenggat);
+                # pencarian ke-0 tidak pernah dibatalkan agar selalu ada hasil
+                berjalan = {future for future in berjalan if future is pertama or not future.cancel()}
+                batas_tunggu = None
+            else:
+                for task in islice(antrean, 2 * workers - len(berjalan)):
+                    berjalan.add(executor.submit(_run_restart, *task))
+                # Bangun paling lambat saat tenggat tiba agar restart yang belum dimulai dibatalkan
+                batas_tunggu = budget.remaining()
+            if not berjalan:
+                return
+            rampung, berjalan = wait(berjalan, timeout=batas_tunggu, return_when=FIRST_COMPLETED)
+            for result in sorted((future.result() for future in rampung), key=lambda r: r.index):
+                yield result
+                if selesai(result):
+                    return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def random_restart_hill_climbing(
     initial_state: State,
     config: ObjectiveConfig,
     num_restarts: int,
     max_iter_per_restart: int,
     rng: Optional[random.Random] = None,
-    kapasitas_kontainer: Optional[int] = None
-) -> Tuple[State, List[float]]:
+    kapasitas_kontainer: Optional[int] = None,
+    lower_bound: Optional[int] = None,
+    workers: int = 1,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    on_restart: Optional[Callable[[RestartResult], None]] = None
+) -> Tuple[State, History]:
     """
     Mengimplementasikan Random-Restart Hill Climbing.
 
     Algoritma ini menjalankan Steepest Ascent Hill Climbing beberapa kali. Pencarian
     pertama dijalankan pada `initial_state`, kemudian sisanya (`num_restarts`) 
     dimulai dari keadaan awal yang dibuat secara acak. Solusi terbaik yang 
-    ditemukan dari semua proses pencarian akan menjadi hasil akhir.
+    ditemukan dari semua proses pencarian akan menjadi hasil akhir; jika skornya
+    sama, pencarian dengan indeks terkecil yang dipilih.
 
     Args:
         initial_state: Keadaan awal untuk memulai pencarian pertama.
@@ -180,48 +474,30 @@ def random_restart_hill_climbing(
         max_iter_per_restart: Jumlah iterasi maksimum untuk setiap proses Hill Climbing.
         rng: Generator angka acak untuk pembuatan state.
         kapasitas_kontainer: Kapasitas kontainer (opsional).
+        lower_bound: Batas bawah jumlah kontainer; restart dihentikan begitu batas ini tercapai.
+        workers: Jumlah proses worker untuk menjalankan restart secara paralel.
+        recorder: Perekam untuk histori skor pencarian terbaik (opsional, default list biasa).
+        time_limit: Batas waktu total dalam detik; restart yang belum dimulai dilewati bila habis.
+        cancel_token: Token pembatalan kooperatif (opsional).
+        on_restart: Dipanggil dengan `RestartResult` setiap kali satu pencarian selesai,
+            misalnya untuk menampilkan progres (opsional; fungsi ini sendiri tidak mencetak apa pun).
 
     Returns:
         Tuple berisi (keadaan terbaik yang ditemukan, histori skor dari pencarian terbaik).
     """
-    rng = rng or random.Random()
+    best: Optional[RestartResult] = None
+    for result in iter_random_restarts(
+        initial_state, config, num_restarts, max_iter_per_restart,
+        rng=rng, kapasitas_kontainer=kapasitas_kontainer, lower_bound=lower_bound, workers=workers,
+        time_limit=time_limit, cancel_token=cancel_token
+    ):
+        if on_restart is not None:
+            on_restart(result)
+        if best is None or (result.score, result.index) < (best.score, best.index):
+            best = result
 
-    # Jalankan pencarian pertama pada state awal yang diberikan
-    print("  Running initial search on the provided start state...")
-    best_state_overall, best_history = steepest_ascent_hill_climbing(
-        initial_state=initial_state,
-        config=config,
-        max_iter=max_iter_per_restart
-    )
-    best_score_overall = best_history[-1] if best_history else float('inf')
-
-    all_items = extract_all_items(initial_state)
-    if not all_items:
-        return best_state_overall, best_history
-        
-    kapasitas = resolve_capacity(initial_state, kapasitas_kontainer)
-
-    # Jalankan restart sejumlah num_restarts
-    for i in range(num_restarts):
-        print(f"  Restarting search ({i + 1}/{num_restarts})...")
-        random_start_state = generate_random_state(all_items, kapasitas, rng)
-        
-        current_best_state, current_history = steepest_ascent_hill_climbing(
-            initial_state=random_start_state,
-            config=config,
-            max_iter=max_iter_per_restart
-        )
-        
-        # Lewati jika restart ini tidak menghasilkan apa-apa
-        if not current_history:
-            continue
-
-        current_best_score = current_history[-1]
-
-        # Perbarui jika ditemukan solusi yang lebih baik secara keseluruhan
-        if current_best_score < best_score_overall:
-            best_score_overall = current_best_score
-            best_state_overall = current_best_state
-            best_history = current_history
-
-    return best_state_overall, best_history
\ No newline at end of file
+    if recorder is None:
+        return best.state, best.history
+    for skor in best.history:
+        recorder.append(skor)
+    return best.state, recorder
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import random
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.data_structures import State
+from src.core.objective_function import ObjectiveConfig, calculate_objective
+from src.core.lower_bound import reached_lower_bound
+from src.utils.state_utils import extract_all_items, resolve_capacity
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
+from src.algorithms.utils.genome import GenomeSpace
+from src.algorithms.utils.fitness_cache import UKURAN_CACHE_DEFAULT, FitnessCache
+from src.algorithms.genetic_algorithm import (
+    _evaluate,
+    _initial_population,
+    _jumlah_label,
+    _next_generation,
+    _top_indices,
+    _validate_parameters,
+)
+
+# Topologi migrasi yang didukung
+TOPOLOGI_MIGRASI = ('ring', 'fully_connected')
+
+
+def migration_targets(index: int, num_islands: int, topology: str) -> List[int]:
+    """
+    Menentukan pulau tujuan migran dari pulau `index`.
+
+    Args:
+        index: Indeks pulau pengirim.
+        num_islands: Jumlah seluruh pulau.
+        topology: 'ring' (hanya ke pulau berikutnya) atau 'fully_connected' (ke semua pulau lain).
+
+    Returns:
+        List indeks pulau tujuan.
+    """
+    if topology not in TOPOLOGI_MIGRASI:
+        raise ValueError(f"Topologi migrasi '{topology}' tidak dikenal. Pilihan: {TOPOLOGI_MIGRASI}")
+    if num_islands < 2:
+        return []
+    if topology == 'ring':
+        return [(index + 1) % num_islands]
+    return [j for j in range(num_islands) if j != index]
+
+
+def island_genetic_algorithm(
+    initial_state: State,
+    config: ObjectiveConfig,
+    *,
+    kapasitas_kontainer: Optional[int] = None,
+    num_islands: int = 4,
+    migration_interval: int = 10,
+    migration_size: int = 2,
+    topology: str = 'ring',
+    max_generations: int = 100,
+    population_size: int = 30,
+    crossover_rate: float = 0.8,
+    mutation_rate: float = 0.2,
+    tournament_size: int = 3,
+    elitism: int = 1,
+    rng: Optional[random.Random] = None,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None,
+    fitness_cache_size: int = UKURAN_CACHE_DEFAULT,
+    deduplicate: bool = False,
+) -> Tuple[State, History, List[List[float]]]:
+    """
+    Menjalankan Genetic Algorithm model pulau dengan setiap pulau di proses terpisah.
+
+    Setiap pulau mengevolusikan sub-populasinya sendiri dengan operator yang sama
+    seperti `genetic_algorithm`. Setiap `migration_interval` generasi, semua pulau
+    mengirim `migration_size` individu terbaiknya ke pulau tujuan sesuai topologi,
+    lalu menunggu migran dari pulau lain (migrasi sinkron) dan menggantikan
+    individu terburuknya. Migran dikirim sebagai genom array integer; hanya individu
+    terbaik setiap pulau yang diubah menjadi State di akhir. Seed setiap pulau
+    diturunkan dari `rng`, sehingga hasil tidak bergantung pada penjadwalan proses.
+
+    Args:
+        initial_state: State awal; dimasukkan ke populasi awal setiap pulau.
+        config: Konfigurasi fungsi objektif.
+        kapasitas_kontainer: Kapasitas kontainer (opsional, akan diambil dari state bila tidak disediakan).
+        num_islands: Jumlah pulau (proses).
+        migration_interval: Jumlah generasi di antara dua migrasi.
+        migration_size: Jumlah individu terbaik yang dikirim setiap migrasi.
+        topology: 'ring' atau 'fully_connected'.
+        max_generations: Jumlah generasi yang disimulasikan setiap pulau.
+        population_size: Jumlah individu dalam populasi setiap pulau.
+        crossover_rate: Peluang crossover antar pasangan orang tua.
+        mutation_rate: Peluang mutasi diterapkan pada individu.
+        tournament_size: Ukuran turnamen untuk seleksi.
+        elitism: Jumlah individu terbaik yang dibawa langsung ke generasi berikutnya.
+        rng: Random generator induk untuk menurunkan seed setiap pulau.
+        lower_bound: Batas bawah jumlah kontainer; semua pulau berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor terbaik global (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; setiap pulau memeriksanya setiap generasi.
+        cancel_token: Token pembatalan kooperatif; diperiksa proses induk dan diteruskan
+            ke semua pulau.
+        fitness_cache_size: Ukuran cache fitness LRU di setiap pulau (0 = nonaktif).
+        deduplicate: Buang individu duplikat dari setiap generasi baru di setiap pulau.
+
+    Returns:
+        Tuple (State terbaik global, histori skor terbaik global per generasi,
+        histori skor terbaik per generasi untuk setiap pulau).
+    """
+    _validate_parameters(population_size, max_generations, tournament_size, elitism)
+    if num_islands < 1:
+        raise ValueError("num_islands minimal bernilai 1.")
+    if migration_interval < 1:
+        raise ValueError("migration_interval minimal bernilai 1.")
+    if migration_size < 0 or migration_size >= population_size:
+        raise ValueError("migration_size harus di antara 0 dan population_size - 1.")
+    if fitness_cache_size < 0:
+        raise ValueError("fitness_cache_size tidak boleh negatif.")
+    migration_targets(0, num_islands, topology)  # validasi topologi
+
+    rng = rng or random.Random()
+    global_history: History = recorder if recorder is not None else []
+    items = extract_all_items(initial_state)
+    if not items:
+        base_score = calculate_objective(initial_state, config)
+        global_history.append(base_score)
+        return initial_state.salin(), global_history, [[base_score] for _ in range(num_islands)]
+
+    kapasitas = resolve_capacity(initial_state, kapasitas_kontainer)
+    seeds = [rng.getrandbits(64) for _ in range(num_islands)]
+    budget = Budget(time_limit, cancel_token)
+    # Token antar-proses; dibatalkan proses induk ketika cancel_token pemanggil dibatalkan
+    worker_token = CancelToken(mp.Event())
+    ga_params = dict(
+        max_generations=max_generations,
+        population_size=population_size,
+        crossover_rate=crossover_rate,
+        mutation_rate=mutation_rate,
+        tournament_size=tournament_size,
+        elitism=elitism,
+        migration_interval=migration_interval,
+        migration_size=migration_size,
+        deadline=budget.deadline,
+        fitness_cache_size=fitness_cache_size,
+        deduplicate=deduplicate,
+    )
+
+    inboxes = [mp.Queue() for _ in range(num_islands)]
+    result_queue = mp.Queue()
+    barrier = mp.Barrier(num_islands)
+    # Epoch paling awal saat sebuah pulau meminta berhenti (belum ada permintaan: -1)
+    epoch_berhenti = mp.Value('q', -1)
+    processes = []
+    for index in range(num_islands):
+        outboxes = {j: inboxes[j] for j in migration_targets(index, num_islands, topology)}
+        jumlah_pengirim = sum(index in migration_targets(j, num_islands, topology) for j in range(num_islands))
+        process = mp.Process(
+            target=_island_worker,
+            args=(index, initial_state, config, kapasitas, ga_params, seeds[index], lower_bound,
+                  inboxes[index], outboxes, jumlah_pengirim, barrier, epoch_berhenti, worker_token, result_queue),
+            daemon=True,
+        )
+        process.start()
+        processes.append(process)
+
+    # Hasil diambil sebelum join agar proses tidak tertahan oleh buffer queue
+    results: Dict[int, Tuple[State, List[float]]] = {}
+    try:
+        while len(results) < num_islands:
+            if cancel_token is None:
+                index, status, payload = result_queue.get()
+            else:
+                try:
+                    index, status, payload = result_queue.get(timeout=0.05)
+                except queue.Empty:
+                    if cancel_token.cancelled:
+                        worker_token.cancel()
+                    continue
+            if status == 'error':
+                raise RuntimeError(f"Pulau {index} gagal:\n{payload}")
+            results[index] = payload
+    finally:
+        for process in processes:
+            if len(results) < num_islands:
+                process.terminate()
+            process.join()
+
+    island_histories = [results[index][1] for index in range(num_islands)]
+    best_index = min(range(num_islands), key=lambda idx: (island_histories[idx][-1], idx))
+    best_state = results[best_index][0]
+
+    # Histori global: skor terbaik di antara semua pulau pada setiap generasi
+    panjang = max(len(h) for h in island_histories)
+    for generasi in range(panjang):
+        global_history.append(min(h[min(generasi, len(h) - 1)] for h in island_histories))
+    return best_state, global_history, island_histories
+
+
+def _island_worker(
+    index: int,
+    initial_state: State,
+    config: ObjectiveConfig,
+    kapasitas: int,
+    ga_params: dict,
+    seed: int,
+    lower_bound: Optional[int],
+    inbox: mp.Queue,
+    outboxes: Dict[int, mp.Queue],
+    jumlah_pengirim: int,
+    barrier,
+    epoch_berhenti,
+    worker_token: CancelToken,
+    result_queue: mp.Queue,
+) -> None:
+    # Proses satu pulau: evolusi, migrasi sinkron, lalu kirim hasil ke proses induk.
+    try:
+        payload = _evolve_island(
+            index, initial_state, config, kapasitas, ga_params, random.Random(seed), lower_bound,
+            inbox, outboxes, jumlah_pengirim, barrier, epoch_berhenti, worker_token,
+        )
+        result_queue.put((index, 'ok', payload))
+    except Exception:
+        barrier.abort()
+        result_queue.put((index, 'error', traceback.format_exc()))
+
+
+def _minta_berhenti(epoch_berhenti, epoch: int) -> None:
+    # Mencatat permintaan berhenti pada `epoch`; epoch paling awal yang dipertahankan.
+    with epoch_berhenti.get_lock():
+        if epoch_berhenti.value < 0 or epoch < epoch_berhenti.value:
+            epoch_berhenti.value = epoch
+
+
+def _evolve_island(
+    index: int,
+    initial_state: State,
+    config: ObjectiveConfig,
+    kapasitas: int,
+    ga_params: dict,
+    rng: random.Random,
+    lower_bound: Optional[int],
+    inbox: mp.Queue,
+    outboxes: Dict[int, mp.Queue],
+    jumlah_pengirim: int,
+    barrier,
+    epoch_berhenti,
+    worker_token: CancelToken,
+) -> Tuple[State, List[float]]:
+    space = GenomeSpace(extract_all_items(initial_state), kapasitas, config)
+    cache = FitnessCache(ga_params['fitness_cache_size'])
+    budget = Budget(cancel_token=worker_token, deadline=ga_params['deadline'])
+    max_generations = ga_params['max_generations']
+    migration_interval = ga_params['migration_interval']
+    migration_size = ga_params['migration_size']
+
+    population = _initial_population(initial_state, space, ga_params['population_size'], rng)
+    scores = _evaluate(population, space, cache)
+    best_idx = min(range(len(population)), key=lambda idx: scores[idx])
+    best_genome = population[best_idx].copy()
+    best_score = scores[best_idx]
+    history: List[float] = [best_score]
+
+    # Migran dari epoch berikutnya bisa tiba lebih awal, sehingga disimpan per epoch
+    tertunda: Dict[int, List[Tuple[int, np.ndarray, List[float]]]] = {}
+    generasi = 0
+    epoch = 0
+    while generasi < max_generations:
+        batas_epoch = min(generasi + migration_interval, max_generations)
+        while generasi < batas_epoch:
+            if reached_lower_bound(best_score, _jumlah_label(best_genome), lower_bound) or budget.exhausted():
+                _minta_berhenti(epoch_berhenti, epoch)
+                break
+            population, scores = _next_generation(
+                population, scores, space, cache,
+                ga_params['crossover_rate'], ga_params['mutation_rate'],
+                ga_params['tournament_size'], ga_params['elitism'], rng, ga_params['deduplicate'],
+            )
+            generation_best_idx = min(range(len(population)), key=lambda idx: scores[idx])
+            if scores[generation_best_idx] < best_score:
+                best_score = scores[generation_best_idx]
+                best_genome = population[generation_best_idx].copy()
+            history.append(best_score)
+            generasi += 1
+
+        # Semua pulau tiba di titik ini pada epoch yang sama. Permintaan berhenti hanya
+        # berlaku untuk epoch tempat permintaan itu dibuat (atau sebelumnya), sehingga
+        # pulau yang sudah masuk epoch berikutnya tidak membuat pulau lain berhenti
+        # sebelum migran epoch ini terkirim.
+        barrier.wait()
+        berhenti = epoch_berhenti.value
+        if 0 <= berhenti <= epoch or generasi >= max_generations:
+            break
+
+        if migration_size > 0 and outboxes:
+            elite = _top_indices(scores, migration_size)
+            migran = population[elite]
+            skor_migran = [scores[idx] for idx in elite]
+            for target in outboxes.values():
+                target.put((epoch, index, migran, skor_migran))
+
+            while len(tertunda.get(epoch, [])) < jumlah_pengirim:
+                pesan_epoch, pengirim, individu, skor = inbox.get()
+                tertunda.setdefault(pesan_epoch, []).append((pengirim, individu, skor))
+
+            # Migran diurutkan per pengirim agar hasil deterministik
+            masuk = [
+                (genome, nilai)
+                for _, individu, skor in sorted(tertunda.pop(epoch), key=lambda pesan: pesan[0])
+                for genome, nilai in zip(individu, skor)
+            ]
+            # Migran menggantikan individu terburuk; individu terbaik pulau selalu dipertahankan
+            masuk = masuk[:len(population) - 1]
+            terburuk = _top_indices([-skor for skor in scores], len(masuk))
+            for idx, (genome, nilai) in zip(terburuk, masuk):
+                population[idx] = genome
+                scores[idx] = nilai
+                if nilai < best_score:
+                    best_score = nilai
+                    best_genome = genome.copy()
+        epoch += 1
+
+    return space.decode(best_genome), history
@@ -0,0 +1,306 @@
+import heapq
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from src.core.data_structures import Barang, Kontainer, State
+from src.core.objective_function import ObjectiveConfig
+from src.core.packing import BestFitIndex, CapacityTree
+from src.algorithms.hill_climbing import steepest_ascent_hill_climbing
+
+# Kebijakan penempatan online yang didukung oleh OnlinePacker
+KEBIJAKAN_ONLINE = ('next_fit', 'first_fit', 'best_fit', 'harmonic')
+# Kebijakan yang mengizinkan reoptimisasi kontainer terbuka dengan local search
+KEBIJAKAN_REOPTIMISASI = ('first_fit', 'best_fit')
+# Nilai slot CapacityTree yang kosong (tidak pernah terpilih)
+_SLOT_KOSONG = -1
+
+
+class OnlinePacker:
+    """
+    Pengepakan online: setiap barang langsung ditempatkan saat tiba, tanpa mengetahui
+    barang berikutnya.
+
+    Kebijakan penempatan:
+        - 'next_fit': hanya satu kontainer terbuka; bila barang tidak muat, kontainer
+          ditutup dan kontainer baru dibuka. O(1) per barang.
+        - 'first_fit': kontainer terbuka paling awal (slot terkecil) yang masih muat,
+          dicari dengan `CapacityTree` dalam O(log n).
+        - 'best_fit': kontainer terbuka dengan sisa kapasitas terkecil yang masih muat,
+          dicari dengan `BestFitIndex` dalam O(log kapasitas); seri diputus ke ID terkecil.
+        - 'harmonic': Harmonic-k. Barang berukuran (C/(j+1), C/j] masuk kelas j dan
+          dikemas tepat j barang per kontainer; barang <= C/k dikemas Next-Fit di
+          kelas k. Paling banyak k kontainer terbuka. O(1) per barang.
+
+    Kontainer yang ditutup tidak pernah menerima barang lagi. Kontainer tersebut
+    diserahkan ke `on_close` dan hanya `keep_closed` kontainer terakhir yang disimpan,
+    sehingga memori untuk kontainer tertutup tetap terbatas berapa pun jumlah barang.
+    Penempatan hanya memeriksa kapasitas; constraint rapuh/inkompatibel hanya
+    diperhitungkan oleh reoptimisasi melalui `config`.
+
+    Args:
+        kapasitas: Kapasitas setiap kontainer.
+        kebijakan: Salah satu dari `KEBIJAKAN_ONLINE`.
+        harmonic_k: Jumlah kelas ukuran untuk kebijakan 'harmonic' (>= 2).
+        max_open_bins: Batas jumlah kontainer terbuka untuk 'first_fit'/'best_fit';
+            bila tercapai, kontainer terbuka yang paling penuh ditutup sebelum
+            kontainer baru dibuka. Default: tanpa batas.
+        on_close: Callback yang dipanggil dengan setiap kontainer yang ditutup.
+        keep_closed: Jumlah kontainer tertutup terakhir yang disimpan di `closed_bins`.
+        reoptimize_every: Jika disetel, kontainer yang masih terbuka dioptimasi ulang
+            dengan Steepest Ascent Hill Climbing setiap sejumlah barang ini
+            (hanya 'first_fit'/'best_fit').
+        reoptimize_iter: Iterasi maksimum setiap reoptimisasi.
+        reoptimize_time_limit: Batas waktu setiap reoptimisasi dalam detik, sehingga
+            latensi per barang tetap terbatas.
+        config: Konfigurasi fungsi objektif untuk reoptimisasi.
+    """
+
+    def __init__(
+        self,
+        kapasitas: int,
+        kebijakan: str = 'first_fit',
+        harmonic_k: int = 4,
+        max_open_bins: Optional[int] = None,
+        on_close: Optional[Callable[[Kontainer], None]] = None,
+        keep_closed: int = 0,
+        reoptimize_every: Optional[int] = None,
+        reoptimize_iter: int = 100,
+        reoptimize_time_limit: Optional[float] = None,
+        config: Optional[ObjectiveConfig] = None
+    ):
+        if kebijakan not in KEBIJAKAN_ONLINE:
+            raise ValueError(f"Kebijakan online '{kebijakan}' tidak dikenal. Pilihan: {KEBIJAKAN_ONLINE}")
+        if kapasitas <= 0:
+            raise ValueError("kapasitas harus lebih besar dari 0.")
+        if harmonic_k < 2:
+            raise ValueError("harmonic_k minimal 2.")
+        if max_open_bins is not None and max_open_bins < 1:
+            raise ValueError("max_open_bins minimal 1.")
+        if reoptimize_every is not None:
+            if kebijakan not in KEBIJAKAN_REOPTIMISASI:
+                raise ValueError(f"Reoptimisasi hanya didukung untuk kebijakan {KEBIJAKAN_REOPTIMISASI}.")
+            if reoptimize_every < 1:
+                raise ValueError("reoptimize_every minimal 1.")
+
+        self.kapasitas = kapasitas
+        self.kebijakan = kebijakan
+        self.harmonic_k = harmonic_k
+        self.max_open_bins = max_open_bins
+        self.on_close = on_close
+        self.closed_bins: Deque[Kontainer] = deque(maxlen=keep_closed)
+        self.reoptimize_every = reoptimize_every
+        self.reoptimize_iter = reoptimize_iter
+        self.reoptimize_time_limit = reoptimize_time_limit
+        self.config = config if config is not None else ObjectiveConfig()
+
+        # Statistik (memori konstan)
+        self.jumlah_barang = 0
+        self.jumlah_ditutup = 0
+        self.muatan_ditutup = 0
+        self.jumlah_reoptimisasi = 0
+
+        self._terbuka: Dict[int, Kontainer] = {}
+        self._id_berikut = 1
+        self._sejak_reoptimisasi = 0
+        # Indeks 'first_fit': slot CapacityTree <-> ID kontainer, slot bebas di min-heap
+        self._pohon = CapacityTree(16, _SLOT_KOSONG)
+        self._slot_ke_id: Dict[int, int] = {}
+        self._id_ke_slot: Dict[int, int] = {}
+        self._slot_bebas: List[int] = list(range(16))
+        # Indeks 'best_fit': kontainer terbuka per sisa kapasitas
+        self._indeks_sisa = BestFitIndex(kapasitas) if kebijakan == 'best_fit' else None
+        # Kontainer terbuka per kelas 'harmonic' dan untuk 'next_fit'
+        self._per_kelas: Dict[int, int] = {}
+
+    @property
+    def open_bins(self) -> List[Kontainer]:
+        # Kontainer yang masih terbuka, sesuai urutan dibuka.
+        return list(self._terbuka.values())
+
+    @property
+    def jumlah_kontainer(self) -> int:
+        # Total kontainer yang dipakai (tertutup + terbuka).
+        return self.jumlah_ditutup + len(self._terbuka)
+
+    def state(self) -> State:
+        # Snapshot kontainer terbuka sebagai State (salinan).
+        return State(kontainer_list=[k.salin() for k in self._terbuka.values()])
+
+    def add(self, barang: Barang) -> int:
+        """
+        Menempatkan satu barang dan mengembalikan ID kontainernya.
+
+        Reoptimisasi berikutnya dapat memindahkan barang ke kontainer terbuka lain;
+        penempatan akhir adalah isi kontainer saat ditutup.
+        """
+        if barang.ukuran > self.kapasitas:
+            raise ValueError(f"Barang '{barang.id}' (ukuran {barang.ukuran}) melebihi kapasitas kontainer {self.kapasitas}.")
+
+        if self.kebijakan == 'next_fit':
+            kontainer_id = self._tempatkan_next_fit(barang, 0)
+        elif self.kebijakan == 'harmonic':
+            kelas = min(self.harmonic_k, self.kapasitas // barang.ukuran)
+            kontainer_id = self._tempatkan_next_fit(barang, kelas)
+            if kelas < self.harmonic_k and len(self._terbuka[kontainer_id].barang_di_dalam) == kelas:
+                self._tutup(kontainer_id)
+        elif self.kebijakan == 'first_fit':
+            slot = self._pohon.cari_pertama(barang.ukuran)
+            kontainer_id = self._slot_ke_id[slot] if slot >= 0 else self._buka()
+            self._tambah_ke(kontainer_id, barang)
+        else:
+            kontainer_id = self._indeks_sisa.cari(barang.ukuran)
+            if kontainer_id is None:
+                kontainer_id = self._buka()
+            self._tambah_ke(kontainer_id, barang)
+
+        self.jumlah_barang += 1
+        if self.reoptimize_every is not None:
+            self._sejak_reoptimisasi += 1
+            if self._sejak_reoptimisasi >= self.reoptimize_every:
+                self.reoptimize()
+        return kontainer_id
+
+    def add_batch(self, barang_list: Iterable[Barang], decreasing: bool = True) -> List[int]:
+        """
+        Menempatkan satu micro-batch barang.
+
+        Args:
+            barang_list: Barang yang tiba bersamaan.
+            decreasing: Tempatkan barang terbesar lebih dulu (seperti FFD di dalam batch).
+
+        Returns:
+            ID kontainer setiap barang, sesuai urutan `barang_list`.
+        """
+        barang_list = list(barang_list)
+        urutan = range(len(barang_list))
+        if decreasing:
+            urutan = sorted(urutan, key=lambda i: barang_list[i].ukuran, reverse=True)
+        hasil = [0] * len(barang_list)
+        for i in urutan:
+            hasil[i] = self.add(barang_list[i])
+        return hasil
+
+    def close_all(self) -> List[Kontainer]:
+        # Menutup semua kontainer terbuka (mis. di akhir shift) dan mengembalikannya.
+        ditutup = list(self._terbuka.values())
+        for kontainer_id in list(self._terbuka):
+            self._tutup(kontainer_id)
+        return ditutup
+
+    def reoptimize(self) -> None:
+        """
+        Mengoptimasi ulang kontainer yang masih terbuka dengan Steepest Ascent Hill
+        Climbing (relokasi/pertukaran barang antar kontainer terbuka). Kontainer yang
+        menjadi kosong dilepas; kontainer tertutup tidak pernah diubah. Kontainer baru
+        yang dibuat oleh local search diberi ID baru yang belum pernah dipakai.
+        """
+        self._sejak_reoptimisasi = 0
+        if len(self._terbuka) < 2:
+            return
+        keadaan = State(kontainer_list=list(self._terbuka.values()))
+        hasil, _ = steepest_ascent_hill_climbing(
+            keadaan, self.config, max_iter=self.reoptimize_iter, time_limit=self.reoptimize_time_limit
+        )
+        self.jumlah_reoptimisasi += 1
+
+        # Bangun ulang indeks dari hasil; kontainer yang dikosongkan dilepas tanpa ditutup
+        baru = {}
+        for kontainer in hasil.kontainer_list:
+            if kontainer.id not in self._terbuka:
+                kontainer.id = self._id_berikut
+                self._id_berikut += 1
+            baru[kontainer.id] = kontainer
+        for kontainer_id in list(self._terbuka):
+            self._lepas_indeks(kontainer_id)
+            if kontainer_id not in baru:
+                self._lepas_slot(kontainer_id)
+        self._terbuka = {}
+        for kontainer_id in sorted(baru):
+            self._terbuka[kontainer_id] = baru[kontainer_id]
+            self._pasang_indeks(baru[kontainer_id])
+            if baru[kontainer_id].sisa_kapasitas == 0:
+                self._tutup(kontainer_id)
+
+    def _tempatkan_next_fit(self, barang: Barang, kelas: int) -> int:
+        # Next-Fit di dalam satu kelas: pakai kontainer terbuka kelas ini bila muat.
+        kontainer_id = self._per_kelas.get(kelas)
+        if kontainer_id is not None and self._terbuka[kontainer_id].sisa_kapasitas < barang.ukuran:
+            self._tutup(kontainer_id)
+            kontainer_id = None
+        if kontainer_id is None:
+            kontainer_id = self._buka()
+            self._per_kelas[kelas] = kontainer_id
+        self._terbuka[kontainer_id].tambah_barang(barang)
+        return kontainer_id
+
+    def _buka(self) -> int:
+        # Membuka kontainer baru; bila batas kontainer terbuka tercapai, yang paling penuh ditutup.
+        if self.max_open_bins is not None and self.kebijakan in KEBIJAKAN_REOPTIMISASI \
+                and len(self._terbuka) >= self.max_open_bins:
+            if self.kebijakan == 'best_fit':
+                terpenuh = self._indeks_sisa.cari(0)
+            else:
+                terpenuh = min(self._terbuka.values(), key=lambda k: (k.sisa_kapasitas, k.id)).id
+            self._tutup(terpenuh)
+        kontainer = Kontainer(id=self._id_berikut, kapasitas=self.kapasitas)
+        self._id_berikut += 1
+        self._terbuka[kontainer.id] = kontainer
+        self._pasang_indeks(kontainer)
+        return kontainer.id
+
+    def _tambah_ke(self, kontainer_id: int, barang: Barang) -> None:
+        # Menambahkan barang ke kontainer 'first_fit'/'best_fit' dan memperbarui indeks.
+        kontainer = self._terbuka[kontainer_id]
+        self._lepas_indeks(kontainer_id)
+        kontainer.tambah_barang(barang)
+        self._pasang_indeks(kontainer)
+        if kontainer.sisa_kapasitas == 0:
+            self._tutup(kontainer_id)
+
+    def _pasang_indeks(self, kontainer: Kontainer) -> None:
+        if self.kebijakan == 'first_fit':
+            slot = self._id_ke_slot.get(kontainer.id)
+            if slot is None:
+                if not self._slot_bebas:
+                    # Gandakan jumlah slot; biaya O(n) ini teramortisasi O(1) per kontainer
+                    lama = len(self._pohon)
+                    self._pohon.perbesar(2 * lama, _SLOT_KOSONG)
+                    self._slot_bebas = list(range(lama, 2 * lama))
+                slot = heapq.heappop(self._slot_bebas)
+                self._id_ke_slot[kontainer.id] = slot
+                self._slot_ke_id[slot] = kontainer.id
+            self._pohon.perbarui(slot, kontainer.sisa_kapasitas)
+        elif self.kebijakan == 'best_fit':
+            self._indeks_sisa.tambah(kontainer.id, kontainer.sisa_kapasitas)
+
+    def _lepas_indeks(self, kontainer_id: int) -> None:
+        # Menghapus kontainer dari indeks sisa kapasitas (slot 'first_fit' tetap dimiliki).
+        if self.kebijakan == 'first_fit':
+            self._pohon.perbarui(self._id_ke_slot[kontainer_id], _SLOT_KOSONG)
+        elif self.kebijakan == 'best_fit':
+            self._indeks_sisa.hapus(kontainer_id)
+
+    def _lepas_slot(self, kontainer_id: int) -> None:
+        # Mengembalikan slot CapacityTree milik kontainer ke daftar slot bebas.
+        if self.kebijakan == 'first_fit':
+            slot = self._id_ke_slot.pop(kontainer_id)
+            del self._slot_ke_id[slot]
+            heapq.heappush(self._slot_bebas, slot)
+
+    def _lepas_kelas(self, kontainer_id: int) -> None:
+        # Melupakan kontainer sebagai kontainer terbuka sebuah kelas ('next_fit'/'harmonic').
+        for kelas, terbuka_id in list(self._per_kelas.items()):
+            if terbuka_id == kontainer_id:
+                del self._per_kelas[kelas]
+
+    def _tutup(self, kontainer_id: int) -> None:
+        # Mengeluarkan kontainer dari himpunan terbuka dan menyerahkannya ke on_close.
+        self._lepas_indeks(kontainer_id)
+        self._lepas_slot(kontainer_id)
+        self._lepas_kelas(kontainer_id)
+        kontainer = self._terbuka.pop(kontainer_id)
+        self.jumlah_ditutup += 1
+        self.muatan_ditutup += kontainer.muatan_saat_ini
+        self.closed_bins.append(kontainer)
+        if self.on_close is not None:
+            self.on_close(kontainer)
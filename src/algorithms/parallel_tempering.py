@@ -0,0 +1,257 @@
+import math
+import multiprocessing as mp
+import queue
+import random
+import traceback
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.core.data_structures import State
+from src.core.objective_function import calculate_objective, compute_components, ObjectiveConfig
+from src.core.lower_bound import reached_lower_bound
+from src.algorithms.utils.moves import random_move
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
+
+# Selang (detik) pemeriksaan apakah replika masih hidup selama menunggu balasan
+_INTERVAL_CEK_REPLIKA = 0.5
+
+
+@dataclass
+class ParallelTemperingStats:
+    """Statistik sebuah run parallel tempering."""
+    temperatures: List[float]
+    acceptance_rates: List[float]  # per tingkat suhu
+    swap_rates: List[float]        # per pasangan tingkat suhu bertetangga (i, i+1)
+    rounds: int
+
+
+def temperature_ladder(suhu_min: float, suhu_max: float, jumlah: int) -> List[float]:
+    """
+    Membuat tangga suhu geometrik dari `suhu_min` hingga `suhu_max`.
+
+    Args:
+        suhu_min: Suhu replika paling dingin.
+        suhu_max: Suhu replika paling panas.
+        jumlah: Jumlah replika.
+
+    Returns:
+        List suhu terurut naik.
+    """
+    if jumlah < 1:
+        raise ValueError("Jumlah replika minimal bernilai 1.")
+    if suhu_min <= 0 or suhu_max < suhu_min:
+        raise ValueError("Suhu harus positif dan suhu_max >= suhu_min.")
+    if jumlah == 1:
+        return [suhu_min]
+    rasio = (suhu_max / suhu_min) ** (1 / (jumlah - 1))
+    return [suhu_min * rasio ** i for i in range(jumlah)]
+
+
+def parallel_tempering(
+    keadaan_awal: State,
+    config: ObjectiveConfig,
+    num_replicas: int = 4,
+    suhu_min: float = 0.01,
+    suhu_max: float = 10.0,
+    max_iter: int = 1000,
+    swap_interval: int = 50,
+    rng: Optional[random.Random] = None,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History, ParallelTemperingStats]:
+    """
+    Menjalankan Simulated Annealing versi replica exchange (parallel tempering).
+
+    Setiap replika adalah rantai Metropolis pada suhu tetap yang berjalan di proses
+    worker tersendiri. Setiap `swap_interval` langkah, replika pada tingkat suhu
+    bertetangga mencoba bertukar dengan kriteria Metropolis
+    min(1, exp((1/T_i - 1/T_j) * (E_i - E_j))). Pertukaran dilakukan dengan menukar
+    suhu antar worker, sehingga state tidak perlu dikirim antar proses.
+
+    Args:
+        keadaan_awal: State awal untuk semua replika.
+        config: Konfigurasi untuk fungsi objektif.
+        num_replicas: Jumlah replika (proses worker).
+        suhu_min: Suhu replika paling dingin.
+        suhu_max: Suhu replika paling panas.
+        max_iter: Jumlah langkah Metropolis untuk setiap replika.
+        swap_interval: Jumlah langkah di antara dua percobaan pertukaran.
+        rng: Generator angka acak induk untuk seed replika dan keputusan pertukaran.
+        lower_bound: Batas bawah jumlah kontainer; semua replika berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor terbaik global (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; diperiksa proses induk sebelum setiap putaran.
+        cancel_token: Token pembatalan kooperatif (opsional).
+
+    Returns:
+        Tuple berisi (keadaan terbaik global, histori skor terbaik global per putaran
+        pertukaran, statistik penerimaan dan pertukaran).
+    """
+    if swap_interval < 1:
+        raise ValueError("swap_interval minimal bernilai 1.")
+    rng = rng or random.Random()
+    budget = Budget(time_limit, cancel_token)
+    suhu = temperature_ladder(suhu_min, suhu_max, num_replicas)
+    seeds = [rng.getrandbits(64) for _ in range(num_replicas)]
+
+    perintah = [mp.Queue() for _ in range(num_replicas)]
+    hasil = mp.Queue()
+    processes = []
+    for index in range(num_replicas):
+        process = mp.Process(
+            target=_replica_worker,
+            args=(index, keadaan_awal, config, seeds[index], perintah[index], hasil),
+            daemon=True,
+        )
+        process.start()
+        processes.append(process)
+
+    # replika_di[t]: indeks replika yang saat ini berada di tingkat suhu t
+    replika_di = list(range(num_replicas))
+    diterima = [0] * num_replicas
+    diusulkan = [0] * num_replicas
+    tukar_diterima = [0] * max(num_replicas - 1, 0)
+    tukar_dicoba = [0] * max(num_replicas - 1, 0)
+
+    skor_awal = calculate_objective(keadaan_awal, config)
+    histori_skor = recorder if recorder is not None else []
+    histori_skor.append(skor_awal)
+    skor_terbaik = skor_awal
+    selesai = False
+    putaran = 0
+    langkah = 0
+    try:
+        while langkah < max_iter and not selesai and not budget.exhausted():
+            jumlah_langkah = min(swap_interval, max_iter - langkah)
+            for tingkat, index in enumerate(replika_di):
+                perintah[index].put(('run', suhu[tingkat], jumlah_langkah))
+            laporan = _kumpulkan(hasil, processes)
+            langkah += jumlah_langkah
+            putaran += 1
+
+            energi = [0.0] * num_replicas
+            for tingkat, index in enumerate(replika_di):
+                skor_saat_ini, terima, usul, skor_terbaik_replika, kontainer_terbaik = laporan[index]
+                energi[tingkat] = skor_saat_ini
+                diterima[tingkat] += terima
+                diusulkan[tingkat] += usul
+                skor_terbaik = min(skor_terbaik, skor_terbaik_replika)
+                if reached_lower_bound(skor_terbaik_replika, kontainer_terbaik, lower_bound):
+                    selesai = True
+            histori_skor.append(skor_terbaik)
+
+            # Pasangan genap dan ganjil dicoba bergantian agar tidak ada replika yang ikut dua pertukaran sekaligus
+            for tingkat in range(putaran % 2, num_replicas - 1, 2):
+                tukar_dicoba[tingkat] += 1
+                eksponen = (1 / suhu[tingkat] - 1 / suhu[tingkat + 1]) * (energi[tingkat] - energi[tingkat + 1])
+                if eksponen >= 0 or rng.random() < math.exp(eksponen):
+                    tukar_diterima[tingkat] += 1
+                    replika_di[tingkat], replika_di[tingkat + 1] = replika_di[tingkat + 1], replika_di[tingkat]
+
+        for index in range(num_replicas):
+            perintah[index].put(('selesai',))
+        terbaik = _kumpulkan(hasil, processes)
+    except BaseException:
+        for process in processes:
+            process.terminate()
+        raise
+    finally:
+        for process in processes:
+            process.join()
+
+    # Seri diputus ke replika dengan indeks terkecil
+    index_terbaik = min(range(num_replicas), key=lambda idx: (terbaik[idx][1], idx))
+    keadaan_terbaik = terbaik[index_terbaik][0]
+
+    stats = ParallelTemperingStats(
+        temperatures=suhu,
+        acceptance_rates=[d / u if u else 0.0 for d, u in zip(diterima, diusulkan)],
+        swap_rates=[d / c if c else 0.0 for d, c in zip(tukar_diterima, tukar_dicoba)],
+        rounds=putaran,
+    )
+    return keadaan_terbaik, histori_skor, stats
+
+
+def _kumpulkan(hasil: mp.Queue, processes: List[mp.Process]) -> list:
+    # Mengambil satu balasan dari setiap replika, diurutkan menurut indeks replika.
+    # Replika yang mati tanpa membalas (crash, di-kill) menimbulkan RuntimeError
+    # alih-alih membuat proses induk menunggu selamanya.
+    balasan = [None] * len(processes)
+    menunggu = set(range(len(processes)))
+    # Replika yang sudah terlihat mati; balasan yang dikirim tepat sebelum keluar
+    # masih diberi satu selang untuk tiba
+    mati = set()
+    while menunggu:
+        try:
+            index, status, payload = hasil.get(timeout=_INTERVAL_CEK_REPLIKA)
+        except queue.Empty:
+            tanpa_balasan = sorted(mati & menunggu)
+            if tanpa_balasan:
+                index = tanpa_balasan[0]
+                raise RuntimeError(
+                    f"Replika {index} berhenti tanpa balasan (exitcode {processes[index].exitcode})."
+                ) from None
+            mati = {idx for idx in menunggu if not processes[idx].is_alive()}
+            continue
+        if status == 'error':
+            raise RuntimeError(f"Replika {index} gagal:\n{payload}")
+        balasan[index] = payload
+        menunggu.discard(index)
+    return balasan
+
+
+def _replica_worker(
+    index: int,
+    keadaan_awal: State,
+    config: ObjectiveConfig,
+    seed: int,
+    perintah: mp.Queue,
+    hasil: mp.Queue
+) -> None:
+    # Proses satu replika: menjalankan rantai Metropolis pada suhu yang dikirim proses induk.
+    try:
+        rng = random.Random(seed)
+        keadaan_saat_ini = keadaan_awal.salin()
+        komponen_saat_ini = compute_components(keadaan_saat_ini, config)
+        skor_saat_ini = komponen_saat_ini.score()
+        # Seperti simulated_annealing, state terbaik baru disalin saat rantai meninggalkannya
+        keadaan_terbaik: Optional[State] = None
+        skor_terbaik = skor_saat_ini
+        kontainer_terbaik = komponen_saat_ini.jumlah_kontainer
+        saat_ini_terbaik = True
+
+        while True:
+            pesan = perintah.get()
+            if pesan[0] == 'selesai':
+                if saat_ini_terbaik:
+                    keadaan_terbaik = keadaan_saat_ini
+                hasil.put((index, 'ok', (keadaan_terbaik, skor_terbaik)))
+                return
+
+            _, suhu, jumlah_langkah = pesan
+            diterima = 0
+            for _ in range(jumlah_langkah):
+                gerakan = random_move(keadaan_saat_ini, rng)
+                if gerakan is None:
+                    continue
+                komponen_tetangga = gerakan.evaluate(keadaan_saat_ini, komponen_saat_ini, config)
+                skor_tetangga = komponen_tetangga.score()
+                delta_e = skor_tetangga - skor_saat_ini
+                if delta_e < 0 or rng.random() < math.exp(-delta_e / suhu):
+                    if saat_ini_terbaik and skor_tetangga >= skor_terbaik:
+                        keadaan_terbaik = keadaan_saat_ini.salin()
+                        saat_ini_terbaik = False
+                    gerakan.apply(keadaan_saat_ini)
+                    komponen_saat_ini = komponen_tetangga
+                    skor_saat_ini = skor_tetangga
+                    diterima += 1
+                    if skor_saat_ini < skor_terbaik:
+                        skor_terbaik = skor_saat_ini
+                        kontainer_terbaik = komponen_saat_ini.jumlah_kontainer
+                        saat_ini_terbaik = True
+
+            hasil.put((index, 'ok', (skor_saat_ini, diterima, jumlah_langkah, skor_terbaik, kontainer_terbaik)))
+    except Exception:
+        hasil.put((index, 'error', traceback.format_exc()))
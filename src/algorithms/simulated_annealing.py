@@ -1,45 +1,97 @@
 
 import math
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.core.data_structures import State
-from src.core.objective_function import calculate_objective, ObjectiveConfig
-from src.algorithms.utils.moves import get_random_neighbor
+from src.core.objective_function import compute_components, ObjectiveConfig
+from src.core.lower_bound import reached_lower_bound
+from src.algorithms.utils.moves import random_move
+from src.algorithms.utils.cooling import CoolingSchedule, GeometricCooling
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
 
 def simulated_annealing(
     keadaan_awal: State,
     suhu_awal: float,
     cooling_rate: float,
     max_iter: int,
-    config: ObjectiveConfig
-) -> Tuple[State, List[float], List[float]]:
+    config: ObjectiveConfig,
+    lower_bound: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    probability_recorder: Optional[HistoryRecorder] = None,
+    schedule: Optional[CoolingSchedule] = None,
+    max_stall_iter: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History, History]:
     
     #     keadaan_awal: State awal untuk memulai pencarian.
     #     suhu_awal: Temperatur awal untuk proses annealing.
     #     cooling_rate: Faktor pengurangan temperatur (e.g., 0.99).
     #     max_iter: Jumlah iterasi maksimum yang akan dijalankan.
     #     config: Konfigurasi untuk fungsi objektif (e.g., penggunaan constraint bonus).
+    #     lower_bound: Batas bawah jumlah kontainer; annealing berhenti begitu batas ini tercapai.
+    #     rng: Generator angka acak (opsional, default modul `random`).
+    #     recorder: Perekam histori skor (opsional, default list biasa).
+    #     probability_recorder: Perekam histori probabilitas penerimaan (default
+    #         `recorder.spawn('prob')` bila recorder diberikan, selain itu list biasa).
+    #     schedule: Jadwal pendinginan (opsional); bila diberikan, suhu_awal dan
+    #         cooling_rate diabaikan. Default pendinginan geometrik.
+    #     max_stall_iter: Hentikan annealing bila skor terbaik tidak membaik selama
+    #         sekian iterasi (opsional).
+    #     time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+    #     cancel_token: Token pembatalan kooperatif (opsional).
     #
+    #     Setiap iterasi memilih satu gerakan acak, menilainya dengan evaluasi delta,
+    #     dan hanya menerapkannya langsung pada state bila diterima.
+    #
+
+    rng = rng if rng is not None else random
+    budget = Budget(time_limit, cancel_token)
 
-    # Salin keadaan awal untuk menghindari modifikasi objek aslinya
+    # Salin keadaan awal; semua gerakan selanjutnya diterapkan langsung pada salinan ini
     keadaan_saat_ini = keadaan_awal.salin()
-    skor_saat_ini = calculate_objective(keadaan_saat_ini, config)
+    komponen_saat_ini = compute_components(keadaan_saat_ini, config)
+    skor_saat_ini = komponen_saat_ini.score()
 
-    # Inisialisasi state terbaik global dengan keadaan awal
-    keadaan_terbaik_global = keadaan_saat_ini
+    # State terbaik hanya disalin ketika pencarian akan meninggalkannya ke skor yang
+    # lebih buruk, sehingga penurunan skor berturut-turut dan gerakan netral (delta 0)
+    # tidak memerlukan salinan sama sekali
+    keadaan_terbaik_global: Optional[State] = None
     skor_terbaik_global = skor_saat_ini
+    kontainer_terbaik_global = komponen_saat_ini.jumlah_kontainer
+    saat_ini_terbaik = True
 
-    histori_skor = [skor_saat_ini]
-    histori_probabilitas = [1.0] # Probabilitas awal adalah 1.0
-    suhu = suhu_awal
+    if probability_recorder is None and recorder is not None:
+        probability_recorder = recorder.spawn('prob')
+    histori_skor = recorder if recorder is not None else []
+    histori_probabilitas = probability_recorder if probability_recorder is not None else []
+    histori_skor.append(skor_saat_ini)
+    histori_probabilitas.append(1.0) # Probabilitas awal adalah 1.0
+    jadwal = schedule if schedule is not None else GeometricCooling(suhu_awal, cooling_rate)
+    suhu = jadwal.suhu
+    iterasi_tanpa_perbaikan = 0
 
     for _ in range(max_iter):
-        # Hasilkan tetangga secara acak
-        keadaan_tetangga = get_random_neighbor(keadaan_saat_ini)
+        # Hentikan jika solusi terbaik sudah terbukti optimal
+        if reached_lower_bound(skor_terbaik_global, kontainer_terbaik_global, lower_bound):
+            break
+        # Hentikan jika pencarian sudah stagnan terlalu lama
+        if max_stall_iter is not None and iterasi_tanpa_perbaikan >= max_stall_iter:
+            break
+        # Hentikan jika batas waktu habis atau run dibatalkan
+        if budget.exhausted():
+            break
 
-        # Hitung skor tetangga
-        skor_tetangga = calculate_objective(keadaan_tetangga, config)
+        # Pilih gerakan acak dan nilai hasilnya secara inkremental tanpa mengubah state
+        gerakan = random_move(keadaan_saat_ini, rng)
+        if gerakan is None:
+            komponen_tetangga = komponen_saat_ini
+        else:
+            komponen_tetangga = gerakan.evaluate(keadaan_saat_ini, komponen_saat_ini, config)
+        skor_tetangga = komponen_tetangga.score()
 
         # Hitung perbedaan energi (skor)
         delta_e = skor_tetangga - skor_saat_ini
@@ -47,26 +99,44 @@ def simulated_annealing(
         # Tentukan apakah akan menerima keadaan baru
         if delta_e < 0:
             probabilitas_penerimaan = 1.0
-            keadaan_saat_ini = keadaan_tetangga
-            skor_saat_ini = skor_tetangga
+            terima = True
         else:
             # Jika tetangga lebih buruk, terima dengan probabilitas tertentu
             # Ini adalah inti dari SA untuk keluar dari optimum lokal
-            probabilitas_penerimaan = math.exp(-delta_e / suhu)
-            if random.random() < probabilitas_penerimaan:
-                keadaan_saat_ini = keadaan_tetangga
-                skor_saat_ini = skor_tetangga
+            if suhu > 0:
+                probabilitas_penerimaan = math.exp(-delta_e / suhu)
+            else:
+                probabilitas_penerimaan = 1.0 if delta_e == 0 else 0.0
+            terima = rng.random() < probabilitas_penerimaan
+
+        # Gerakan hanya diterapkan bila diterima, jadi penolakan tidak perlu di-undo
+        membaik = False
+        if terima and gerakan is not None:
+            if saat_ini_terbaik and skor_tetangga > skor_terbaik_global:
+                keadaan_terbaik_global = keadaan_saat_ini.salin()
+                saat_ini_terbaik = False
+            gerakan.apply(keadaan_saat_ini)
+            komponen_saat_ini = komponen_tetangga
+            skor_saat_ini = skor_tetangga
 
-        # Perbarui solusi terbaik global jika ditemukan yang lebih baik
-        if skor_saat_ini < skor_terbaik_global:
-            keadaan_terbaik_global = keadaan_saat_ini
-            skor_terbaik_global = skor_saat_ini
+            # Perbarui solusi terbaik global jika ditemukan yang lebih baik
+            if skor_saat_ini < skor_terbaik_global:
+                skor_terbaik_global = skor_saat_ini
+                kontainer_terbaik_global = komponen_saat_ini.jumlah_kontainer
+                saat_ini_terbaik = True
+                membaik = True
+            elif saat_ini_terbaik:
+                # Gerakan netral dari state terbaik: state saat ini tetap terbaik
+                kontainer_terbaik_global = komponen_saat_ini.jumlah_kontainer
+        iterasi_tanpa_perbaikan = 0 if membaik else iterasi_tanpa_perbaikan + 1
 
         # Simpan data saat ini untuk analisis
         histori_skor.append(skor_saat_ini)
         histori_probabilitas.append(probabilitas_penerimaan)
 
-        # Turunkan suhu
-        suhu *= cooling_rate
+        # Perbarui suhu sesuai jadwal pendinginan
+        suhu = jadwal.update(delta_e, terima, membaik)
 
+    if saat_ini_terbaik:
+        keadaan_terbaik_global = keadaan_saat_ini
     return keadaan_terbaik_global, histori_skor, histori_probabilitas
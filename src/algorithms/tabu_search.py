@@ -0,0 +1,183 @@
+import random
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from src.core.data_structures import State
+from src.core.objective_function import ObjectiveConfig, compute_components
+from src.core.lower_bound import reached_lower_bound
+from src.algorithms.utils.moves import Move, RelocateMove, iter_all_moves, random_move
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import Budget, CancelToken
+
+
+def tabu_attributes(move: Move) -> Tuple[Tuple[Hashable, Optional[int]], ...]:
+    """
+    Atribut (id barang, id kontainer tujuan) yang dihasilkan sebuah gerakan.
+
+    Gerakan dianggap tabu jika salah satu atributnya masih tabu, yaitu barang yang
+    baru saja dikeluarkan dari sebuah kontainer hendak dimasukkan kembali ke sana.
+    Pemindahan ke kontainer baru memakai atribut (id barang, None), sehingga barang
+    yang baru saja keluar dari kontainer yang hanya berisi dirinya tidak langsung
+    dipisahkan lagi ke kontainer sendiri.
+    """
+    if isinstance(move, RelocateMove):
+        if move.tujuan is None:
+            return ((move.barang.id, None),)
+        return ((move.barang.id, move.tujuan.id),)
+    return ((move.barang1.id, move.kontainer2.id), (move.barang2.id, move.kontainer1.id))
+
+
+def _is_noop(move: Move) -> bool:
+    # Gerakan yang tidak mengubah solusi: relokasi ke kontainer asal, barang satu-satunya
+    # di kontainernya dipindahkan ke kontainer baru, atau pertukaran dua barang yang
+    # tidak dapat dibedakan oleh fungsi objektif (ukuran, tipe, dan sifat rapuh sama).
+    if not isinstance(move, RelocateMove):
+        b1, b2 = move.barang1, move.barang2
+        return (b1.ukuran, b1.tipe, b1.rapuh) == (b2.ukuran, b2.tipe, b2.rapuh)
+    if move.tujuan is None:
+        return len(move.asal.barang_di_dalam) == 1
+    return move.tujuan is move.asal
+
+
+def _reverse_attributes(move: Move) -> Tuple[Tuple[Hashable, Optional[int]], ...]:
+    # Atribut yang dilarang setelah gerakan diterapkan: barang kembali ke kontainer asalnya.
+    # Kontainer asal yang hanya berisi barang itu akan hilang, sehingga yang dilarang
+    # adalah kembali ke kontainer sendiri (kontainer baru).
+    if isinstance(move, RelocateMove):
+        if len(move.asal.barang_di_dalam) == 1:
+            return ((move.barang.id, None),)
+        return ((move.barang.id, move.asal.id),)
+    return ((move.barang1.id, move.kontainer1.id), (move.barang2.id, move.kontainer2.id))
+
+
+def tabu_search(
+    initial_state: State,
+    config: ObjectiveConfig,
+    max_iter: int,
+    tenure: int = 10,
+    candidate_size: Optional[int] = None,
+    max_stall_iter: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    lower_bound: Optional[int] = None,
+    recorder: Optional[HistoryRecorder] = None,
+    time_limit: Optional[float] = None,
+    cancel_token: Optional[CancelToken] = None
+) -> Tuple[State, History]:
+    """
+    Mengimplementasikan Tabu Search di atas lingkungan relokasi/pertukaran.
+
+    Pada setiap iterasi, gerakan non-tabu terbaik diterapkan meskipun memperburuk skor.
+    Setelah barang dipindahkan keluar dari sebuah kontainer, pasangan (barang, kontainer
+    asal) menjadi tabu selama `tenure` iterasi sehingga pencarian tidak langsung kembali
+    ke solusi sebelumnya. Daftar tabu disimpan dalam dict atribut -> iterasi kedaluwarsa,
+    sehingga pengecekan tabu O(1). Kriteria aspirasi: gerakan tabu tetap boleh diambil
+    bila menghasilkan skor lebih baik dari skor terbaik global. Jika semua gerakan tabu
+    dan tidak ada yang memenuhi aspirasi, gerakan yang paling cepat kedaluwarsa dipilih.
+    Gerakan yang tidak mengubah solusi tidak pernah menjadi kandidat, sehingga di
+    optimum lokal pencarian benar-benar berpindah ke tetangga lain. ID kontainer yang
+    kosong dipakai ulang oleh kontainer baru, sehingga atribut tabu milik kontainer yang
+    hilang dibuang saat itu juga.
+
+    Args:
+        initial_state: Keadaan awal untuk memulai pencarian.
+        config: Konfigurasi untuk fungsi objektif.
+        max_iter: Jumlah iterasi maksimum.
+        tenure: Jumlah iterasi sebuah atribut tetap tabu.
+        candidate_size: Jika diberikan, hanya sejumlah gerakan acak ini yang dinilai setiap
+            iterasi (daftar kandidat untuk instance besar); default seluruh lingkungan.
+        max_stall_iter: Hentikan pencarian bila skor terbaik tidak membaik selama sekian iterasi.
+        rng: Generator angka acak untuk daftar kandidat (opsional, default modul `random`).
+        lower_bound: Batas bawah jumlah kontainer; pencarian berhenti begitu batas ini tercapai.
+        recorder: Perekam histori skor (opsional, default list biasa).
+        time_limit: Batas waktu dalam detik; bila habis, state terbaik sejauh ini dikembalikan.
+        cancel_token: Token pembatalan kooperatif (opsional).
+
+    Returns:
+        Tuple berisi (keadaan terbaik yang ditemukan, histori skor keadaan saat ini).
+    """
+    if tenure < 0:
+        raise ValueError("tenure tidak boleh negatif.")
+    if candidate_size is not None and candidate_size < 1:
+        raise ValueError("candidate_size minimal bernilai 1.")
+    rng = rng if rng is not None else random
+    budget = Budget(time_limit, cancel_token)
+
+    current_state = initial_state.salin()
+    current_components = compute_components(current_state, config)
+    current_score = current_components.score()
+    score_history = recorder if recorder is not None else []
+    score_history.append(current_score)
+
+    # Seperti simulated_annealing, state terbaik baru disalin saat pencarian meninggalkannya
+    best_state: Optional[State] = None
+    best_score = current_score
+    best_containers = current_components.jumlah_kontainer
+    current_is_best = True
+    stall = 0
+
+    # Atribut tabu -> iterasi terakhir atribut tersebut masih tabu
+    tabu: Dict[Tuple[Hashable, Optional[int]], int] = {}
+
+    for iteration in range(max_iter):
+        if reached_lower_bound(best_score, best_containers, lower_bound):
+            break
+        if max_stall_iter is not None and stall >= max_stall_iter:
+            break
+        if budget.exhausted():
+            break
+
+        if candidate_size is None:
+            moves: Iterable[Move] = iter_all_moves(current_state)
+        else:
+            moves = filter(None, (random_move(current_state, rng) for _ in range(candidate_size)))
+
+        chosen = None
+        chosen_score = float('inf')
+        # Cadangan bila semua gerakan tabu: (iterasi kedaluwarsa, skor, gerakan, komponen)
+        fallback = None
+        for move in moves:
+            if _is_noop(move):
+                continue
+            neighbor_components = move.evaluate(current_state, current_components, config)
+            neighbor_score = neighbor_components.score()
+            expiry = max((tabu.get(attr, -1) for attr in tabu_attributes(move)), default=-1)
+            if expiry < iteration or neighbor_score < best_score:
+                if neighbor_score < chosen_score:
+                    chosen, chosen_components, chosen_score = move, neighbor_components, neighbor_score
+            elif chosen is None and (fallback is None or (expiry, neighbor_score) < fallback[:2]):
+                fallback = (expiry, neighbor_score, move, neighbor_components)
+
+        if chosen is None:
+            if fallback is None:
+                break
+            _, chosen_score, chosen, chosen_components = fallback
+
+        if current_is_best and chosen_score >= best_score:
+            best_state = current_state.salin()
+            current_is_best = False
+        for attr in _reverse_attributes(chosen):
+            tabu[attr] = iteration + tenure
+        chosen.apply(current_state)
+        if isinstance(chosen, RelocateMove) and not chosen.asal.barang_di_dalam:
+            # ID kontainer yang hilang dipakai ulang oleh kontainer baru berikutnya;
+            # atribut lamanya dibuang agar tidak diwarisi kontainer lain
+            hilang = chosen.asal.id
+            tabu = {attr: expiry for attr, expiry in tabu.items() if attr[1] != hilang}
+        current_components = chosen_components
+        current_score = chosen_score
+        score_history.append(current_score)
+
+        if current_score < best_score:
+            best_score = current_score
+            best_containers = current_components.jumlah_kontainer
+            current_is_best = True
+            stall = 0
+        else:
+            stall += 1
+
+        # Buang atribut kedaluwarsa agar ukuran dict tetap sebanding dengan tenure
+        if len(tabu) > 4 * tenure + 64:
+            tabu = {attr: expiry for attr, expiry in tabu.items() if expiry >= iteration}
+
+    if current_is_best:
+        best_state = current_state
+    return best_state, score_history
@@ -0,0 +1,278 @@
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.core.data_structures import State
+from src.core.objective_function import (
+    FRAGILE_PENALTY,
+    INCOMPATIBLE_PENALTY,
+    OVERFILL_PENALTY_MULTIPLIER,
+    ObjectiveConfig,
+    compute_components,
+)
+from src.algorithms.utils.moves import random_move
+
+# Jadwal pendinginan yang dapat dipilih dari CLI
+JADWAL_PENDINGINAN = ('geometric', 'lundy_mees', 'adaptive', 'reheat')
+
+# Delta sebesar ini atau lebih berasal dari penalti constraint, bukan dari jumlah
+# kontainer atau kepadatan, sehingga tidak dipakai untuk kalibrasi suhu
+BATAS_DELTA_PENALTI = min(OVERFILL_PENALTY_MULTIPLIER, FRAGILE_PENALTY, INCOMPATIBLE_PENALTY)
+
+
+class CoolingSchedule(ABC):
+    """
+    Antarmuka jadwal pendinginan Simulated Annealing.
+
+    `simulated_annealing` membaca `suhu` sebelum setiap iterasi, lalu memanggil
+    `update` dengan hasil iterasi tersebut sehingga jadwal adaptif dapat bereaksi
+    terhadap laju penerimaan atau stagnasi.
+    """
+
+    def __init__(self, suhu_awal: float):
+        if suhu_awal <= 0:
+            raise ValueError("suhu_awal harus positif.")
+        self.suhu_awal = suhu_awal
+        self.suhu = suhu_awal
+
+    @abstractmethod
+    def update(self, delta: float, diterima: bool, membaik: bool) -> float:
+        """
+        Memperbarui suhu setelah satu iterasi.
+
+        Args:
+            delta: Perubahan skor gerakan yang diusulkan (positif berarti memburuk).
+            diterima: Gerakan diterima.
+            membaik: Gerakan menghasilkan skor terbaik global yang baru.
+
+        Returns:
+            Suhu untuk iterasi berikutnya.
+        """
+
+
+class GeometricCooling(CoolingSchedule):
+    # T_{k+1} = alpha * T_k (jadwal bawaan SA).
+
+    def __init__(self, suhu_awal: float, cooling_rate: float):
+        super().__init__(suhu_awal)
+        self.cooling_rate = cooling_rate
+
+    def update(self, delta: float, diterima: bool, membaik: bool) -> float:
+        self.suhu *= self.cooling_rate
+        return self.suhu
+
+
+class LundyMeesCooling(CoolingSchedule):
+    # T_{k+1} = T_k / (1 + beta * T_k): turun cepat saat panas, sangat lambat saat dingin.
+
+    def __init__(self, suhu_awal: float, beta: float):
+        super().__init__(suhu_awal)
+        if beta <= 0:
+            raise ValueError("beta harus positif.")
+        self.beta = beta
+
+    @classmethod
+    def dari_suhu_akhir(cls, suhu_awal: float, suhu_akhir: float, max_iter: int) -> 'LundyMeesCooling':
+        # Memilih beta sehingga suhu mencapai suhu_akhir tepat setelah max_iter iterasi.
+        beta = (suhu_awal - suhu_akhir) / (max(max_iter, 1) * suhu_awal * suhu_akhir)
+        return cls(suhu_awal, beta)
+
+    def update(self, delta: float, diterima: bool, membaik: bool) -> float:
+        self.suhu = self.suhu / (1 + self.beta * self.suhu)
+        return self.suhu
+
+
+class AdaptiveAcceptanceCooling(CoolingSchedule):
+    """
+    Mengatur suhu dengan umpan balik laju penerimaan gerakan yang memperburuk skor.
+
+    Target laju penerimaan turun linear dari `target_awal` ke `target_akhir` selama
+    `max_iter` iterasi. Setiap `window` gerakan naik, suhu dikali `1 + penyesuaian`
+    bila laju penerimaan di bawah target, atau dibagi bila di atas target. Gerakan
+    dengan delta berskala penalti tidak dihitung karena praktis tidak pernah diterima.
+    """
+
+    def __init__(
+        self,
+        suhu_awal: float,
+        max_iter: int,
+        target_awal: float = 0.5,
+        target_akhir: float = 0.01,
+        window: int = 100,
+        penyesuaian: float = 0.1
+    ):
+        super().__init__(suhu_awal)
+        self.max_iter = max(max_iter, 1)
+        self.target_awal = target_awal
+        self.target_akhir = target_akhir
+        self.window = window
+        self.penyesuaian = penyesuaian
+        self._iterasi = 0
+        self._naik = 0
+        self._naik_diterima = 0
+
+    @property
+    def target(self) -> float:
+        progres = min(self._iterasi / self.max_iter, 1.0)
+        return self.target_awal + (self.target_akhir - self.target_awal) * progres
+
+    def update(self, delta: float, diterima: bool, membaik: bool) -> float:
+        self._iterasi += 1
+        if 0 < delta < BATAS_DELTA_PENALTI:
+            self._naik += 1
+            self._naik_diterima += diterima
+        if self._naik >= self.window:
+            laju = self._naik_diterima / self._naik
+            if laju < self.target:
+                self.suhu *= 1 + self.penyesuaian
+            else:
+                self.suhu /= 1 + self.penyesuaian
+            self._naik = 0
+            self._naik_diterima = 0
+        return self.suhu
+
+
+class ReheatingCooling(CoolingSchedule):
+    """
+    Membungkus jadwal lain dan memanaskan ulang ketika pencarian stagnan.
+
+    Jika skor terbaik global tidak membaik selama `stall_iter` iterasi, suhu jadwal
+    dalam dinaikkan ke `rasio_panas * suhu_awal`.
+    """
+
+    def __init__(self, jadwal: CoolingSchedule, stall_iter: int, rasio_panas: float = 0.5):
+        super().__init__(jadwal.suhu_awal)
+        if stall_iter < 1:
+            raise ValueError("stall_iter minimal bernilai 1.")
+        self.jadwal = jadwal
+        self.stall_iter = stall_iter
+        self.rasio_panas = rasio_panas
+        self.jumlah_pemanasan = 0
+        self._tanpa_perbaikan = 0
+
+    def update(self, delta: float, diterima: bool, membaik: bool) -> float:
+        self.suhu = self.jadwal.update(delta, diterima, membaik)
+        self._tanpa_perbaikan = 0 if membaik else self._tanpa_perbaikan + 1
+        if self._tanpa_perbaikan >= self.stall_iter:
+            self.jadwal.suhu = max(self.jadwal.suhu, self.rasio_panas * self.suhu_awal)
+            self.suhu = self.jadwal.suhu
+            self.jumlah_pemanasan += 1
+            self._tanpa_perbaikan = 0
+        return self.suhu
+
+
+def create_schedule(
+    nama: str,
+    suhu_awal: float,
+    cooling_rate: float,
+    max_iter: int,
+    suhu_akhir: Optional[float] = None,
+    target_acceptance: float = 0.5,
+    reheat_after: int = 1000
+) -> CoolingSchedule:
+    """
+    Membuat jadwal pendinginan berdasarkan nama dari CLI.
+
+    Args:
+        nama: Salah satu dari 'geometric', 'lundy_mees', 'adaptive', 'reheat'.
+        suhu_awal: Suhu awal.
+        cooling_rate: Faktor geometrik (dipakai 'geometric' dan 'reheat').
+        max_iter: Jumlah iterasi maksimum run.
+        suhu_akhir: Suhu akhir untuk 'lundy_mees' (default suhu_awal * 1e-4).
+        target_acceptance: Target laju penerimaan awal untuk 'adaptive'.
+        reheat_after: Jumlah iterasi tanpa perbaikan sebelum pemanasan ulang ('reheat').
+
+    Returns:
+        Instance CoolingSchedule baru.
+    """
+    if nama == 'geometric':
+        return GeometricCooling(suhu_awal, cooling_rate)
+    if nama == 'lundy_mees':
+        return LundyMeesCooling.dari_suhu_akhir(suhu_awal, suhu_akhir or suhu_awal * 1e-4, max_iter)
+    if nama == 'adaptive':
+        return AdaptiveAcceptanceCooling(suhu_awal, max_iter, target_awal=target_acceptance)
+    if nama == 'reheat':
+        return ReheatingCooling(GeometricCooling(suhu_awal, cooling_rate), reheat_after)
+    raise ValueError(f"Jadwal pendinginan '{nama}' tidak dikenal. Pilihan: {JADWAL_PENDINGINAN}")
+
+
+def sample_uphill_deltas(
+    state: State,
+    config: ObjectiveConfig,
+    sample_size: int = 500,
+    rng=random
+) -> List[float]:
+    """
+    Mengambil sampel delta positif dari gerakan acak di sekitar `state`.
+
+    Gerakan yang menghasilkan kelebihan muatan atau pelanggaran constraint baru
+    diabaikan: deltanya berskala penalti (>= BATAS_DELTA_PENALTI) dan akan membuat
+    suhu hasil kalibrasi terlalu tinggi untuk membedakan solusi yang valid.
+
+    Args:
+        state: State acuan (tidak diubah).
+        config: Konfigurasi fungsi objektif.
+        sample_size: Jumlah gerakan acak yang dinilai.
+        rng: Sumber angka acak.
+
+    Returns:
+        List delta skor positif.
+    """
+    komponen = compute_components(state, config)
+    skor = komponen.score()
+    deltas: List[float] = []
+    for _ in range(sample_size):
+        gerakan = random_move(state, rng)
+        if gerakan is None:
+            break
+        hasil = gerakan.evaluate(state, komponen, config)
+        delta = hasil.score() - skor
+        if 0 < delta < BATAS_DELTA_PENALTI:
+            deltas.append(delta)
+    return deltas
+
+
+def calibrate_initial_temperature(
+    state: State,
+    config: ObjectiveConfig,
+    target_acceptance: float = 0.8,
+    sample_size: int = 500,
+    rng=random,
+    fallback: float = 1.0
+) -> float:
+    """
+    Memilih suhu awal yang menghasilkan laju penerimaan gerakan naik sebesar target.
+
+    Mengikuti Ben-Ameur (2004): untuk sampel delta positif d_i, dicari T sehingga
+    rata-rata exp(-d_i / T) sama dengan `target_acceptance`. Fungsi tersebut
+    monoton naik terhadap T, sehingga T dicari dengan bisection pada skala log.
+
+    Args:
+        state: State awal SA.
+        config: Konfigurasi fungsi objektif.
+        target_acceptance: Laju penerimaan gerakan naik yang diinginkan (0 < x < 1).
+        sample_size: Jumlah gerakan acak yang dinilai.
+        rng: Sumber angka acak.
+        fallback: Suhu yang dipakai bila tidak ada gerakan naik yang valid.
+
+    Returns:
+        Suhu awal hasil kalibrasi.
+    """
+    if not 0 < target_acceptance < 1:
+        raise ValueError("target_acceptance harus di antara 0 dan 1.")
+    deltas = sample_uphill_deltas(state, config, sample_size, rng)
+    if not deltas:
+        return fallback
+
+    def laju(suhu: float) -> float:
+        return sum(math.exp(-d / suhu) for d in deltas) / len(deltas)
+
+    rendah, tinggi = math.log(min(deltas) * 1e-3), math.log(max(deltas) * 1e3)
+    for _ in range(60):
+        tengah = (rendah + tinggi) / 2
+        if laju(math.exp(tengah)) < target_acceptance:
+            rendah = tengah
+        else:
+            tinggi = tengah
+    return math.exp(tinggi)
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Callable
+
+import numpy as np
+
+# Ukuran default cache fitness GA (jumlah genom unik yang diingat)
+UKURAN_CACHE_DEFAULT = 4096
+
+
+def fingerprint(genome: np.ndarray) -> bytes:
+    """
+    Sidik jari 128-bit dari sebuah genom kanonik.
+
+    Genom dari `GenomeSpace` selalu dilabeli ulang sesuai urutan kemunculan pertama,
+    sehingga dua individu dengan pembagian barang yang sama (apa pun urutan dan ID
+    kontainernya) memiliki array yang identik dan sidik jari yang sama.
+    """
+    return blake2b(np.ascontiguousarray(genome).tobytes(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """
+    Cache LRU skor fitness GA yang dikunci dengan sidik jari genom kanonik.
+
+    Individu elit dan anak yang tidak mengalami crossover/mutasi identik dengan
+    individu yang sudah dinilai, sehingga skornya diambil dari cache alih-alih
+    dihitung ulang. Penghitung `hits` dan `misses` dapat dibaca setelah GA selesai.
+
+    Args:
+        maxsize: Jumlah maksimum genom yang diingat; entri yang paling lama tidak
+            dipakai dibuang lebih dulu. Nilai 0 menonaktifkan cache.
+    """
+
+    def __init__(self, maxsize: int = UKURAN_CACHE_DEFAULT):
+        if maxsize < 0:
+            raise ValueError("maxsize cache fitness tidak boleh negatif.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[bytes, float]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_or_compute(self, genome: np.ndarray, hitung: Callable[[np.ndarray], float]) -> float:
+        """
+        Mengambil skor genom dari cache, atau menghitungnya dengan `hitung` lalu menyimpannya.
+
+        Args:
+            genome: Genom kanonik yang dinilai.
+            hitung: Fungsi penilaian yang dipanggil saat cache miss.
+
+        Returns:
+            Skor fitness genom.
+        """
+        if self.maxsize == 0:
+            self.misses += 1
+            return hitung(genome)
+        kunci = fingerprint(genome)
+        skor = self._data.get(kunci)
+        if skor is not None:
+            self._data.move_to_end(kunci)
+            self.hits += 1
+            return skor
+        self.misses += 1
+        skor = hitung(genome)
+        self._data[kunci] = skor
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return skor
@@ -0,0 +1,244 @@
+import random
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.core.data_structures import Barang, Kontainer, State
+from src.core.objective_function import ObjectiveConfig, ScoreComponents
+from src.core.packing import pack_items
+
+# Label genom untuk barang yang tidak dialokasikan (barang yang lebih besar dari kapasitas)
+TANPA_KONTAINER = -1
+
+
+class GenomeSpace:
+    """
+    Encoding kromosom GA sebagai array integer: indeks barang -> label kontainer.
+
+    Data barang (ukuran, status rapuh, tipe) disimpan sekali sebagai array NumPy dan
+    dibagi oleh seluruh populasi, sehingga satu individu hanya berupa `np.ndarray`
+    int32 sepanjang jumlah barang. Setelah `repair`, label bersifat kanonik: kontainer
+    diberi label 0..k-1 sesuai urutan kemunculan barang pertamanya, sehingga dua
+    genom dengan partisi yang sama selalu identik. Barang yang lebih besar dari
+    kapasitas selalu berlabel `TANPA_KONTAINER`, sama seperti state awal.
+
+    Args:
+        items: Seluruh barang; urutannya menentukan indeks gen.
+        kapasitas: Kapasitas setiap kontainer.
+        config: Konfigurasi fungsi objektif (untuk penalti constraint).
+    """
+
+    def __init__(self, items: Sequence[Barang], kapasitas: int, config: ObjectiveConfig):
+        self.items: Tuple[Barang, ...] = tuple(items)
+        self.kapasitas = kapasitas
+        self.config = config
+        self.indeks = {barang.id: idx for idx, barang in enumerate(self.items)}
+        self.ukuran = np.fromiter((b.ukuran for b in self.items), dtype=np.int64, count=len(self.items))
+        self.terlalu_besar = self.ukuran > kapasitas
+        self.indeks_muat = np.flatnonzero(~self.terlalu_besar)
+        self.kunci = np.fromiter((b._kunci for b in self.items), dtype=np.uint64, count=len(self.items))
+        if config.use_fragile_constraint:
+            rapuh = np.fromiter((b.rapuh for b in self.items), dtype=bool, count=len(self.items))
+            self.rapuh = rapuh.astype(np.int64)
+            self.ukuran_non_rapuh = np.where(rapuh, 0, self.ukuran)
+        if config.use_incompatible_constraint:
+            self.pasangan_tipe = [
+                tuple(np.fromiter((b.tipe == tipe for b in self.items), dtype=np.int64, count=len(self.items))
+                      for tipe in pasangan)
+                for pasangan in config.incompatible_pairs
+            ]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # Konversi
+
+    def encode(self, state: State) -> np.ndarray:
+        # Mengubah State menjadi genom kanonik (tanpa perbaikan; kelebihan muatan dipertahankan).
+        genome = np.full(len(self.items), TANPA_KONTAINER, dtype=np.int32)
+        label = 0
+        for kontainer in state.kontainer_list:
+            if not kontainer.barang_di_dalam:
+                continue
+            for barang in kontainer.barang_di_dalam:
+                genome[self.indeks[barang.id]] = label
+            label += 1
+        return self.canonical(genome)
+
+    def decode(self, genome: np.ndarray) -> State:
+        """
+        Mengubah genom menjadi State untuk hasil akhir dan pelaporan.
+
+        Kontainer diurutkan menurut label dan diberi ID 0..k-1; barang di dalamnya
+        mengikuti urutan indeks barang.
+        """
+        kontainer_list: List[Kontainer] = []
+        ditempatkan = np.flatnonzero(genome >= 0)
+        urutan = ditempatkan[np.argsort(genome[ditempatkan], kind='stable')]
+        label_terurut = genome[urutan]
+        batas = np.flatnonzero(np.diff(label_terurut)) + 1
+        for kelompok in np.split(urutan, batas) if len(urutan) else []:
+            kontainer_list.append(Kontainer(
+                id=len(kontainer_list),
+                kapasitas=self.kapasitas,
+                barang_di_dalam=[self.items[i] for i in kelompok],
+            ))
+        belum_dialokasi = [self.items[i] for i in np.flatnonzero(genome < 0)]
+        return State(kontainer_list=kontainer_list, barang_belum_dialokasi=belum_dialokasi)
+
+    # Penilaian
+
+    def components(self, genome: np.ndarray) -> ScoreComponents:
+        """
+        Menghitung ScoreComponents langsung dari genom dengan `np.bincount`.
+
+        Hasilnya identik dengan `compute_components(self.decode(genome), config)`.
+        """
+        ditempatkan = genome >= 0
+        label = genome[ditempatkan]
+        komponen = ScoreComponents()
+        if not len(label):
+            return komponen
+        isi = np.bincount(label) > 0
+        muatan = np.bincount(label, weights=self.ukuran[ditempatkan]).astype(np.int64)[isi]
+        komponen.jumlah_kontainer = len(muatan)
+        komponen.kepadatan = {self.kapasitas: (len(muatan), int(np.dot(muatan, muatan)))}
+        komponen.kelebihan_muatan = int(np.maximum(muatan - self.kapasitas, 0).sum())
+
+        if self.config.use_fragile_constraint:
+            jumlah_rapuh = np.bincount(label, weights=self.rapuh[ditempatkan])[isi]
+            muatan_non_rapuh = np.bincount(label, weights=self.ukuran_non_rapuh[ditempatkan])[isi]
+            komponen.pelanggaran_rapuh = int(np.count_nonzero(
+                (jumlah_rapuh > 0) & (muatan_non_rapuh > self.config.fragile_threshold)
+            ))
+        if self.config.use_incompatible_constraint:
+            for tipe_x, tipe_y in self.pasangan_tipe:
+                ada_x = np.bincount(label, weights=tipe_x[ditempatkan])[isi] > 0
+                ada_y = np.bincount(label, weights=tipe_y[ditempatkan])[isi] > 0
+                komponen.pelanggaran_inkompatibel += int(np.count_nonzero(ada_x & ada_y))
+        return komponen
+
+    def score(self, genome: np.ndarray) -> float:
+        return self.components(genome).score()
+
+    def kode_hash(self, genome: np.ndarray) -> int:
+        """
+        Hash Zobrist genom, identik dengan `self.decode(genome).kode_hash`.
+
+        Kunci barang dijumlahkan per label (aritmetika uint64 yang membungkus mod 2^64),
+        dicampur dengan splitmix64, lalu dijumlahkan untuk seluruh kontainer.
+        """
+        ditempatkan = genome >= 0
+        label = genome[ditempatkan]
+        if not len(label):
+            return 0
+        nilai = np.zeros(int(label.max()) + 1, dtype=np.uint64)
+        np.add.at(nilai, label, self.kunci[ditempatkan])
+        nilai = (nilai ^ (nilai >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        nilai = (nilai ^ (nilai >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        nilai = nilai ^ (nilai >> np.uint64(31))
+        return int(nilai.sum(dtype=np.uint64))
+
+    # Operator
+
+    def random_genome(self, rng: random.Random) -> np.ndarray:
+        """
+        Membuat genom acak dengan distribusi yang sama seperti `generate_random_state`.
+
+        Barang yang muat ditempatkan dalam urutan acak ke kontainer acak yang masih
+        muat (atau kontainer baru bila tidak ada), tetapi pengecekan muatan dilakukan
+        pada array sehingga tidak perlu mengacak daftar kontainer untuk setiap barang.
+        """
+        genome = np.full(len(self.items), TANPA_KONTAINER, dtype=np.int32)
+        muatan = np.zeros(len(self.indeks_muat), dtype=np.int64)
+        jumlah = 0
+        for i in rng.sample(self.indeks_muat.tolist(), len(self.indeks_muat)):
+            ukuran = self.ukuran[i]
+            kandidat = np.flatnonzero(muatan[:jumlah] + ukuran <= self.kapasitas)
+            if len(kandidat):
+                label = int(kandidat[rng.randrange(len(kandidat))])
+            else:
+                label = jumlah
+                jumlah += 1
+            muatan[label] += ukuran
+            genome[i] = label
+        return self.canonical(genome)
+
+    def canonical(self, genome: np.ndarray) -> np.ndarray:
+        # Memberi label ulang 0..k-1 sesuai urutan kemunculan pertama (in-place, juga dikembalikan).
+        ditempatkan = genome >= 0
+        label = genome[ditempatkan]
+        if not len(label):
+            return genome
+        unik, pertama = np.unique(label, return_index=True)
+        peta = np.empty(int(unik[-1]) + 1, dtype=np.int32)
+        peta[unik[np.argsort(pertama)]] = np.arange(len(unik), dtype=np.int32)
+        genome[ditempatkan] = peta[label]
+        return genome
+
+    def repair(self, genome: np.ndarray) -> np.ndarray:
+        """
+        Memperbaiki genom secara in-place sehingga tidak ada kontainer yang kelebihan muatan.
+
+        Semua barang dari kontainer yang melebihi kapasitas, ditambah barang yang muat
+        tetapi belum berlabel, dikumpulkan lalu dikemas ulang sekaligus dengan First Fit
+        Decreasing ke label baru. Kontainer yang valid tidak disentuh. Genom yang
+        dikembalikan sudah kanonik.
+        """
+        genome[self.terlalu_besar] = TANPA_KONTAINER
+        ditempatkan = genome >= 0
+        label = genome[ditempatkan]
+        muatan = np.bincount(label, weights=self.ukuran[ditempatkan]) if len(label) else np.zeros(0)
+        penuh = muatan > self.kapasitas
+        if penuh.any():
+            lepas = ~self.terlalu_besar & ~ditempatkan
+            lepas[ditempatkan] = penuh[label]
+        else:
+            lepas = ~self.terlalu_besar & ~ditempatkan
+        kelompok = np.flatnonzero(lepas)
+        if len(kelompok):
+            label_baru = len(muatan)
+            for isi in pack_items(self.ukuran[kelompok].tolist(), self.kapasitas, 'first_fit'):
+                genome[kelompok[isi]] = label_baru
+                label_baru += 1
+        return self.canonical(genome)
+
+    def crossover(self, parent1: np.ndarray, parent2: np.ndarray, rng: random.Random) -> Tuple[np.ndarray, np.ndarray]:
+        # Crossover satu titik pada array label, lalu anak diperbaiki.
+        if len(self.items) < 2:
+            return parent1.copy(), parent2.copy()
+        cut_point = rng.randint(1, len(self.items) - 1)
+        child1 = np.concatenate((parent1[:cut_point], parent2[cut_point:]))
+        child2 = np.concatenate((parent2[:cut_point], parent1[cut_point:]))
+        return self.repair(child1), self.repair(child2)
+
+    def mutate(self, genome: np.ndarray, rng: random.Random) -> None:
+        """
+        Mutasi in-place: memindahkan satu barang acak ke kontainer acak yang masih muat
+        (atau kontainer baru), atau menukar dua barang dari dua kontainer bila keduanya muat.
+        """
+        if not len(self.indeks_muat):
+            return
+        ditempatkan = genome >= 0
+        label = genome[ditempatkan]
+        jumlah = np.bincount(label)
+        muatan = np.bincount(label, weights=self.ukuran[ditempatkan])
+
+        if rng.random() < 0.5:
+            i = int(self.indeks_muat[rng.randrange(len(self.indeks_muat))])
+            kandidat = np.flatnonzero((jumlah > 0) & (muatan + self.ukuran[i] <= self.kapasitas))
+            kandidat = kandidat[kandidat != genome[i]]
+            genome[i] = kandidat[rng.randrange(len(kandidat))] if len(kandidat) else len(jumlah)
+        else:
+            terisi = np.flatnonzero(jumlah > 0)
+            if len(terisi) < 2:
+                return
+            b1, b2 = rng.sample(terisi.tolist(), 2)
+            anggota1 = np.flatnonzero(genome == b1)
+            anggota2 = np.flatnonzero(genome == b2)
+            i = int(anggota1[rng.randrange(len(anggota1))])
+            j = int(anggota2[rng.randrange(len(anggota2))])
+            selisih = self.ukuran[j] - self.ukuran[i]
+            if muatan[b1] + selisih <= self.kapasitas and muatan[b2] - selisih <= self.kapasitas:
+                genome[i], genome[j] = b2, b1
+        self.canonical(genome)
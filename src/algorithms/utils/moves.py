@@ -1,8 +1,11 @@
 
 import random
-from typing import List, Tuple
+from bisect import bisect_left
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from src.core.data_structures import State, Kontainer, Barang
+from src.core.data_structures import MASK_64, State, Kontainer, Barang, campur_hash
+from src.core.objective_function import ObjectiveConfig, ScoreComponents, relocation_delta, swap_delta
 
 def get_random_neighbor(state: State) -> State:
     
@@ -43,8 +46,11 @@ def _relocate_random_item(state: State) -> State:
         target_container = random.choice(state.kontainer_list)
 
     # Pindahkan barang
-    source_container.barang_di_dalam.remove(item_to_move)
+    hash_asal, hash_tujuan = source_container.kode_hash, target_container.kode_hash
+    source_container.hapus_barang(item_to_move)
     target_container.tambah_barang(item_to_move)
+    state.perbarui_hash_kontainer(hash_asal, source_container.kode_hash)
+    state.perbarui_hash_kontainer(hash_tujuan, target_container.kode_hash)
 
     # Hapus kontainer kosong jika ada (kecuali hanya ada satu)
     if not source_container.barang_di_dalam and len(state.kontainer_list) > 1:
@@ -66,13 +72,348 @@ def _swap_random_items(state: State) -> State:
     item2 = random.choice(container2.barang_di_dalam)
 
     # Tukar barang
-    container1.barang_di_dalam.remove(item1)
-    container2.barang_di_dalam.remove(item2)
+    hash1, hash2 = container1.kode_hash, container2.kode_hash
+    container1.hapus_barang(item1)
+    container2.hapus_barang(item2)
     container1.tambah_barang(item2)
     container2.tambah_barang(item1)
+    state.perbarui_hash_kontainer(hash1, container1.kode_hash)
+    state.perbarui_hash_kontainer(hash2, container2.kode_hash)
 
     return state
 
+class RelocateMove:
+    """
+    Deskripsi ringan pemindahan satu barang ke kontainer lain atau ke kontainer baru.
+
+    Gerakan dapat dinilai tanpa diterapkan (`evaluate`), lalu diterapkan langsung
+    pada state (`apply`) dan dibatalkan kembali (`undo`). Kontainer asal yang
+    menjadi kosong dihapus dari state. `apply`/`undo` memperbarui `State.kode_hash`
+    dalam O(1), dan `resulting_hash` menghitung hash state setelah gerakan tanpa
+    menerapkannya.
+    """
+    __slots__ = ('barang', 'asal', 'tujuan', '_kontainer_baru', '_posisi_barang', '_posisi_asal')
+
+    def __init__(self, barang: Barang, asal: Kontainer, tujuan: Optional[Kontainer] = None):
+        self.barang = barang
+        self.asal = asal
+        self.tujuan = tujuan  # None berarti pindah ke kontainer baru
+        self._kontainer_baru: Optional[Kontainer] = None
+        self._posisi_barang: Optional[int] = None
+        self._posisi_asal: Optional[int] = None
+
+    def evaluate(self, state: State, components: ScoreComponents, config: ObjectiveConfig) -> ScoreComponents:
+        # Menghitung komponen skor setelah gerakan dalam O(1), tanpa mengubah state.
+        return relocation_delta(state, components, self.asal, self.barang, self.tujuan, config)
+
+    def resulting_hash(self, state: State) -> int:
+        # Hash Zobrist state setelah gerakan (O(1), tanpa mengubah state).
+        if self.tujuan is self.asal:
+            return state.kode_hash
+        kunci = self.barang._kunci
+        hash_asal = self.asal.kode_hash
+        hash_tujuan = self.tujuan.kode_hash if self.tujuan is not None else 0
+        return (state.kode_hash
+                - campur_hash(hash_asal) + campur_hash((hash_asal - kunci) & MASK_64)
+                - campur_hash(hash_tujuan) + campur_hash((hash_tujuan + kunci) & MASK_64)) & MASK_64
+
+    def apply(self, state: State) -> None:
+        if self.tujuan is self.asal:
+            return
+        self._perbarui_hash(state, 1)
+        self._posisi_barang = self.asal.hapus_barang(self.barang)
+        if self.tujuan is None:
+            new_container_id = max(k.id for k in state.kontainer_list) + 1 if state.kontainer_list else 1
+            self._kontainer_baru = Kontainer(id=new_container_id, kapasitas=self.asal.kapasitas, barang_di_dalam=[self.barang])
+            state.kontainer_list.append(self._kontainer_baru)
+        else:
+            self.tujuan.tambah_barang(self.barang)
+
+        # Hapus kontainer asal jika menjadi kosong
+        self._posisi_asal = None
+        if not self.asal.barang_di_dalam:
+            self._posisi_asal = _index_of(state.kontainer_list, self.asal)
+            del state.kontainer_list[self._posisi_asal]
+
+    def undo(self, state: State) -> None:
+        if self.tujuan is self.asal:
+            return
+        self._perbarui_hash(state, -1)
+        if self._posisi_asal is not None:
+            state.kontainer_list.insert(self._posisi_asal, self.asal)
+        if self.tujuan is None:
+            del state.kontainer_list[_index_of(state.kontainer_list, self._kontainer_baru)]
+            self._kontainer_baru = None
+        else:
+            self.tujuan.hapus_barang(self.barang)
+        self.asal.tambah_barang(self.barang, self._posisi_barang)
+
+    def _perbarui_hash(self, state: State, arah: int) -> None:
+        # Dipanggil sebelum isi kontainer berubah: arah=1 untuk apply, -1 untuk undo.
+        kunci = arah * self.barang._kunci
+        hash_asal = self.asal.kode_hash
+        hash_tujuan = self.tujuan.kode_hash if self.tujuan is not None else (0 if arah == 1 else self.barang._kunci)
+        state.perbarui_hash_kontainer(hash_asal, (hash_asal - kunci) & MASK_64)
+        state.perbarui_hash_kontainer(hash_tujuan, (hash_tujuan + kunci) & MASK_64)
+
+    def __repr__(self) -> str:
+        tujuan = 'baru' if self.tujuan is None else self.tujuan.id
+        return f"RelocateMove({self.barang.id}: {self.asal.id} -> {tujuan})"
+
+
+class SwapMove:
+    """
+    Deskripsi ringan penukaran dua barang dari dua kontainer yang berbeda.
+    """
+    __slots__ = ('barang1', 'kontainer1', 'barang2', 'kontainer2', '_posisi1', '_posisi2')
+
+    def __init__(self, barang1: Barang, kontainer1: Kontainer, barang2: Barang, kontainer2: Kontainer):
+        self.barang1 = barang1
+        self.kontainer1 = kontainer1
+        self.barang2 = barang2
+        self.kontainer2 = kontainer2
+        self._posisi1: Optional[int] = None
+        self._posisi2: Optional[int] = None
+
+    def evaluate(self, state: State, components: ScoreComponents, config: ObjectiveConfig) -> ScoreComponents:
+        # Menghitung komponen skor setelah gerakan dalam O(1), tanpa mengubah state.
+        return swap_delta(state, components, self.kontainer1, self.barang1, self.kontainer2, self.barang2, config)
+
+    def resulting_hash(self, state: State) -> int:
+        # Hash Zobrist state setelah gerakan (O(1), tanpa mengubah state).
+        selisih = self.barang2._kunci - self.barang1._kunci
+        hash1, hash2 = self.kontainer1.kode_hash, self.kontainer2.kode_hash
+        return (state.kode_hash
+                - campur_hash(hash1) + campur_hash((hash1 + selisih) & MASK_64)
+                - campur_hash(hash2) + campur_hash((hash2 - selisih) & MASK_64)) & MASK_64
+
+    def apply(self, state: State) -> None:
+        self._perbarui_hash(state, 1)
+        self._posisi1 = self.kontainer1.hapus_barang(self.barang1)
+        self._posisi2 = self.kontainer2.hapus_barang(self.barang2)
+        self.kontainer1.tambah_barang(self.barang2)
+        self.kontainer2.tambah_barang(self.barang1)
+
+    def undo(self, state: State) -> None:
+        self._perbarui_hash(state, -1)
+        self.kontainer1.hapus_barang(self.barang2)
+        self.kontainer2.hapus_barang(self.barang1)
+        self.kontainer1.tambah_barang(self.barang1, self._posisi1)
+        self.kontainer2.tambah_barang(self.barang2, self._posisi2)
+
+    def _perbarui_hash(self, state: State, arah: int) -> None:
+        # Dipanggil sebelum isi kontainer berubah: arah=1 untuk apply, -1 untuk undo.
+        selisih = arah * (self.barang2._kunci - self.barang1._kunci)
+        hash1, hash2 = self.kontainer1.kode_hash, self.kontainer2.kode_hash
+        state.perbarui_hash_kontainer(hash1, (hash1 + selisih) & MASK_64)
+        state.perbarui_hash_kontainer(hash2, (hash2 - selisih) & MASK_64)
+
+    def __repr__(self) -> str:
+        return f"SwapMove({self.barang1.id}@{self.kontainer1.id} <-> {self.barang2.id}@{self.kontainer2.id})"
+
+
+Move = Union[RelocateMove, SwapMove]
+
+
+def random_move(state: State, rng=random) -> Optional[Move]:
+    """
+    Memilih satu gerakan acak tanpa menyalin state.
+
+    Distribusinya sama dengan `get_random_neighbor`: 70% pemindahan satu barang
+    (dengan peluang 1/(N+1) ke kontainer baru), sisanya penukaran dua barang dari
+    dua kontainer berbeda.
+
+    Args:
+        state: State saat ini.
+        rng: Sumber angka acak (modul `random` atau instance `random.Random`).
+
+    Returns:
+        Gerakan yang belum diterapkan, atau None jika tidak ada gerakan yang mungkin.
+    """
+    if rng.random() < 0.7 or len(state.kontainer_list) < 2: # Lebih sering memindahkan
+        return _random_relocation(state, rng)
+    return _random_swap(state, rng)
+
+
+def _random_relocation(state: State, rng) -> Optional[RelocateMove]:
+    kontainer_list = state.kontainer_list
+    if not kontainer_list:
+        return None
+    asal = rng.choice(kontainer_list)
+    if not asal.barang_di_dalam:
+        # Jarang terjadi: hanya bila state awal berisi kontainer kosong
+        non_empty_containers = [k for k in kontainer_list if k.barang_di_dalam]
+        if not non_empty_containers:
+            return None
+        asal = rng.choice(non_empty_containers)
+    barang = rng.choice(asal.barang_di_dalam)
+
+    if rng.random() < 1 / (len(kontainer_list) + 1):
+        return RelocateMove(barang, asal, None)
+    return RelocateMove(barang, asal, rng.choice(kontainer_list))
+
+
+def _random_swap(state: State, rng) -> Optional[SwapMove]:
+    kontainer1, kontainer2 = rng.sample(state.kontainer_list, 2)
+    if not kontainer1.barang_di_dalam or not kontainer2.barang_di_dalam:
+        non_empty_containers = [k for k in state.kontainer_list if k.barang_di_dalam]
+        if len(non_empty_containers) < 2:
+            return None
+        kontainer1, kontainer2 = rng.sample(non_empty_containers, 2)
+    return SwapMove(rng.choice(kontainer1.barang_di_dalam), kontainer1, rng.choice(kontainer2.barang_di_dalam), kontainer2)
+
+
+def _index_of(kontainer_list: List[Kontainer], kontainer: Kontainer) -> int:
+    # Mencari posisi kontainer berdasarkan identitas objek (bukan kesamaan isi).
+    for idx in range(len(kontainer_list) - 1, -1, -1):
+        if kontainer_list[idx] is kontainer:
+            return idx
+    raise ValueError("Kontainer tidak ditemukan di dalam state.")
+
+
+def iter_all_moves(state: State) -> Iterator[Move]:
+    """
+    Menghasilkan semua gerakan relokasi lalu semua gerakan pertukaran secara malas,
+    dengan urutan yang sama seperti `get_all_neighbors`.
+
+    Args:
+        state: Keadaan saat ini. State tidak boleh diubah selama iterasi berlangsung.
+
+    Returns:
+        Iterator gerakan yang dapat dinilai dengan `evaluate` dan diterapkan dengan `apply`.
+    """
+    return chain(iter_relocation_moves(state), iter_swap_moves(state))
+
+
+def iter_relocation_moves(state: State) -> Iterator[RelocateMove]:
+    # Semua pemindahan barang ke kontainer lain yang masih muat, ditambah pemindahan ke kontainer baru.
+    for source_container in state.kontainer_list:
+        for item_to_move in source_container.barang_di_dalam:
+            for target_container in state.kontainer_list:
+                if target_container is source_container:
+                    continue
+                if target_container.bisa_tambah_barang(item_to_move):
+                    yield RelocateMove(item_to_move, source_container, target_container)
+            yield RelocateMove(item_to_move, source_container, None)
+
+
+def iter_swap_moves(state: State) -> Iterator[SwapMove]:
+    # Semua pertukaran dua barang dari dua kontainer berbeda yang tidak melebihi kapasitas.
+    kontainer_list = state.kontainer_list
+    for i in range(len(kontainer_list)):
+        container1 = kontainer_list[i]
+        for j in range(i + 1, len(kontainer_list)):
+            container2 = kontainer_list[j]
+            sisa1 = container1.sisa_kapasitas
+            sisa2 = container2.sisa_kapasitas
+            for item1 in container1.barang_di_dalam:
+                for item2 in container2.barang_di_dalam:
+                    selisih = item2.ukuran - item1.ukuran
+                    if selisih <= sisa1 and -selisih <= sisa2:
+                        yield SwapMove(item1, container1, item2, container2)
+
+
+def iter_prioritized_moves(state: State, rng=random) -> Iterator[Move]:
+    """
+    Menghasilkan gerakan secara malas dalam urutan heuristik untuk first-improvement.
+
+    Kontainer asal diurutkan dari muatan terkecil (paling mudah dikosongkan), dengan
+    seri dan urutan barang diacak. Untuk setiap barang, kontainer tujuan dicoba dari
+    sisa kapasitas terkecil yang masih muat (tightest fit) melalui bisection pada
+    daftar sisa kapasitas terurut, lalu pemindahan ke kontainer baru. Setelah semua
+    relokasi, pertukaran dicoba dengan urutan kontainer yang sama. Urutan acak berbeda
+    pada setiap pemanggilan sehingga pencarian tidak selalu mengambil gerakan yang sama.
+
+    Args:
+        state: Keadaan saat ini. State tidak boleh diubah selama iterasi berlangsung.
+        rng: Sumber angka acak (modul `random` atau instance `random.Random`).
+
+    Returns:
+        Iterator gerakan yang dapat dinilai dengan `evaluate` dan diterapkan dengan `apply`.
+    """
+    asal_terurut = list(state.kontainer_list)
+    rng.shuffle(asal_terurut)
+    asal_terurut.sort(key=lambda k: k.muatan_saat_ini)
+
+    # Kontainer tujuan terurut menurut sisa kapasitas (seri diputus secara acak)
+    tujuan_terurut = list(state.kontainer_list)
+    rng.shuffle(tujuan_terurut)
+    tujuan_terurut.sort(key=lambda k: k.sisa_kapasitas)
+    sisa_terurut = [k.sisa_kapasitas for k in tujuan_terurut]
+
+    for source_container in asal_terurut:
+        barang_acak = list(source_container.barang_di_dalam)
+        rng.shuffle(barang_acak)
+        for item_to_move in barang_acak:
+            for idx in range(bisect_left(sisa_terurut, item_to_move.ukuran), len(tujuan_terurut)):
+                target_container = tujuan_terurut[idx]
+                if target_container is not source_container:
+                    yield RelocateMove(item_to_move, source_container, target_container)
+            yield RelocateMove(item_to_move, source_container, None)
+
+    for i, container1 in enumerate(asal_terurut):
+        sisa1 = container1.sisa_kapasitas
+        for container2 in asal_terurut[i + 1:]:
+            sisa2 = container2.sisa_kapasitas
+            for item1 in container1.barang_di_dalam:
+                for item2 in container2.barang_di_dalam:
+                    selisih = item2.ukuran - item1.ukuran
+                    if selisih <= sisa1 and -selisih <= sisa2:
+                        yield SwapMove(item1, container1, item2, container2)
+
+
+def best_move(
+    state: State,
+    components: ScoreComponents,
+    config: ObjectiveConfig
+) -> Tuple[Optional[Move], Optional[ScoreComponents], float]:
+    """
+    Menilai seluruh tetangga secara malas dengan evaluasi delta, tanpa membuat salinan state.
+
+    Args:
+        state: Keadaan saat ini.
+        components: Komponen skor dari `state`.
+        config: Konfigurasi fungsi objektif.
+
+    Returns:
+        Tuple (gerakan pertama dengan skor terkecil, komponen skornya, skornya),
+        atau (None, None, inf) bila tidak ada tetangga.
+    """
+    best: Optional[Move] = None
+    best_components: Optional[ScoreComponents] = None
+    best_score = float('inf')
+    for move in iter_all_moves(state):
+        neighbor_components = move.evaluate(state, components, config)
+        neighbor_score = neighbor_components.score()
+        if best is None or neighbor_score < best_score:
+            best, best_components, best_score = move, neighbor_components, neighbor_score
+    return best, best_components, best_score
+
+
+def neighbor_from_move(state: State, move: Move) -> State:
+    """
+    Membuat salinan state lalu menerapkan gerakan pada salinan tersebut.
+
+    Args:
+        state: Keadaan asal (tidak diubah).
+        move: Gerakan yang dihasilkan dari `state`.
+
+    Returns:
+        Keadaan tetangga yang baru.
+    """
+    new_state = state.salin()
+    posisi: Dict[int, int] = {id(k): idx for idx, k in enumerate(state.kontainer_list)}
+
+    def padanan(kontainer: Optional[Kontainer]) -> Optional[Kontainer]:
+        return None if kontainer is None else new_state.kontainer_list[posisi[id(kontainer)]]
+
+    if isinstance(move, RelocateMove):
+        RelocateMove(move.barang, padanan(move.asal), padanan(move.tujuan)).apply(new_state)
+    else:
+        SwapMove(move.barang1, padanan(move.kontainer1), move.barang2, padanan(move.kontainer2)).apply(new_state)
+    return new_state
+
+
 def get_all_neighbors(state: State) -> List[State]:
     """
     Menghasilkan semua kemungkinan keadaan tetangga dari keadaan saat ini dengan menerapkan
@@ -99,54 +440,7 @@ def get_all_relocation_moves(state: State) -> List[State]:
     Returns:
         Sebuah list keadaan tetangga yang dibuat oleh gerakan relokasi.
     """
-    neighbors = []
-    all_items = [item for container in state.kontainer_list for item in container.barang_di_dalam]
-    
-    for item_to_move in all_items:
-        source_container = next((c for c in state.kontainer_list if item_to_move in c.barang_di_dalam), None)
-        if not source_container:
-            continue
-
-        # Coba pindah ke setiap kontainer lain yang ada
-        for target_container in state.kontainer_list:
-            if source_container.id == target_container.id:
-                continue
-
-            if target_container.bisa_tambah_barang(item_to_move):
-                new_state = state.salin()
-                
-                # Ambil referensi objek dari keadaan baru
-                new_source_container = next(c for c in new_state.kontainer_list if c.id == source_container.id)
-                new_target_container = next(c for c in new_state.kontainer_list if c.id == target_container.id)
-                new_item = next(i for i in new_source_container.barang_di_dalam if i.id == item_to_move.id)
-
-                # Lakukan pemindahan
-                new_source_container.barang_di_dalam.remove(new_item)
-                new_target_container.barang_di_dalam.append(new_item)
-                
-                # Hapus kontainer asal jika menjadi kosong
-                if not new_source_container.barang_di_dalam:
-                    new_state.kontainer_list.remove(new_source_container)
-                
-                neighbors.append(new_state)
-
-        # Coba pindah ke kontainer baru
-        new_state_for_new_container = state.salin()
-        source_in_new_state = next(c for c in new_state_for_new_container.kontainer_list if c.id == source_container.id)
-        item_in_new_state = next(i for i in source_in_new_state.barang_di_dalam if i.id == item_to_move.id)
-        
-        source_in_new_state.barang_di_dalam.remove(item_in_new_state)
-        
-        new_container_id = max(c.id for c in new_state_for_new_container.kontainer_list) + 1 if new_state_for_new_container.kontainer_list else 1
-        new_container = Kontainer(id=new_container_id, kapasitas=source_container.kapasitas, barang_di_dalam=[item_in_new_state])
-        new_state_for_new_container.kontainer_list.append(new_container)
-
-        if not source_in_new_state.barang_di_dalam:
-            new_state_for_new_container.kontainer_list.remove(source_in_new_state)
-
-        neighbors.append(new_state_for_new_container)
-
-    return neighbors
+    return [neighbor_from_move(state, move) for move in iter_relocation_moves(state)]
 
 def get_all_swap_moves(state: State) -> List[State]:
     """
@@ -158,36 +452,4 @@ def get_all_swap_moves(state: State) -> List[State]:
     Returns:
         Sebuah list keadaan tetangga yang dibuat oleh gerakan pertukaran.
     """
-    neighbors = []
-    
-    # Loop semua pasangan kontainer yang unik
-    for i in range(len(state.kontainer_list)):
-        for j in range(i + 1, len(state.kontainer_list)):
-            container1 = state.kontainer_list[i]
-            container2 = state.kontainer_list[j]
-
-            # Loop semua pasangan barang dari dua kontainer tersebut
-            for item1 in container1.barang_di_dalam:
-                for item2 in container2.barang_di_dalam:
-                    # Cek apakah pertukaran valid (tidak melebihi kapasitas)
-                    new_load1 = container1.muatan_saat_ini - item1.ukuran + item2.ukuran
-                    new_load2 = container2.muatan_saat_ini - item2.ukuran + item1.ukuran
-
-                    if new_load1 <= container1.kapasitas and new_load2 <= container2.kapasitas:
-                        new_state = state.salin()
-                        
-                        # Ambil referensi objek dari keadaan baru
-                        new_container1 = next(c for c in new_state.kontainer_list if c.id == container1.id)
-                        new_container2 = next(c for c in new_state.kontainer_list if c.id == container2.id)
-                        new_item1 = next(it for it in new_container1.barang_di_dalam if it.id == item1.id)
-                        new_item2 = next(it for it in new_container2.barang_di_dalam if it.id == item2.id)
-
-                        # Lakukan pertukaran
-                        new_container1.barang_di_dalam.remove(new_item1)
-                        new_container2.barang_di_dalam.remove(new_item2)
-                        new_container1.barang_di_dalam.append(new_item2)
-                        new_container2.barang_di_dalam.append(new_item1)
-                        
-                        neighbors.append(new_state)
-                        
-    return neighbors
+    return [neighbor_from_move(state, move) for move in iter_swap_moves(state)]
@@ -0,0 +1,273 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.core.data_structures import Barang, State
+from src.core.objective_function import (
+    FRAGILE_PENALTY,
+    INCOMPATIBLE_PENALTY,
+    OVERFILL_PENALTY_MULTIPLIER,
+    ObjectiveConfig,
+    ScoreComponents,
+)
+from src.algorithms.utils.moves import Move, RelocateMove, SwapMove, best_move
+
+# Batas jumlah elemen matriks skor yang diproses sekaligus, agar memori tetap terbatas
+# pada instance dengan ribuan barang.
+_ELEMEN_PER_BLOK = 1 << 20
+
+
+class _Lingkungan:
+    # Array NumPy yang merangkum state saat ini: barang diurutkan per kontainer
+    # sesuai urutan `kontainer_list`, persis seperti urutan iterasi `iter_all_moves`.
+
+    def __init__(self, state: State, components: ScoreComponents, config: ObjectiveConfig):
+        kontainer_list = state.kontainer_list
+        self.barang: List[Barang] = [b for k in kontainer_list for b in k.barang_di_dalam]
+        jumlah_isi = np.fromiter((len(k.barang_di_dalam) for k in kontainer_list), dtype=np.int64, count=len(kontainer_list))
+        self.kapasitas = kontainer_list[0].kapasitas
+        self.muatan = np.fromiter((k.muatan_saat_ini for k in kontainer_list), dtype=np.int64, count=len(kontainer_list))
+        self.jumlah_isi = jumlah_isi
+        self.asal = np.repeat(np.arange(len(kontainer_list), dtype=np.int64), jumlah_isi)
+        self.posisi = np.concatenate([np.arange(n, dtype=np.int64) for n in jumlah_isi]) if len(self.barang) else np.zeros(0, dtype=np.int64)
+        self.ukuran = np.fromiter((b.ukuran for b in self.barang), dtype=np.int64, count=len(self.barang))
+
+        self.n = components.jumlah_kontainer
+        self.kuadrat = components.kepadatan.get(self.kapasitas, (0, 0))[1]
+        self.kelebihan = components.kelebihan_muatan
+        self.pelanggaran_rapuh = components.pelanggaran_rapuh
+        self.pelanggaran_inkompatibel = components.pelanggaran_inkompatibel
+
+        self.config = config
+        if config.use_fragile_constraint:
+            self.rapuh = np.fromiter((b.rapuh for b in self.barang), dtype=np.int64, count=len(self.barang))
+            self.ukuran_non_rapuh = self.ukuran * (1 - self.rapuh)
+            self.jumlah_rapuh = np.fromiter((k.jumlah_rapuh for k in kontainer_list), dtype=np.int64, count=len(kontainer_list))
+            self.muatan_non_rapuh = np.fromiter((k.muatan_non_rapuh for k in kontainer_list), dtype=np.int64, count=len(kontainer_list))
+        if config.use_incompatible_constraint:
+            # Untuk tiap pasangan tipe: (indikator tipe barang, jumlah barang bertipe itu per kontainer)
+            self.pasangan = []
+            for tipe_x, tipe_y in config.incompatible_pairs:
+                self.pasangan.append(tuple(
+                    (
+                        np.fromiter((b.tipe == tipe for b in self.barang), dtype=np.int64, count=len(self.barang)),
+                        np.fromiter((k.jumlah_per_tipe.get(tipe, 0) for k in kontainer_list), dtype=np.int64, count=len(kontainer_list)),
+                    )
+                    for tipe in (tipe_x, tipe_y)
+                ))
+
+    def kelebihan_dari(self, muatan: np.ndarray) -> np.ndarray:
+        return np.maximum(muatan - self.kapasitas, 0)
+
+    def rapuh_dilanggar(self, jumlah_rapuh: np.ndarray, muatan_non_rapuh: np.ndarray) -> np.ndarray:
+        return ((jumlah_rapuh > 0) & (muatan_non_rapuh > self.config.fragile_threshold)).astype(np.int64)
+
+    def skor(self, n, kuadrat, kelebihan, rapuh, inkompatibel) -> np.ndarray:
+        # Versi vektor dari ScoreComponents.score() dengan urutan operasi yang sama,
+        # sehingga hasilnya identik bit-per-bit dengan jalur skalar.
+        kapasitas_kuadrat = self.kapasitas * self.kapasitas
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density_bonus = ((n * kapasitas_kuadrat - kuadrat) / kapasitas_kuadrat) / n
+        hasil = n + density_bonus
+        hasil = hasil + rapuh * FRAGILE_PENALTY
+        hasil = hasil + inkompatibel * INCOMPATIBLE_PENALTY
+        return np.where(kelebihan > 0, kelebihan * OVERFILL_PENALTY_MULTIPLIER, hasil)
+
+
+def best_move_vectorized(
+    state: State,
+    components: ScoreComponents,
+    config: ObjectiveConfig
+) -> Tuple[Optional[Move], Optional[ScoreComponents], float]:
+    """
+    Mencari gerakan terbaik di seluruh lingkungan relokasi/pertukaran secara tervektorisasi.
+
+    Skor setiap relokasi (matriks barang x kontainer, ditambah kolom kontainer baru) dan
+    setiap pertukaran lintas kontainer dihitung sekaligus dengan NumPy, gerakan yang tidak
+    muat di-mask, lalu diambil argmin-nya. Hasilnya identik dengan `best_move`, termasuk
+    pemilihan gerakan pertama ketika ada skor yang sama. Bila kapasitas kontainer tidak
+    seragam, fungsi ini kembali ke jalur skalar.
+
+    Args:
+        state: Keadaan saat ini.
+        components: Komponen skor dari `state`.
+        config: Konfigurasi fungsi objektif.
+
+    Returns:
+        Tuple (gerakan terbaik, komponen skornya, skornya), atau (None, None, inf)
+        bila tidak ada tetangga.
+    """
+    kontainer_list = state.kontainer_list
+    if not kontainer_list or any(k.kapasitas != kontainer_list[0].kapasitas for k in kontainer_list):
+        return best_move(state, components, config)
+
+    env = _Lingkungan(state, components, config)
+    if not env.barang:
+        return None, None, float('inf')
+
+    skor_relokasi, relokasi = _best_relocation(env)
+    skor_tukar, tukar = _best_swap(env)
+
+    # Relokasi dihasilkan lebih dulu daripada pertukaran, sehingga pertukaran
+    # hanya dipilih bila skornya benar-benar lebih kecil.
+    if tukar is not None and skor_tukar < skor_relokasi:
+        p, q = tukar
+        move: Move = SwapMove(env.barang[p], kontainer_list[env.asal[p]], env.barang[q], kontainer_list[env.asal[q]])
+    else:
+        p, t = relokasi
+        tujuan = kontainer_list[t] if t < len(kontainer_list) else None
+        move = RelocateMove(env.barang[p], kontainer_list[env.asal[p]], tujuan)
+        skor_tukar = skor_relokasi
+
+    move_components = move.evaluate(state, components, config)
+    move_score = move_components.score()
+    if config.verify_delta and move_score != skor_tukar:
+        raise AssertionError(f"Skor tervektorisasi {skor_tukar} berbeda dari skor skalar {move_score} untuk {move}")
+    return move, move_components, move_score
+
+
+def _best_relocation(env: _Lingkungan) -> Tuple[float, Tuple[int, int]]:
+    # Relokasi barang p ke kontainer t; kolom t == jumlah kontainer berarti kontainer baru.
+    # Urutan gerakan setara dengan matriks (barang, kontainer + 1) yang dibaca per baris.
+    jumlah_barang = len(env.barang)
+    jumlah_kontainer = len(env.muatan)
+    baris_per_blok = max(1, _ELEMEN_PER_BLOK // (jumlah_kontainer + 1))
+
+    best_score = float('inf')
+    best_index = (0, jumlah_kontainer)
+    for awal in range(0, jumlah_barang, baris_per_blok):
+        akhir = min(awal + baris_per_blok, jumlah_barang)
+        valid = ((env.muatan[None, :] + env.ukuran[awal:akhir, None] <= env.kapasitas)
+                 & (np.arange(jumlah_kontainer)[None, :] != env.asal[awal:akhir, None]))
+        baris, t = np.nonzero(valid)
+        p_ada = baris + awal
+        p_baru = np.arange(awal, akhir)
+        # Gabungkan tujuan yang sudah ada dengan kontainer baru (satu per barang)
+        p = np.concatenate([p_ada, p_baru])
+        t = np.concatenate([t, np.full(len(p_baru), jumlah_kontainer)])
+        baru = t == jumlah_kontainer
+        t_ada = np.where(baru, 0, t)
+
+        a = env.asal[p]
+        s = env.ukuran[p]
+        muatan_asal = env.muatan[a]
+
+        # Kontainer asal kehilangan barang dan dihapus bila menjadi kosong
+        n = env.n - (env.jumlah_isi[a] == 1) + baru
+        muatan_tujuan = np.where(baru, 0, env.muatan[t_ada])
+        muatan_baru = muatan_tujuan + s
+        kuadrat = env.kuadrat - muatan_asal ** 2 + (muatan_asal - s) ** 2 - muatan_tujuan ** 2 + muatan_baru ** 2
+        kelebihan = (env.kelebihan - env.kelebihan_dari(muatan_asal) + env.kelebihan_dari(muatan_asal - s)
+                     - env.kelebihan_dari(muatan_tujuan) + env.kelebihan_dari(muatan_baru))
+
+        rapuh = env.pelanggaran_rapuh
+        if env.config.use_fragile_constraint:
+            r = env.rapuh[p]
+            nr = env.ukuran_non_rapuh[p]
+            fa, na = env.jumlah_rapuh[a], env.muatan_non_rapuh[a]
+            ft = np.where(baru, 0, env.jumlah_rapuh[t_ada])
+            nt = np.where(baru, 0, env.muatan_non_rapuh[t_ada])
+            rapuh = (rapuh - env.rapuh_dilanggar(fa, na) + env.rapuh_dilanggar(fa - r, na - nr)
+                     - env.rapuh_dilanggar(ft, nt) + env.rapuh_dilanggar(ft + r, nt + nr))
+
+        inkompatibel = env.pelanggaran_inkompatibel
+        if env.config.use_incompatible_constraint:
+            total = np.zeros(len(p), dtype=np.int64)
+            for (ix, cx), (iy, cy) in env.pasangan:
+                xp, yp = ix[p], iy[p]
+                cxt = np.where(baru, 0, cx[t_ada])
+                cyt = np.where(baru, 0, cy[t_ada])
+                total -= ((cx[a] > 0) & (cy[a] > 0)).astype(np.int64) + ((cxt > 0) & (cyt > 0))
+                total += ((cx[a] - xp > 0) & (cy[a] - yp > 0)).astype(np.int64)
+                total += ((cxt + xp > 0) & (cyt + yp > 0))
+            inkompatibel = inkompatibel + total
+
+        skor = env.skor(n, kuadrat, kelebihan, rapuh, inkompatibel)
+        nilai = float(skor.min())
+        if nilai < best_score:
+            # Ambil gerakan pertama (urutan baris, lalu kolom) di antara skor yang sama
+            terbaik = np.flatnonzero(skor == nilai)
+            kunci = p[terbaik] * (jumlah_kontainer + 1) + t[terbaik]
+            pilihan = terbaik[np.argmin(kunci)]
+            best_score = nilai
+            best_index = (int(p[pilihan]), int(t[pilihan]))
+    return best_score, best_index
+
+
+def _best_swap(env: _Lingkungan) -> Tuple[float, Optional[Tuple[int, int]]]:
+    # Pertukaran barang p (baris) dengan barang q (kolom) dari kontainer berindeks lebih besar.
+    # Mask kelayakan dihitung per blok, lalu skor hanya dihitung untuk pasangan yang layak.
+    jumlah_barang = len(env.barang)
+    sisa = env.kapasitas - env.muatan
+    awal_kontainer = np.searchsorted(env.asal, np.arange(len(env.muatan) + 1))
+
+    best_score = float('inf')
+    kandidat: List[np.ndarray] = []
+    awal = 0
+    while awal < jumlah_barang:
+        # Kolom dimulai dari barang pertama di kontainer setelah kontainer baris pertama
+        kolom_awal = awal_kontainer[env.asal[awal] + 1]
+        if kolom_awal >= jumlah_barang:
+            break
+        baris_per_blok = max(1, _ELEMEN_PER_BLOK // (jumlah_barang - kolom_awal))
+        akhir = min(awal + baris_per_blok, jumlah_barang)
+        a_blok = env.asal[awal:akhir, None]
+        b_blok = env.asal[None, kolom_awal:]
+        selisih_blok = env.ukuran[None, kolom_awal:] - env.ukuran[awal:akhir, None]
+        valid = (b_blok > a_blok) & (selisih_blok <= sisa[a_blok]) & (-selisih_blok <= sisa[b_blok])
+        baris, kolom = np.nonzero(valid)
+        awal_blok = awal
+        awal = akhir
+        if not len(baris):
+            continue
+
+        p = baris + awal_blok
+        q = kolom + kolom_awal
+        a = env.asal[p]
+        b = env.asal[q]
+        selisih = env.ukuran[q] - env.ukuran[p]
+        muatan_a = env.muatan[a]
+        muatan_b = env.muatan[b]
+        baru_a = muatan_a + selisih
+        baru_b = muatan_b - selisih
+        kuadrat = env.kuadrat - muatan_a ** 2 - muatan_b ** 2 + baru_a ** 2 + baru_b ** 2
+        kelebihan = (env.kelebihan - env.kelebihan_dari(muatan_a) - env.kelebihan_dari(muatan_b)
+                     + env.kelebihan_dari(baru_a) + env.kelebihan_dari(baru_b))
+
+        rapuh = env.pelanggaran_rapuh
+        if env.config.use_fragile_constraint:
+            rp, rq = env.rapuh[p], env.rapuh[q]
+            np_, nq = env.ukuran_non_rapuh[p], env.ukuran_non_rapuh[q]
+            fa, fb = env.jumlah_rapuh[a], env.jumlah_rapuh[b]
+            na, nb = env.muatan_non_rapuh[a], env.muatan_non_rapuh[b]
+            rapuh = (rapuh - env.rapuh_dilanggar(fa, na) - env.rapuh_dilanggar(fb, nb)
+                     + env.rapuh_dilanggar(fa - rp + rq, na - np_ + nq)
+                     + env.rapuh_dilanggar(fb - rq + rp, nb - nq + np_))
+
+        inkompatibel = env.pelanggaran_inkompatibel
+        if env.config.use_incompatible_constraint:
+            total = np.zeros(len(p), dtype=np.int64)
+            for (ix, cx), (iy, cy) in env.pasangan:
+                xp, xq, yp, yq = ix[p], ix[q], iy[p], iy[q]
+                total -= ((cx[a] > 0) & (cy[a] > 0)).astype(np.int64) + ((cx[b] > 0) & (cy[b] > 0))
+                total += ((cx[a] - xp + xq > 0) & (cy[a] - yp + yq > 0)).astype(np.int64)
+                total += ((cx[b] - xq + xp > 0) & (cy[b] - yq + yp > 0))
+            inkompatibel = inkompatibel + total
+
+        skor = env.skor(env.n, kuadrat, kelebihan, rapuh, inkompatibel)
+        nilai = float(skor.min())
+        if nilai < best_score:
+            best_score = nilai
+            kandidat = []
+        if nilai == best_score:
+            terbaik = skor == nilai
+            kandidat.append(np.stack([p[terbaik], q[terbaik]]))
+
+    if not kandidat:
+        return best_score, None
+
+    # Jalur skalar menelusuri pasangan kontainer (i, j) lebih dulu, lalu barang di dalamnya,
+    # sehingga seri diputus berdasarkan (kontainer p, kontainer q, posisi p, posisi q).
+    p, q = np.concatenate(kandidat, axis=1)
+    urutan = np.lexsort((env.posisi[q], env.posisi[p], env.asal[q], env.asal[p]))
+    return best_score, (int(p[urutan[0]]), int(q[urutan[0]]))
@@ -0,0 +1,199 @@
+import sys
+import argparse
+import csv
+import glob
+import json
+import os
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from src.solver import add_solver_arguments, solve_problem
+from src.utils.file_parser import parse_problem, parse_problem_data
+
+# Kolom output CSV (output JSONL memakai kunci yang sama, ditambah solusi bila diminta)
+BATCH_FIELDS = [
+    'index', 'problem', 'status', 'algorithm', 'num_items', 'capacity',
+    'initial_score', 'final_score', 'num_containers_initial', 'num_containers_final',
+    'lower_bound', 'optimality_gap', 'iterations', 'duration_seconds', 'seed', 'error'
+]
+FORMAT_OUTPUT = ('jsonl', 'csv')
+
+# Satu problem dalam antrean: (indeks, id problem, jenis sumber 'file'/'json', path atau baris JSON)
+BatchTask = Tuple[int, str, str, str]
+
+
+def iter_problem_sources(inputs: Iterable[str], stdin: Optional[TextIO] = None) -> Iterator[Tuple[str, str, str]]:
+    """
+    Menghasilkan problem dari direktori, pola glob, file JSON/JSONL, atau stdin secara malas.
+
+    Args:
+        inputs: Daftar input: direktori (semua `*.json` dan `*.jsonl` di dalamnya),
+            pola glob, file `.json` (satu problem), file `.jsonl` (satu problem per
+            baris), atau '-' untuk stream JSONL dari stdin.
+        stdin: Stream untuk input '-' (default `sys.stdin`).
+
+    Returns:
+        Iterator (id problem, jenis sumber, isi); jenis 'file' berisi path, jenis 'json'
+        berisi satu baris JSON yang di-parse oleh worker.
+    """
+    for masukan in inputs:
+        if masukan == '-':
+            yield from _iter_jsonl(stdin if stdin is not None else sys.stdin, '<stdin>')
+            continue
+        if os.path.isdir(masukan):
+            paths = sorted(glob.glob(os.path.join(masukan, '*.json')) + glob.glob(os.path.join(masukan, '*.jsonl')))
+        elif os.path.exists(masukan):
+            paths = [masukan]
+        else:
+            paths = sorted(glob.glob(masukan, recursive=True))
+            if not paths:
+                raise FileNotFoundError(f"Input '{masukan}' tidak cocok dengan file apa pun.")
+        for path in paths:
+            if path.endswith('.jsonl'):
+                with open(path, 'r') as f:
+                    yield from _iter_jsonl(f, path)
+            else:
+                yield os.path.splitext(os.path.basename(path))[0], 'file', path
+
+
+def _iter_jsonl(stream: TextIO, nama: str) -> Iterator[Tuple[str, str, str]]:
+    # Setiap baris tidak kosong adalah satu problem; ID default "<sumber>:<nomor baris>".
+    for nomor, baris in enumerate(stream, start=1):
+        if baris.strip():
+            yield f"{nama}:{nomor}", 'json', baris
+
+
+def solve_task(task: BatchTask, args: argparse.Namespace) -> dict:
+    """
+    Menyelesaikan satu problem batch di proses worker.
+
+    Kegagalan (file rusak, JSON tidak valid, error algoritma) dicatat sebagai baris
+    berstatus 'error' sehingga batch tetap berjalan. Output konsol dari parser atau
+    algoritma dialihkan ke stderr agar tidak merusak hasil JSONL/CSV di stdout.
+    """
+    indeks, problem_id, jenis, isi = task
+    hasil = {'index': indeks, 'problem': problem_id}
+    try:
+        with redirect_stdout(sys.stderr):
+            if jenis == 'file':
+                items, kapasitas = parse_problem(isi, cache_dir=args.problem_cache_dir)
+            else:
+                data = json.loads(isi)
+                if isinstance(data, dict):
+                    hasil['problem'] = str(data.get('id', problem_id))
+                items, kapasitas = parse_problem_data(data)
+            ringkasan = solve_problem(items, kapasitas, args)
+    except Exception as e:
+        hasil.update(status='error', error=f"{type(e).__name__}: {e}")
+        return hasil
+    if not args.include_solution:
+        ringkasan.pop('containers')
+        ringkasan.pop('unallocated')
+    hasil.update(status='ok', **ringkasan)
+    return hasil
+
+
+def iter_batch_results(tasks: Iterable[BatchTask], args: argparse.Namespace, jobs: int = 1) -> Iterator[dict]:
+    """
+    Menyelesaikan problem dari `tasks` dan menghasilkan hasilnya begitu selesai.
+
+    Dengan `jobs > 1`, problem dikirim secara malas ke process pool dengan paling banyak
+    2 x jobs problem dalam antrean, sehingga stream input yang sangat panjang (atau tak
+    berujung dari stdin) tidak perlu dibaca seluruhnya ke memori. Urutan hasil mengikuti
+    urutan selesai; kolom `index` menyimpan urutan input.
+
+    Args:
+        tasks: Iterable problem (lihat `BatchTask`).
+        args: Argumen solver yang sama untuk semua problem.
+        jobs: Jumlah proses worker; 1 berarti dijalankan berurutan di proses ini.
+    """
+    if jobs <= 1:
+        for task in tasks:
+            yield solve_task(task, args)
+        return
+
+    tasks = iter(tasks)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = {executor.submit(solve_task, task, args) for task in islice(tasks, 2 * jobs)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            for task in islice(tasks, len(done)):
+                pending.add(executor.submit(solve_task, task, args))
+
+
+class ResultWriter:
+    """
+    Menulis hasil batch ke satu file JSONL atau CSV, satu baris per problem.
+
+    Setiap baris langsung di-flush sehingga hasil dapat dibaca selama batch berjalan.
+
+    Args:
+        stream: Stream output yang sudah dibuka.
+        format_output: 'jsonl' atau 'csv'. Kolom solusi (`containers`, `unallocated`)
+            hanya ditulis pada format JSONL.
+    """
+
+    def __init__(self, stream: TextIO, format_output: str):
+        if format_output not in FORMAT_OUTPUT:
+            raise ValueError(f"Format output '{format_output}' tidak dikenal. Pilihan: {FORMAT_OUTPUT}")
+        self.stream = stream
+        self.format_output = format_output
+        self._csv: Optional[csv.DictWriter] = None
+        if format_output == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=BATCH_FIELDS, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def write(self, hasil: dict) -> None:
+        if self._csv is not None:
+            self._csv.writerow(hasil)
+        else:
+            self.stream.write(json.dumps(hasil) + '\n')
+        self.stream.flush()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="AI Bin Packaging Solver - mode batch (banyak problem sekaligus)")
+    # Argumen algoritma (sama dengan src.main)
+    add_solver_arguments(parser)
+
+    # Argumen Batch
+    parser.add_argument("inputs", nargs='+', help="Direktori, pola glob, file .json/.jsonl, atau '-' untuk JSONL dari stdin.")
+    parser.add_argument("--output", type=str, default='-', help="File output hasil (default: stdout).")
+    parser.add_argument("--format", type=str, default=None, choices=list(FORMAT_OUTPUT), help="Format output (default: dari ekstensi --output, atau jsonl).")
+    parser.add_argument("--jobs", type=int, default=1, help="Jumlah proses worker untuk menyelesaikan problem secara paralel.")
+    parser.add_argument("--include_solution", action="store_true", help="Sertakan ID barang per kontainer pada output JSONL.")
+
+    args = parser.parse_args(argv)
+    format_output = args.format
+    if format_output is None:
+        format_output = 'csv' if args.output.endswith('.csv') else 'jsonl'
+
+    tasks = (
+        (indeks, problem_id, jenis, isi)
+        for indeks, (problem_id, jenis, isi) in enumerate(iter_problem_sources(args.inputs))
+    )
+    stream = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    start_time = time.time()
+    jumlah = gagal = 0
+    try:
+        writer = ResultWriter(stream, format_output)
+        for hasil in iter_batch_results(tasks, args, jobs=args.jobs):
+            writer.write(hasil)
+            jumlah += 1
+            if hasil['status'] != 'ok':
+                gagal += 1
+                print(f"Problem {hasil['problem']} gagal: {hasil['error']}", file=sys.stderr)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    # Ringkasan ke stderr agar tidak bercampur dengan output di stdout
+    print(f"{jumlah} problem selesai ({gagal} gagal) dalam {time.time() - start_time:.2f} detik", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
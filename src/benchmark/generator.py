@@ -0,0 +1,149 @@
+import argparse
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from src.core.data_structures import Barang
+
+# Kelas instance yang dapat dibangkitkan
+KELAS_INSTANCE = ('falkenauer_u', 'falkenauer_t', 'scholl_1', 'scholl_2', 'scholl_3')
+# Tipe barang yang dipakai pada data contoh di src/data
+TIPE_BARANG = ('elektronik', 'pakaian', 'makanan', 'buku', 'kimia', 'obat', 'perabot')
+
+
+@dataclass
+class Instance:
+    # Satu instance bin packing hasil generator beserta parameter pembuatnya.
+    nama: str
+    kelas: str
+    seed: int
+    kapasitas: int
+    items: List[Barang]
+    # Jumlah kontainer optimal bila diketahui dari konstruksinya (kelas triplet)
+    optimum: Optional[int] = None
+
+
+def _ukuran_falkenauer_t(n: int, rng: np.random.Generator) -> np.ndarray:
+    # Setiap triplet mengisi tepat satu kontainer berkapasitas 1000: barang pertama
+    # dari [380, 490], barang kedua dari [251, (1000 - pertama) / 2), sisanya barang
+    # ketiga. Semua barang > 250 dan < 500 (tepat 3 per kontainer), sehingga
+    # optimum = jumlah triplet.
+    jumlah_triplet = n // 3
+    pertama = rng.integers(380, 491, size=jumlah_triplet)
+    kedua = 251 + (rng.random(jumlah_triplet) * ((1000 - pertama) / 2 - 251)).astype(np.int64)
+    ketiga = 1000 - pertama - kedua
+    ukuran = np.stack([pertama, kedua, ketiga], axis=1).ravel()
+    # Sisa n % 3 barang diambil dari rentang yang sama, di luar triplet
+    sisa = rng.integers(251, 500, size=n - 3 * jumlah_triplet)
+    ukuran = np.concatenate([ukuran, sisa])
+    rng.shuffle(ukuran)
+    return ukuran
+
+
+def generate_instance(
+    kelas: str,
+    n: int,
+    seed: int = 0,
+    peluang_tipe: float = 1.0,
+    peluang_rapuh: float = 0.1
+) -> Instance:
+    """
+    Membangkitkan instance sintetis yang dapat direproduksi dari `(kelas, n, seed)`.
+
+    Kelas instance:
+        - 'falkenauer_u': kapasitas 150, ukuran seragam dalam [20, 100].
+        - 'falkenauer_t': kapasitas 1000, barang disusun dari triplet yang masing-masing
+          mengisi tepat satu kontainer (optimum diketahui bila n kelipatan 3).
+        - 'scholl_1': kapasitas {100, 120, 150}, ukuran seragam dalam [{1, 20, 30}, 100].
+        - 'scholl_2': kapasitas 1000, ukuran di sekitar C/{3, 5, 7, 9} dengan
+          simpangan {20, 50, 90}% (sekitar 3-9 barang per kontainer).
+        - 'scholl_3': kapasitas 100000, ukuran seragam dalam [20000, 35000] (instance sulit).
+    Parameter yang dipilih acak untuk kelas Scholl juga diturunkan dari `seed`.
+
+    Args:
+        kelas: Salah satu dari `KELAS_INSTANCE`.
+        n: Jumlah barang (1 hingga jutaan; dibangkitkan dengan NumPy).
+        seed: Seed generator.
+        peluang_tipe: Peluang sebuah barang memiliki tipe dari `TIPE_BARANG`.
+        peluang_rapuh: Peluang sebuah barang bersifat rapuh.
+
+    Returns:
+        Instance baru.
+    """
+    if kelas not in KELAS_INSTANCE:
+        raise ValueError(f"Kelas instance '{kelas}' tidak dikenal. Pilihan: {KELAS_INSTANCE}")
+    if n < 1:
+        raise ValueError("n minimal 1.")
+    rng = np.random.default_rng(seed)
+    optimum = None
+
+    if kelas == 'falkenauer_u':
+        kapasitas = 150
+        ukuran = rng.integers(20, 101, size=n)
+    elif kelas == 'falkenauer_t':
+        kapasitas = 1000
+        ukuran = _ukuran_falkenauer_t(n, rng)
+        if n % 3 == 0:
+            optimum = n // 3
+    elif kelas == 'scholl_1':
+        kapasitas = int(rng.choice([100, 120, 150]))
+        ukuran = rng.integers(int(rng.choice([1, 20, 30])), 101, size=n)
+    elif kelas == 'scholl_2':
+        kapasitas = 1000
+        rata_rata = kapasitas / int(rng.choice([3, 5, 7, 9]))
+        simpangan = rata_rata * float(rng.choice([0.2, 0.5, 0.9]))
+        ukuran = rng.integers(int(rata_rata - simpangan), int(rata_rata + simpangan) + 1, size=n)
+    else:
+        kapasitas = 100000
+        ukuran = rng.integers(20000, 35001, size=n)
+
+    # Kolom diubah ke list Python sekali agar pembuatan jutaan Barang tidak
+    # mengakses elemen array NumPy satu per satu
+    tabel_tipe = (None,) + TIPE_BARANG
+    tipe = np.where(rng.random(n) < peluang_tipe, rng.integers(1, len(tabel_tipe), size=n), 0).tolist()
+    rapuh = (rng.random(n) < peluang_rapuh).tolist()
+    lebar = len(str(n - 1))
+    items = [
+        Barang(id=f"G{i:0{lebar}d}", ukuran=u, tipe=tabel_tipe[t], rapuh=r)
+        for i, (u, t, r) in enumerate(zip(ukuran.tolist(), tipe, rapuh))
+    ]
+    return Instance(nama=f"{kelas}_n{n}_s{seed}", kelas=kelas, seed=seed, kapasitas=kapasitas, items=items, optimum=optimum)
+
+
+def write_instance(instance: Instance, file_path: str) -> None:
+    """
+    Menulis instance ke file JSON berformat sama dengan src/data (dapat dibaca
+    `parse_problem`). Barang ditulis satu per baris tanpa membangun dokumen utuh di memori.
+    """
+    with open(file_path, 'w') as f:
+        f.write(f'{{"kapasitas_kontainer": {instance.kapasitas}, "barang": [\n')
+        for i, barang in enumerate(instance.items):
+            entri = {"id": barang.id, "ukuran": barang.ukuran}
+            if barang.tipe is not None:
+                entri["tipe"] = barang.tipe
+            if barang.rapuh:
+                entri["rapuh"] = True
+            f.write(("," if i else "") + json.dumps(entri) + "\n")
+        f.write("]}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator instance bin packing sintetis")
+    parser.add_argument("kelas", type=str, choices=list(KELAS_INSTANCE), help="Kelas instance.")
+    parser.add_argument("n", type=int, help="Jumlah barang.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed generator.")
+    parser.add_argument("--peluang_tipe", type=float, default=1.0, help="Peluang sebuah barang memiliki tipe.")
+    parser.add_argument("--peluang_rapuh", type=float, default=0.1, help="Peluang sebuah barang bersifat rapuh.")
+    parser.add_argument("--output", type=str, required=True, help="Path file JSON output.")
+    args = parser.parse_args()
+
+    instance = generate_instance(args.kelas, args.n, args.seed, args.peluang_tipe, args.peluang_rapuh)
+    write_instance(instance, args.output)
+    optimum = f", optimum {instance.optimum} kontainer" if instance.optimum is not None else ""
+    print(f"Instance {instance.nama} (kapasitas {instance.kapasitas}{optimum}) disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import sys
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.data_structures import State
+from src.core.initial_state import generate_ffd_state
+from src.core.lower_bound import compute_lower_bound
+from src.core.objective_function import ObjectiveConfig, calculate_objective
+from src.algorithms.utils.moves import get_all_neighbors
+from src.algorithms.hill_climbing import steepest_ascent_hill_climbing
+from src.algorithms.simulated_annealing import simulated_annealing
+from src.algorithms.genetic_algorithm import genetic_algorithm
+from src.algorithms.utils.genome import GenomeSpace
+from src.utils.history import HistoryRecorder
+from src.benchmark.generator import KELAS_INSTANCE, Instance, generate_instance
+
+# Benchmark komponen (ops/detik) dan algoritma (kualitas + waktu mencapai target)
+BENCHMARK_KOMPONEN = ('objective', 'neighbors', 'ffd')
+BENCHMARK_ALGORITMA = ('hc', 'sa', 'ga')
+# Jumlah barang maksimum per benchmark; instance yang lebih besar dilewati karena
+# biayanya tumbuh lebih dari linear (get_all_neighbors menyalin state per tetangga,
+# HC steepest menilai seluruh lingkungan setiap iterasi)
+BATAS_UKURAN = {'neighbors': 100, 'hc': 5_000, 'ga': 50_000}
+# Toleransi relatif sebelum perbedaan terhadap baseline dianggap regresi
+TOLERANSI_DEFAULT = {'ops_per_sec': 0.25, 'peak_memory_bytes': 0.10, 'final_score': 0.01, 'time_to_target': 0.50}
+
+
+class _TargetRecorder(HistoryRecorder):
+    # Perekam histori yang hanya mencatat kapan skor pertama kali <= target (memori konstan).
+
+    def __init__(self, target: float):
+        super().__init__()
+        self.target = target
+        self.mulai = time.perf_counter()
+        self.waktu_target: Optional[float] = None
+
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        if self.waktu_target is None and nilai <= self.target:
+            self.waktu_target = time.perf_counter() - self.mulai
+
+    def points(self) -> Tuple[List[int], List[float]]:
+        return [], []
+
+    def spawn(self, nama: str) -> '_TargetRecorder':
+        return _TargetRecorder(self.target)
+
+
+def measure_ops(fungsi: Callable[[], object], min_time: float = 0.2, rounds: int = 5) -> Tuple[float, int, float]:
+    """
+    Memanggil `fungsi` berulang kali dalam beberapa putaran hingga total minimal
+    `min_time` detik.
+
+    Laju putaran tercepat yang dilaporkan (seperti `timeit`), karena gangguan dari
+    proses lain hanya dapat memperlambat pengukuran, sehingga hasilnya lebih stabil
+    untuk dibandingkan dengan baseline.
+
+    Returns:
+        Tuple (operasi per detik, total pemanggilan, total detik).
+    """
+    terbaik = 0.0
+    total_jumlah = 0
+    total_durasi = 0.0
+    for _ in range(rounds):
+        jumlah = 0
+        mulai = time.perf_counter()
+        while True:
+            fungsi()
+            jumlah += 1
+            durasi = time.perf_counter() - mulai
+            if durasi >= min_time / rounds:
+                break
+        terbaik = max(terbaik, jumlah / durasi)
+        total_jumlah += jumlah
+        total_durasi += durasi
+    return terbaik, total_jumlah, total_durasi
+
+
+def measure_peak_memory(fungsi: Callable[[], object]) -> int:
+    # Puncak memori (byte) yang dialokasikan selama satu pemanggilan `fungsi`.
+    tracemalloc.start()
+    try:
+        fungsi()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _jalankan_algoritma(nama: str, keadaan_awal: State, instance: Instance, config: ObjectiveConfig,
+                        recorder: Optional[HistoryRecorder], seed: int, max_iter: int,
+                        time_limit: Optional[float]) -> State:
+    if nama == 'hc':
+        hasil, _ = steepest_ascent_hill_climbing(keadaan_awal, config, max_iter, recorder=recorder, time_limit=time_limit)
+    elif nama == 'sa':
+        hasil, _, _ = simulated_annealing(keadaan_awal, 1000.0, 0.99, max_iter, config, rng=random.Random(seed),
+                                          recorder=recorder, time_limit=time_limit)
+    else:
+        hasil, _ = genetic_algorithm(keadaan_awal, config, kapasitas_kontainer=instance.kapasitas,
+                                     max_generations=max(1, max_iter // 10), rng=random.Random(seed),
+                                     recorder=recorder, time_limit=time_limit)
+    return hasil
+
+
+def run_benchmarks(
+    kelas: Sequence[str],
+    sizes: Sequence[int],
+    benchmarks: Sequence[str],
+    seed: int = 0,
+    min_time: float = 0.2,
+    max_iter: int = 1000,
+    time_limit: Optional[float] = 10.0,
+    measure_memory: bool = True,
+    log: Callable[[str], None] = print
+) -> List[dict]:
+    """
+    Menjalankan benchmark untuk setiap kombinasi kelas instance, ukuran, dan benchmark.
+
+    Benchmark komponen ('objective' = calculate_objective, 'neighbors' =
+    get_all_neighbors, 'ffd' = generate_ffd_state) mencatat operasi per detik pada
+    state FFD. Benchmark algoritma ('hc', 'sa', 'ga') dimulai dari state acak dan
+    mencatat skor akhir, jumlah kontainer, serta waktu hingga skor pertama kali
+    setara atau lebih baik dari solusi FFD (`time_to_target`, None bila tidak tercapai).
+    Puncak memori diukur dengan tracemalloc pada pemanggilan terpisah, sehingga
+    overhead tracemalloc tidak memengaruhi pengukuran waktu.
+
+    Args:
+        kelas: Kelas instance (lihat `KELAS_INSTANCE`).
+        sizes: Jumlah barang per instance.
+        benchmarks: Nama benchmark dari `BENCHMARK_KOMPONEN` dan `BENCHMARK_ALGORITMA`.
+        seed: Seed instance dan algoritma.
+        min_time: Durasi minimum pengukuran ops/detik per komponen.
+        max_iter: Iterasi maksimum HC/SA (GA memakai max_iter // 10 generasi).
+        time_limit: Batas waktu per run algoritma dalam detik.
+        measure_memory: Ukur puncak memori (menjalankan setiap benchmark sekali lagi).
+        log: Fungsi untuk mencetak progres.
+
+    Returns:
+        List hasil, satu dict per (benchmark, kelas, n).
+    """
+    dikenal = BENCHMARK_KOMPONEN + BENCHMARK_ALGORITMA
+    for nama in benchmarks:
+        if nama not in dikenal:
+            raise ValueError(f"Benchmark '{nama}' tidak dikenal. Pilihan: {dikenal}")
+    config = ObjectiveConfig()
+    hasil_semua = []
+
+    for nama_kelas in kelas:
+        for n in sizes:
+            instance = generate_instance(nama_kelas, n, seed)
+            keadaan_ffd = generate_ffd_state(instance.items, instance.kapasitas)
+            skor_ffd = calculate_objective(keadaan_ffd, config)
+            batas_bawah = compute_lower_bound(instance.items, instance.kapasitas)
+            keadaan_acak: Optional[State] = None
+
+            for nama in benchmarks:
+                hasil = {'benchmark': nama, 'kelas': nama_kelas, 'n': n, 'seed': seed}
+                if n > BATAS_UKURAN.get(nama, n):
+                    hasil['status'] = 'skipped'
+                    hasil_semua.append(hasil)
+                    continue
+
+                if nama in BENCHMARK_KOMPONEN:
+                    if nama == 'objective':
+                        fungsi = lambda: calculate_objective(keadaan_ffd, config)
+                    elif nama == 'neighbors':
+                        fungsi = lambda: get_all_neighbors(keadaan_ffd)
+                    else:
+                        fungsi = lambda: generate_ffd_state(instance.items, instance.kapasitas)
+                    ops, jumlah, durasi = measure_ops(fungsi, min_time)
+                    hasil.update(ops_per_sec=ops, repeats=jumlah, seconds=durasi)
+                    log(f"{nama:>9} {nama_kelas} n={n}: {ops:.2f} ops/detik")
+                else:
+                    if keadaan_acak is None:
+                        # Distribusinya sama dengan generate_random_state, tetapi berbasis
+                        # array sehingga tetap cepat untuk instance besar
+                        ruang = GenomeSpace(instance.items, instance.kapasitas, config)
+                        keadaan_acak = ruang.decode(ruang.random_genome(random.Random(seed)))
+                    fungsi = lambda: _jalankan_algoritma(nama, keadaan_acak, instance, config, None, seed, max_iter, time_limit)
+                    recorder = _TargetRecorder(skor_ffd)
+                    mulai = time.perf_counter()
+                    keadaan_akhir = _jalankan_algoritma(nama, keadaan_acak, instance, config, recorder, seed, max_iter, time_limit)
+                    durasi = time.perf_counter() - mulai
+                    jumlah_kontainer = len(keadaan_akhir.kontainer_list)
+                    hasil.update(
+                        seconds=durasi,
+                        iterations=len(recorder),
+                        final_score=calculate_objective(keadaan_akhir, config),
+                        num_containers=jumlah_kontainer,
+                        lower_bound=batas_bawah,
+                        optimum=instance.optimum,
+                        target_score=skor_ffd,
+                        time_to_target=recorder.waktu_target,
+                    )
+                    target = f"{recorder.waktu_target:.3f} detik" if recorder.waktu_target is not None else "tidak tercapai"
+                    log(f"{nama:>9} {nama_kelas} n={n}: skor {hasil['final_score']:.4f}, "
+                        f"{jumlah_kontainer} kontainer (LB {batas_bawah}), target FFD: {target}")
+
+                if measure_memory:
+                    hasil['peak_memory_bytes'] = measure_peak_memory(fungsi)
+                hasil['status'] = 'ok'
+                hasil_semua.append(hasil)
+    return hasil_semua
+
+
+def compare_to_baseline(
+    hasil: Sequence[dict],
+    baseline: Sequence[dict],
+    toleransi: Optional[Dict[str, float]] = None
+) -> List[dict]:
+    """
+    Membandingkan hasil benchmark dengan baseline tersimpan.
+
+    Regresi dilaporkan bila ops/detik turun, atau puncak memori, skor akhir, maupun
+    waktu mencapai target naik melebihi toleransi relatifnya, atau bila target yang
+    tercapai pada baseline tidak lagi tercapai. Benchmark yang tidak ada di baseline
+    (atau dilewati) diabaikan.
+
+    Args:
+        hasil: Hasil `run_benchmarks` saat ini.
+        baseline: Hasil `run_benchmarks` yang disimpan sebelumnya.
+        toleransi: Toleransi per metrik (default `TOLERANSI_DEFAULT`).
+
+    Returns:
+        List regresi: dict berisi benchmark, kelas, n, metric, baseline, current.
+    """
+    toleransi = {**TOLERANSI_DEFAULT, **(toleransi or {})}
+    acuan = {(b['benchmark'], b['kelas'], b['n']): b for b in baseline if b.get('status') == 'ok'}
+    regresi = []
+    for h in hasil:
+        b = acuan.get((h['benchmark'], h['kelas'], h['n']))
+        if b is None or h.get('status') != 'ok':
+            continue
+        for metrik, tol in toleransi.items():
+            if metrik not in b or metrik not in h:
+                continue
+            lama, baru = b[metrik], h[metrik]
+            if metrik == 'ops_per_sec':
+                mundur = baru < lama * (1 - tol)
+            elif lama is None:
+                mundur = False
+            elif baru is None:
+                mundur = True
+            else:
+                mundur = baru > lama + abs(lama) * tol
+            if mundur:
+                regresi.append({'benchmark': h['benchmark'], 'kelas': h['kelas'], 'n': h['n'],
+                                'metric': metrik, 'baseline': lama, 'current': baru})
+    return regresi
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark komponen dan algoritma bin packing")
+    parser.add_argument("--kelas", type=str, nargs='+', default=['falkenauer_u'], choices=list(KELAS_INSTANCE), help="Kelas instance.")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[10, 100, 1000], help="Jumlah barang per instance.")
+    parser.add_argument("--benchmarks", type=str, nargs='+', default=list(BENCHMARK_KOMPONEN + BENCHMARK_ALGORITMA),
+                        choices=list(BENCHMARK_KOMPONEN + BENCHMARK_ALGORITMA), help="Benchmark yang dijalankan.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed instance dan algoritma.")
+    parser.add_argument("--min_time", type=float, default=0.2, help="Durasi minimum pengukuran ops/detik (detik).")
+    parser.add_argument("--max_iter", type=int, default=1000, help="Iterasi maksimum HC/SA (GA: max_iter // 10 generasi).")
+    parser.add_argument("--time_limit", type=float, default=10.0, help="Batas waktu per run algoritma (detik).")
+    parser.add_argument("--no_memory", action="store_true", help="Lewati pengukuran puncak memori.")
+    parser.add_argument("--output", type=str, default=None, help="File JSON hasil benchmark.")
+    parser.add_argument("--baseline", type=str, default=None, help="File JSON baseline untuk deteksi regresi.")
+    args = parser.parse_args(argv)
+
+    hasil = run_benchmarks(args.kelas, args.sizes, args.benchmarks, seed=args.seed, min_time=args.min_time,
+                           max_iter=args.max_iter, time_limit=args.time_limit, measure_memory=not args.no_memory)
+    laporan = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'args': vars(args),
+        },
+        'results': hasil,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(laporan, f, indent=2)
+        print(f"Hasil benchmark disimpan di: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+        regresi = compare_to_baseline(hasil, baseline)
+        for r in regresi:
+            print(f"REGRESI {r['benchmark']} {r['kelas']} n={r['n']}: {r['metric']} {r['baseline']} -> {r['current']}")
+        if regresi:
+            return 1
+        print("Tidak ada regresi terhadap baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
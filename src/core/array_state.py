@@ -0,0 +1,249 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.data_structures import Barang, Kontainer, State
+from src.utils.state_utils import extract_all_items, resolve_capacity
+
+# Penanda barang yang tidak dialokasikan ke kontainer mana pun
+TANPA_KONTAINER = -1
+
+# Jumlah slot header di awal buffer: [jumlah kontainer terbuka, puncak stack kontainer bebas]
+_HEADER = 2
+
+
+class TabelBarang:
+    """
+    Data barang yang tidak berubah dan dibagi oleh semua salinan `ArrayState`.
+
+    Barang diberi indeks 0..n-1 sesuai urutan `barang`, sehingga seluruh state
+    dapat direpresentasikan hanya dengan array integer.
+    """
+    __slots__ = ('barang', 'ukuran', 'kapasitas', 'indeks')
+
+    def __init__(self, barang: Sequence[Barang], kapasitas: int):
+        self.barang: Tuple[Barang, ...] = tuple(barang)
+        self.ukuran = array('q', (b.ukuran for b in self.barang))
+        self.kapasitas = kapasitas
+        self.indeks: Dict[str, int] = {b.id: idx for idx, b in enumerate(self.barang)}
+
+    def __len__(self) -> int:
+        return len(self.barang)
+
+
+class ArrayState:
+    """
+    Representasi state berbasis array integer datar sebagai alternatif `State`.
+
+    Seluruh penugasan disimpan dalam satu buffer `array('q')` yang dibagi menjadi
+    beberapa view:
+        - kontainer_dari[i]: indeks kontainer tempat barang i berada (-1 bila belum dialokasi).
+        - berikut[i], sebelum[i]: linked list barang di dalam kontainer yang sama (slot barang).
+        - kepala[b]: barang pertama di kontainer b.
+        - muatan[b], jumlah[b]: total ukuran dan jumlah barang di kontainer b.
+        - bebas: stack indeks kontainer kosong yang siap dipakai.
+
+    Pencarian kontainer sebuah barang, pemindahan, dan penukaran bernilai O(1),
+    sedangkan `salin()` hanya menduplikasi satu buffer.
+
+    Kelas ini berdiri sendiri: algoritma di `src/algorithms` dan `src.main` masih
+    bekerja pada `State`, dan konversi dilakukan dengan `dari_state`/`ke_state`.
+    """
+    __slots__ = ('tabel', '_buf', 'kontainer_dari', 'berikut', 'sebelum', 'kepala', 'muatan', 'jumlah', 'bebas')
+
+    def __init__(self, tabel: TabelBarang, buf: Optional[array] = None):
+        self.tabel = tabel
+        n = len(tabel)
+        if buf is None:
+            buf = array('q', bytes(8 * (_HEADER + 7 * n)))
+            for offset in range(_HEADER, _HEADER + 3 * n):
+                buf[offset] = TANPA_KONTAINER
+            for offset in range(_HEADER + 3 * n, _HEADER + 4 * n):
+                buf[offset] = -1
+            # Stack kontainer bebas diisi terbalik agar kontainer 0 dipakai lebih dulu
+            for posisi in range(n):
+                buf[_HEADER + 6 * n + posisi] = n - 1 - posisi
+            buf[1] = n
+        self._pasang_buffer(buf)
+
+    def _pasang_buffer(self, buf: array) -> None:
+        n = len(self.tabel)
+        self._buf = buf
+        view = memoryview(buf)
+        self.kontainer_dari = view[_HEADER:_HEADER + n]
+        self.berikut = view[_HEADER + n:_HEADER + 2 * n]
+        self.sebelum = view[_HEADER + 2 * n:_HEADER + 3 * n]
+        self.kepala = view[_HEADER + 3 * n:_HEADER + 4 * n]
+        self.muatan = view[_HEADER + 4 * n:_HEADER + 5 * n]
+        self.jumlah = view[_HEADER + 5 * n:_HEADER + 6 * n]
+        self.bebas = view[_HEADER + 6 * n:_HEADER + 7 * n]
+
+    def __getstate__(self):
+        return self.tabel, self._buf.tobytes()
+
+    def __setstate__(self, data) -> None:
+        tabel, raw = data
+        self.tabel = tabel
+        buf = array('q')
+        buf.frombytes(raw)
+        self._pasang_buffer(buf)
+
+    # Konversi
+
+    @classmethod
+    def dari_state(cls, state: State, kapasitas: Optional[int] = None, tabel: Optional[TabelBarang] = None) -> 'ArrayState':
+        """
+        Membangun `ArrayState` dari `State`.
+
+        Kontainer kosong tidak direpresentasikan. Urutan kontainer dan urutan
+        barang di dalamnya dipertahankan.
+
+        Args:
+            state: State sumber.
+            kapasitas: Kapasitas kontainer (opsional, diambil dari state bila tidak disediakan).
+            tabel: Tabel barang yang sudah ada, agar beberapa state dapat berbagi indeks yang sama.
+
+        Returns:
+            ArrayState yang ekuivalen dengan `state`.
+        """
+        if tabel is None:
+            tabel = TabelBarang(extract_all_items(state), resolve_capacity(state, kapasitas))
+        array_state = cls(tabel)
+        for kontainer in state.kontainer_list:
+            if not kontainer.barang_di_dalam:
+                continue
+            indeks_barang = [tabel.indeks[b.id] for b in kontainer.barang_di_dalam]
+            b = array_state._buka_kontainer()
+            # Sisipkan dari belakang ke kepala list agar urutan aslinya terjaga
+            for i in reversed(indeks_barang):
+                array_state._sisipkan(i, b)
+        return array_state
+
+    def ke_state(self) -> State:
+        """
+        Mengonversi kembali ke `State` dengan ID kontainer berurutan mulai dari 0.
+
+        Returns:
+            State yang ekuivalen, siap dipakai untuk pelaporan di `main.py`.
+        """
+        barang = self.tabel.barang
+        kontainer_list: List[Kontainer] = []
+        for b in range(len(self.tabel)):
+            if self.jumlah[b] == 0:
+                continue
+            kontainer_list.append(Kontainer(
+                id=len(kontainer_list),
+                kapasitas=self.tabel.kapasitas,
+                barang_di_dalam=[barang[i] for i in self.barang_di(b)],
+            ))
+        belum_dialokasi = [barang[i] for i in range(len(barang)) if self.kontainer_dari[i] == TANPA_KONTAINER]
+        return State(kontainer_list=kontainer_list, barang_belum_dialokasi=belum_dialokasi)
+
+    def salin(self) -> 'ArrayState':
+        # Salinan hanya menduplikasi satu buffer; tabel barang dibagi bersama.
+        return ArrayState(self.tabel, array('q', self._buf))
+
+    # Query O(1)
+
+    @property
+    def jumlah_kontainer(self) -> int:
+        # Jumlah kontainer yang berisi minimal satu barang.
+        return self._buf[0]
+
+    def indeks_barang(self, barang_id: str) -> int:
+        return self.tabel.indeks[barang_id]
+
+    def sisa_kapasitas(self, b: int) -> int:
+        return self.tabel.kapasitas - self.muatan[b]
+
+    def bisa_tambah_barang(self, i: int, b: int) -> bool:
+        return self.muatan[b] + self.tabel.ukuran[i] <= self.tabel.kapasitas
+
+    def barang_di(self, b: int) -> Iterator[int]:
+        # Iterasi indeks barang di dalam kontainer b.
+        i = self.kepala[b]
+        while i != -1:
+            yield i
+            i = self.berikut[i]
+
+    def kontainer_terpakai(self) -> Iterator[int]:
+        # Iterasi indeks kontainer yang tidak kosong.
+        return (b for b in range(len(self.tabel)) if self.jumlah[b] > 0)
+
+    # Mutasi
+
+    def pindahkan(self, i: int, b: int) -> None:
+        """
+        Memindahkan barang i ke kontainer b yang sudah berisi barang.
+
+        Kontainer asal yang menjadi kosong otomatis dikembalikan ke stack bebas.
+        """
+        if self.jumlah[b] == 0:
+            raise ValueError("Kontainer tujuan kosong; gunakan pindahkan_ke_kontainer_baru.")
+        asal = self.kontainer_dari[i]
+        if asal == b:
+            return
+        self._sisipkan(i, b)  # _sisipkan melepas i dari asal terlebih dahulu
+        self._tutup_jika_kosong(asal)
+
+    def pindahkan_ke_kontainer_baru(self, i: int) -> int:
+        # Memindahkan barang i ke kontainer kosong baru dan mengembalikan indeksnya.
+        # Bila i satu-satunya barang di kontainernya, kontainer itu dikembalikan apa adanya.
+        asal = self.kontainer_dari[i]
+        if asal != TANPA_KONTAINER and self.jumlah[asal] == 1:
+            return asal
+        b = self._buka_kontainer()
+        self._sisipkan(i, b)
+        self._tutup_jika_kosong(asal)
+        return b
+
+    def tukar(self, i: int, j: int) -> None:
+        # Menukar kontainer dua barang; tidak ada kontainer yang menjadi kosong.
+        bin_i = self.kontainer_dari[i]
+        bin_j = self.kontainer_dari[j]
+        if bin_i == bin_j:
+            return
+        self._sisipkan(j, bin_i)
+        self._sisipkan(i, bin_j)
+
+    def _buka_kontainer(self) -> int:
+        puncak = self._buf[1] - 1
+        if puncak < 0:
+            raise RuntimeError("Tidak ada kontainer bebas tersisa.")
+        self._buf[1] = puncak
+        self._buf[0] += 1
+        return self.bebas[puncak]
+
+    def _tutup_jika_kosong(self, b: int) -> None:
+        if b == TANPA_KONTAINER or self.jumlah[b] > 0:
+            return
+        self.bebas[self._buf[1]] = b
+        self._buf[1] += 1
+        self._buf[0] -= 1
+
+    def _lepaskan(self, i: int) -> None:
+        b = self.kontainer_dari[i]
+        if b == TANPA_KONTAINER:
+            return
+        sebelum = self.sebelum[i]
+        berikut = self.berikut[i]
+        if sebelum != -1:
+            self.berikut[sebelum] = berikut
+        else:
+            self.kepala[b] = berikut
+        if berikut != -1:
+            self.sebelum[berikut] = sebelum
+        self.muatan[b] -= self.tabel.ukuran[i]
+        self.jumlah[b] -= 1
+        self.kontainer_dari[i] = TANPA_KONTAINER
+
+    def _sisipkan(self, i: int, b: int) -> None:
+        self._lepaskan(i)
+        kepala = self.kepala[b]
+        self.sebelum[i] = -1
+        self.berikut[i] = kepala
+        if kepala != -1:
+            self.sebelum[kepala] = i
+        self.kepala[b] = i
+        self.muatan[b] += self.tabel.ukuran[i]
+        self.jumlah[b] += 1
+        self.kontainer_dari[i] = b
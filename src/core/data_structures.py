@@ -1,5 +1,21 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from hashlib import blake2b
+from typing import Dict, List, Optional
+
+MASK_64 = (1 << 64) - 1
+
+def kunci_zobrist(barang_id) -> int:
+    # Kunci acak 64-bit untuk sebuah ID barang; diturunkan dari blake2b agar sama
+    # di semua proses (tidak terpengaruh PYTHONHASHSEED).
+    return int.from_bytes(blake2b(str(barang_id).encode(), digest_size=8).digest(), 'little')
+
+def campur_hash(nilai: int) -> int:
+    # Fungsi pencampur splitmix64: mengubah hash isi kontainer sebelum dijumlahkan
+    # ke hash state, sehingga pembagian barang (bukan hanya himpunannya) berpengaruh.
+    # campur_hash(0) == 0, sehingga kontainer kosong tidak mengubah hash state.
+    nilai = ((nilai ^ (nilai >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    nilai = ((nilai ^ (nilai >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return nilai ^ (nilai >> 31)
 
 @dataclass
 class Barang:
@@ -8,47 +24,149 @@ class Barang:
     ukuran: int
     tipe: Optional[str] = None
     rapuh: bool = False
+    _kunci: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._kunci = kunci_zobrist(self.id)
 
 @dataclass
 class Kontainer:
     # Merepresentasikan satu kontainer.
+    # Agregat (muatan, muatan non-rapuh, jumlah per tipe) di-cache dan diperbarui
+    # secara inkremental, sehingga isi kontainer hanya boleh diubah melalui
+    # tambah_barang/hapus_barang, bukan langsung lewat barang_di_dalam.
     id: int
     kapasitas: int
     barang_di_dalam: List[Barang] = field(default_factory=list)
+    _muatan: int = field(default=0, init=False, repr=False, compare=False)
+    _muatan_non_rapuh: int = field(default=0, init=False, repr=False, compare=False)
+    _jumlah_rapuh: int = field(default=0, init=False, repr=False, compare=False)
+    _jumlah_tipe: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.hitung_ulang_agregat()
+
+    def hitung_ulang_agregat(self):
+        # Menghitung ulang seluruh agregat dari isi kontainer (O(jumlah barang)).
+        self._muatan = 0
+        self._muatan_non_rapuh = 0
+        self._jumlah_rapuh = 0
+        self._jumlah_tipe = {}
+        self._hash = 0
+        for barang in self.barang_di_dalam:
+            self._catat(barang, 1)
 
     @property
     def muatan_saat_ini(self) -> int:
-        # Menghitung total ukuran barang di dalam kontainer.
-        return sum(b.ukuran for b in self.barang_di_dalam)
+        # Total ukuran barang di dalam kontainer.
+        return self._muatan
 
     @property
     def sisa_kapasitas(self) -> int:
         # Menghitung sisa kapasitas yang tersedia.
-        return self.kapasitas - self.muatan_saat_ini
+        return self.kapasitas - self._muatan
+
+    @property
+    def muatan_non_rapuh(self) -> int:
+        # Total ukuran barang yang tidak rapuh.
+        return self._muatan_non_rapuh
+
+    @property
+    def jumlah_rapuh(self) -> int:
+        # Jumlah barang rapuh di dalam kontainer.
+        return self._jumlah_rapuh
+
+    @property
+    def kode_hash(self) -> int:
+        # Hash multiset isi kontainer (jumlah kunci barang mod 2^64); tidak bergantung
+        # pada ID kontainer maupun urutan barang.
+        return self._hash
+
+    @property
+    def jumlah_per_tipe(self) -> Dict[str, int]:
+        # Jumlah barang per tipe (hanya untuk dibaca).
+        return self._jumlah_tipe
+
+    def punya_tipe(self, tipe: str) -> bool:
+        # Mengecek apakah ada barang bertipe `tipe` di dalam kontainer.
+        return tipe in self._jumlah_tipe
 
     def bisa_tambah_barang(self, barang: Barang) -> bool:
         # Mengecek apakah sebuah barang masih muat.
-        return self.sisa_kapasitas >= barang.ukuran
-    
-    def tambah_barang(self, barang: Barang):
-        # Menambahkan barang ke dalam kontainer.
-        self.barang_di_dalam.append(barang)
+        return self.kapasitas - self._muatan >= barang.ukuran
+
+    def tambah_barang(self, barang: Barang, posisi: Optional[int] = None):
+        # Menambahkan barang ke dalam kontainer (di akhir, atau di `posisi` tertentu).
+        if posisi is None:
+            self.barang_di_dalam.append(barang)
+        else:
+            self.barang_di_dalam.insert(posisi, barang)
+        self._catat(barang, 1)
+
+    def hapus_barang(self, barang: Barang) -> int:
+        # Mengeluarkan barang dari dalam kontainer dan mengembalikan posisi asalnya.
+        posisi = self.barang_di_dalam.index(barang)
+        del self.barang_di_dalam[posisi]
+        self._catat(barang, -1)
+        return posisi
+
+    def salin(self) -> 'Kontainer':
+        # Menyalin kontainer beserta agregatnya tanpa menghitung ulang.
+        salinan = Kontainer.__new__(Kontainer)
+        salinan.id = self.id
+        salinan.kapasitas = self.kapasitas
+        salinan.barang_di_dalam = list(self.barang_di_dalam)
+        salinan._muatan = self._muatan
+        salinan._muatan_non_rapuh = self._muatan_non_rapuh
+        salinan._jumlah_rapuh = self._jumlah_rapuh
+        salinan._jumlah_tipe = dict(self._jumlah_tipe)
+        salinan._hash = self._hash
+        return salinan
+
+    def _catat(self, barang: Barang, arah: int):
+        # Memperbarui agregat untuk penambahan (arah=1) atau pengurangan (arah=-1).
+        self._muatan += arah * barang.ukuran
+        self._hash = (self._hash + arah * barang._kunci) & MASK_64
+        if barang.rapuh:
+            self._jumlah_rapuh += arah
+        else:
+            self._muatan_non_rapuh += arah * barang.ukuran
+        if barang.tipe is not None:
+            jumlah = self._jumlah_tipe.get(barang.tipe, 0) + arah
+            if jumlah:
+                self._jumlah_tipe[barang.tipe] = jumlah
+            else:
+                del self._jumlah_tipe[barang.tipe]
 
 @dataclass
 class State:
     # Merepresentasikan sebuah solusi lengkap (alokasi barang ke kontainer).
     kontainer_list: List[Kontainer]
     barang_belum_dialokasi: List[Barang] = field(default_factory=list)
+    _kode_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def kode_hash(self) -> int:
+        # Hash Zobrist 64-bit dari pembagian barang ke kontainer: dua state dengan
+        # pengepakan yang sama (apa pun urutan/ID kontainer dan urutan barang) memiliki
+        # hash yang sama. Dihitung sekali dalam O(jumlah kontainer), lalu diperbarui
+        # operator gerakan dalam O(1) melalui `perbarui_hash_kontainer`.
+        if self._kode_hash is None:
+            self._kode_hash = sum(campur_hash(k.kode_hash) for k in self.kontainer_list) & MASK_64
+        return self._kode_hash
+
+    def perbarui_hash_kontainer(self, hash_lama: int, hash_baru: int) -> None:
+        # Mencatat bahwa isi sebuah kontainer berubah dari `hash_lama` menjadi `hash_baru`.
+        # Kode yang mengubah isi kontainer state ini secara langsung wajib memanggilnya.
+        if self._kode_hash is not None:
+            self._kode_hash = (self._kode_hash - campur_hash(hash_lama) + campur_hash(hash_baru)) & MASK_64
 
     def salin(self) -> 'State':
         # Membuat deep copy dari state saat ini untuk eksplorasi oleh algoritma.
-        return State(
-            kontainer_list=[
-                Kontainer(
-                    id=k.id,
-                    kapasitas=k.kapasitas,
-                    barang_di_dalam=list(k.barang_di_dalam)
-                ) for k in self.kontainer_list
-            ],
+        salinan = State(
+            kontainer_list=[k.salin() for k in self.kontainer_list],
             barang_belum_dialokasi=list(self.barang_belum_dialokasi)
-        )
\ No newline at end of file
+        )
+        salinan._kode_hash = self._kode_hash
+        return salinan
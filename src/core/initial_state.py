@@ -1,10 +1,36 @@
 import random
 from typing import List, Sequence
 from src.core.data_structures import Barang, Kontainer, State
+from src.core.packing import pack_items
 from src.utils.state_utils import renumber_container_ids
 
 def generate_ffd_state(daftar_barang: list[Barang], kapasitas_kontainer: int) -> State:
     # Membuat state awal menggunakan heuristik First Fit Decreasing (FFD).
+    # Barang diurutkan dari yang terbesar ke terkecil, lalu dimasukkan ke kontainer pertama yang muat.
+    return generate_packed_state(daftar_barang, kapasitas_kontainer, 'first_fit')
+
+def generate_bfd_state(daftar_barang: list[Barang], kapasitas_kontainer: int) -> State:
+    # Membuat state awal menggunakan heuristik Best Fit Decreasing (BFD):
+    # setiap barang masuk ke kontainer dengan sisa kapasitas terkecil yang masih muat.
+    return generate_packed_state(daftar_barang, kapasitas_kontainer, 'best_fit')
+
+def generate_wfd_state(daftar_barang: list[Barang], kapasitas_kontainer: int) -> State:
+    # Membuat state awal menggunakan heuristik Worst Fit Decreasing (WFD):
+    # setiap barang masuk ke kontainer dengan sisa kapasitas terbesar bila muat.
+    return generate_packed_state(daftar_barang, kapasitas_kontainer, 'worst_fit')
+
+def generate_packed_state(daftar_barang: Sequence[Barang], kapasitas_kontainer: int, strategi: str) -> State:
+    """
+    Membuat state awal dengan heuristik pengepakan dari `src.core.packing`.
+
+    Args:
+        daftar_barang: Barang yang akan ditempatkan.
+        kapasitas_kontainer: Kapasitas setiap kontainer.
+        strategi: 'first_fit', 'best_fit', atau 'worst_fit' (selalu varian Decreasing).
+
+    Returns:
+        State dengan ID kontainer berurutan; barang yang terlalu besar tidak dialokasikan.
+    """
     # Pisahkan barang yang bisa dimuat dan yang tidak (karena terlalu besar)
     barang_untuk_ditempatkan = []
     barang_belum_dialokasi = []
@@ -14,28 +40,11 @@ def generate_ffd_state(daftar_barang: list[Barang], kapasitas_kontainer: int) ->
         else:
             barang_untuk_ditempatkan.append(barang)
 
-    # Barang diurutkan dari yang terbesar ke terkecil, lalu dimasukkan ke kontainer pertama yang muat.
-    barang_diurutkan = sorted(barang_untuk_ditempatkan, key=lambda b: b.ukuran, reverse=True)
-
-    kontainer_list: list[Kontainer] = []
-    id_kontainer_selanjutnya = 0
-
-    for barang in barang_diurutkan:
-        ditempatkan = False
-        # Coba tempatkan di kontainer yang ada
-        for kontainer in kontainer_list:
-            if kontainer.bisa_tambah_barang(barang):
-                kontainer.tambah_barang(barang)
-                ditempatkan = True
-                break
-        
-        # Jika tidak muat di mana pun, buat kontainer baru
-        if not ditempatkan:
-            kontainer_baru = Kontainer(id=id_kontainer_selanjutnya, kapasitas=kapasitas_kontainer)
-            kontainer_baru.tambah_barang(barang)
-            kontainer_list.append(kontainer_baru)
-            id_kontainer_selanjutnya += 1
-            
+    kelompok = pack_items([b.ukuran for b in barang_untuk_ditempatkan], kapasitas_kontainer, strategi)
+    kontainer_list = [
+        Kontainer(id=idx, kapasitas=kapasitas_kontainer, barang_di_dalam=[barang_untuk_ditempatkan[i] for i in isi])
+        for idx, isi in enumerate(kelompok)
+    ]
     return State(kontainer_list=kontainer_list, barang_belum_dialokasi=barang_belum_dialokasi)
 
 def generate_random_state(items: Sequence[Barang], kapasitas: int, rng: random.Random) -> State:
@@ -73,7 +82,7 @@ def generate_random_state(items: Sequence[Barang], kapasitas: int, rng: random.R
                 kandidat_kontainer = rng.sample(kontainer_list, len(kontainer_list))
                 for kontainer in kandidat_kontainer:
                     if kontainer.bisa_tambah_barang(barang):
-                        kontainer.barang_di_dalam.append(barang)
+                        kontainer.tambah_barang(barang)
                         ditempatkan = True
                         break
             
@@ -0,0 +1,84 @@
+import bisect
+from itertools import accumulate
+from typing import Optional, Sequence
+
+from src.core.data_structures import Barang
+
+
+def lower_bound_l1(ukuran: Sequence[int], kapasitas: int) -> int:
+    # Batas bawah kontinu L1: ceil(total ukuran / kapasitas).
+    return -(-sum(ukuran) // kapasitas)
+
+
+def lower_bound_l2(ukuran: Sequence[int], kapasitas: int) -> int:
+    """
+    Menghitung batas bawah L2 Martello-Toth dalam O(n log n).
+
+    Untuk setiap ambang alpha (0 atau ukuran barang <= kapasitas/2), barang dibagi menjadi
+    J1 = {s > C - alpha}, J2 = {C/2 < s <= C - alpha}, dan J3 = {alpha <= s <= C/2}.
+    Barang J1 dan J2 masing-masing butuh kontainer sendiri, sedangkan barang J3 hanya
+    dapat memakai sisa ruang kontainer J2 sebelum membuka kontainer baru.
+
+    Args:
+        ukuran: Ukuran barang; semuanya harus <= kapasitas.
+        kapasitas: Kapasitas setiap kontainer.
+
+    Returns:
+        Nilai L2 (selalu >= L1).
+    """
+    terurut = sorted(ukuran)
+    prefix = [0, *accumulate(terurut)]
+    n = len(terurut)
+    batas_setengah = bisect.bisect_right(terurut, kapasitas // 2)  # indeks pertama dengan 2s > C
+
+    kandidat_alpha = {0, *terurut[:batas_setengah]}
+    terbaik = 0
+    for alpha in kandidat_alpha:
+        batas_j1 = bisect.bisect_right(terurut, kapasitas - alpha)
+        awal_j3 = bisect.bisect_left(terurut, alpha)
+        jumlah_j1 = n - batas_j1
+        jumlah_j2 = max(batas_j1 - batas_setengah, 0)
+        total_j2 = prefix[batas_j1] - prefix[batas_setengah] if jumlah_j2 else 0
+        total_j3 = prefix[batas_setengah] - prefix[awal_j3] if awal_j3 < batas_setengah else 0
+        sisa_j3 = total_j3 - (jumlah_j2 * kapasitas - total_j2)
+        nilai = jumlah_j1 + jumlah_j2 + max(0, -(-sisa_j3 // kapasitas))
+        terbaik = max(terbaik, nilai)
+    return max(terbaik, lower_bound_l1(terurut, kapasitas))
+
+
+def compute_lower_bound(daftar_barang: Sequence[Barang], kapasitas: int) -> int:
+    """
+    Menghitung batas bawah jumlah kontainer untuk sebuah problem (max(L1, L2)).
+
+    Barang yang lebih besar dari kapasitas tidak pernah dialokasikan, sehingga
+    tidak diperhitungkan.
+
+    Args:
+        daftar_barang: Semua barang dalam problem.
+        kapasitas: Kapasitas setiap kontainer.
+
+    Returns:
+        Jumlah kontainer minimum yang mungkin untuk solusi valid.
+    """
+    ukuran = [b.ukuran for b in daftar_barang if b.ukuran <= kapasitas]
+    if not ukuran:
+        return 0
+    return lower_bound_l2(ukuran, kapasitas)
+
+
+def reached_lower_bound(skor: float, jumlah_kontainer: int, lower_bound: Optional[int]) -> bool:
+    """
+    Mengecek apakah sebuah solusi sudah terbukti optimal dalam jumlah kontainer.
+
+    Skor = jumlah kontainer + bonus kepadatan (<= 1) + penalti (>= 500.000), sehingga
+    skor <= jumlah kontainer + 1 berarti solusi bebas penalti.
+
+    Args:
+        skor: Skor fungsi objektif solusi.
+        jumlah_kontainer: Jumlah kontainer yang dipakai solusi.
+        lower_bound: Batas bawah problem, atau None jika penghentian dini dinonaktifkan.
+
+    Returns:
+        True jika pencarian boleh dihentikan.
+    """
+    return lower_bound is not None and jumlah_kontainer <= lower_bound and skor <= jumlah_kontainer + 1
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
 from src.core.data_structures import State, Barang, Kontainer
 
 # Konfigurasi & Bobot Penalti
@@ -13,60 +14,270 @@ class ObjectiveConfig:
     incompatible_pairs: list[tuple[str, str]] = field(default_factory=lambda: [('makanan', 'kimia')])
     use_fragile_constraint: bool = False
     use_incompatible_constraint: bool = False
+    # Jika aktif, setiap evaluasi delta dicocokkan dengan perhitungan ulang penuh (untuk debugging).
+    verify_delta: bool = False
+
+@dataclass
+class ScoreComponents:
+    """
+    Komponen penyusun skor fungsi objektif.
+
+    Semua komponen berupa bilangan bulat sehingga dapat diperbarui secara
+    inkremental tanpa galat pembulatan, dan skor yang dihasilkan `score()`
+    identik dengan hasil perhitungan ulang penuh.
+
+    Attributes:
+        jumlah_kontainer: Jumlah kontainer di dalam state.
+        kepadatan: Peta kapasitas -> (jumlah kontainer, total kuadrat muatan).
+        kelebihan_muatan: Total unit muatan yang melebihi kapasitas.
+        pelanggaran_rapuh: Jumlah kontainer yang melanggar constraint barang rapuh.
+        pelanggaran_inkompatibel: Jumlah pasangan tipe tidak kompatibel yang terlanggar.
+    """
+    jumlah_kontainer: int = 0
+    kepadatan: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+    kelebihan_muatan: int = 0
+    pelanggaran_rapuh: int = 0
+    pelanggaran_inkompatibel: int = 0
+
+    def score(self) -> float:
+        # Menggabungkan komponen menjadi skor total (semakin kecil semakin baik).
+        # Jika ada kelebihan muatan, kembalikan skor yang sangat tinggi
+        # agar pencarian tidak mengeksplorasi solusi tidak valid.
+        if self.kelebihan_muatan > 0:
+            return float(self.kelebihan_muatan * OVERFILL_PENALTY_MULTIPLIER)
+
+        # Skor kepadatan: rata-rata dari (1 - kepadatan^2) setiap kontainer,
+        # dihitung dari total kuadrat muatan per kelompok kapasitas.
+        total_density_score = 0.0
+        for kapasitas in sorted(self.kepadatan):
+            jumlah, kuadrat_muatan = self.kepadatan[kapasitas]
+            total_density_score += (jumlah * kapasitas * kapasitas - kuadrat_muatan) / (kapasitas * kapasitas)
+        density_bonus = total_density_score / self.jumlah_kontainer if self.jumlah_kontainer > 0 else 0
+
+        # Skor utama adalah jumlah kontainer. Bonus kepadatan mengurangi skor sedikit.
+        # Penalti ditambahkan dengan bobot besar untuk menghindari solusi tidak valid.
+        return (self.jumlah_kontainer + density_bonus
+                + float(self.pelanggaran_rapuh * FRAGILE_PENALTY)
+                + float(self.pelanggaran_inkompatibel * INCOMPATIBLE_PENALTY))
+
+    def salin(self) -> 'ScoreComponents':
+        return ScoreComponents(
+            jumlah_kontainer=self.jumlah_kontainer,
+            kepadatan=dict(self.kepadatan),
+            kelebihan_muatan=self.kelebihan_muatan,
+            pelanggaran_rapuh=self.pelanggaran_rapuh,
+            pelanggaran_inkompatibel=self.pelanggaran_inkompatibel,
+        )
+
+    def _tambah_kontainer(self, kapasitas: int, muatan: int, arah: int) -> None:
+        # Menambah (arah=1) atau mengurangi (arah=-1) kontribusi satu kontainer pada
+        # jumlah kontainer, skor kepadatan, dan kelebihan muatan.
+        jumlah, kuadrat_muatan = self.kepadatan.get(kapasitas, (0, 0))
+        jumlah += arah
+        kuadrat_muatan += arah * muatan * muatan
+        if jumlah:
+            self.kepadatan[kapasitas] = (jumlah, kuadrat_muatan)
+        else:
+            self.kepadatan.pop(kapasitas, None)
+        self.jumlah_kontainer += arah
+        if muatan > kapasitas:
+            self.kelebihan_muatan += arah * (muatan - kapasitas)
 
 def calculate_objective(state: State, config: ObjectiveConfig) -> float:
     # Menghitung skor total dari sebuah state berdasarkan konfigurasi.
-    # 1. Penalti Kapasitas Berlebih (Wajib)
-    overfill_penalty = 0.0
+    return compute_components(state, config).score()
+
+def compute_components(state: State, config: ObjectiveConfig) -> ScoreComponents:
+    """
+    Menghitung seluruh komponen skor dari sebuah state (O(jumlah kontainer)).
+
+    Args:
+        state: State yang dievaluasi.
+        config: Konfigurasi fungsi objektif.
+
+    Returns:
+        ScoreComponents yang dapat diperbarui secara inkremental oleh evaluasi delta.
+    """
+    komponen = ScoreComponents()
     for kontainer in state.kontainer_list:
-        if kontainer.muatan_saat_ini > kontainer.kapasitas:
-            overfill_penalty += (kontainer.muatan_saat_ini - kontainer.kapasitas) * OVERFILL_PENALTY_MULTIPLIER
-    
-    # Jika ada penalti kelebihan muatan, langsung kembalikan skor yang sangat tinggi
-    # Ini adalah optimisasi agar pencarian tidak mengeksplorasi solusi tidak valid
-    if overfill_penalty > 0:
-        return overfill_penalty
-
-    # 2. Skor Jumlah Kontainer (Wajib)
-    container_score = len(state.kontainer_list)
-
-    # 3. Skor Kepadatan (Bonus untuk mendorong solusi rapi)
-    # Semakin padat, semakin kecil (baik) skornya.
-    # Rata-rata dari (1 - kepadatan^2) untuk setiap kontainer.
-    total_density_score = 0
-    if container_score > 0:
-        for k in state.kontainer_list:
-            density = k.muatan_saat_ini / k.kapasitas
-            total_density_score += (1 - density**2)
-        density_bonus = total_density_score / container_score
+        # 1. Jumlah kontainer, kepadatan, dan penalti kapasitas berlebih
+        komponen._tambah_kontainer(kontainer.kapasitas, kontainer.muatan_saat_ini, 1)
+        # 2. Penalti untuk batasan bonus
+        rapuh, inkompatibel = _pelanggaran_kontainer(kontainer, config)
+        komponen.pelanggaran_rapuh += rapuh
+        komponen.pelanggaran_inkompatibel += inkompatibel
+    return komponen
+
+def relocation_delta(
+    state: State,
+    components: ScoreComponents,
+    kontainer_asal: Kontainer,
+    barang: Barang,
+    kontainer_tujuan: Optional[Kontainer],
+    config: ObjectiveConfig
+) -> ScoreComponents:
+    """
+    Menghitung komponen skor setelah sebuah barang dipindahkan, dalam O(1).
+
+    Kontainer asal yang menjadi kosong dianggap dihapus, sesuai perilaku
+    operator pemindahan di `moves.py`.
+
+    Args:
+        state: State saat ini (hanya dipakai dalam mode verifikasi).
+        components: Komponen skor dari `state`.
+        kontainer_asal: Kontainer tempat barang berada.
+        barang: Barang yang dipindahkan.
+        kontainer_tujuan: Kontainer tujuan, atau None untuk kontainer baru.
+        config: Konfigurasi fungsi objektif.
+
+    Returns:
+        ScoreComponents baru; `components` tidak diubah.
+    """
+    if kontainer_tujuan is kontainer_asal:
+        return components.salin()
+
+    hasil = components.salin()
+    ukuran = barang.ukuran
+
+    # Kontainer asal kehilangan satu barang dan dihapus bila menjadi kosong
+    _kurangi_pelanggaran(hasil, kontainer_asal, config)
+    hasil._tambah_kontainer(kontainer_asal.kapasitas, kontainer_asal.muatan_saat_ini, -1)
+    if len(kontainer_asal.barang_di_dalam) > 1:
+        hasil._tambah_kontainer(kontainer_asal.kapasitas, kontainer_asal.muatan_saat_ini - ukuran, 1)
+        _tambah_pelanggaran(hasil, kontainer_asal, config, keluar=barang)
+
+    # Kontainer tujuan (atau kontainer baru) menerima barang
+    if kontainer_tujuan is None:
+        hasil._tambah_kontainer(kontainer_asal.kapasitas, ukuran, 1)
+        _tambah_pelanggaran(hasil, None, config, masuk=barang)
     else:
-        density_bonus = 0
+        _kurangi_pelanggaran(hasil, kontainer_tujuan, config)
+        hasil._tambah_kontainer(kontainer_tujuan.kapasitas, kontainer_tujuan.muatan_saat_ini, -1)
+        hasil._tambah_kontainer(kontainer_tujuan.kapasitas, kontainer_tujuan.muatan_saat_ini + ukuran, 1)
+        _tambah_pelanggaran(hasil, kontainer_tujuan, config, masuk=barang)
+
+    if config.verify_delta:
+        _verifikasi_delta(state, hasil, config, [(kontainer_asal, barang, kontainer_tujuan)])
+    return hasil
+
+def swap_delta(
+    state: State,
+    components: ScoreComponents,
+    kontainer1: Kontainer,
+    barang1: Barang,
+    kontainer2: Kontainer,
+    barang2: Barang,
+    config: ObjectiveConfig
+) -> ScoreComponents:
+    """
+    Menghitung komponen skor setelah dua barang dari dua kontainer ditukar, dalam O(1).
+
+    Args:
+        state: State saat ini (hanya dipakai dalam mode verifikasi).
+        components: Komponen skor dari `state`.
+        kontainer1: Kontainer tempat `barang1` berada.
+        barang1: Barang pertama.
+        kontainer2: Kontainer tempat `barang2` berada.
+        barang2: Barang kedua.
+        config: Konfigurasi fungsi objektif.
+
+    Returns:
+        ScoreComponents baru; `components` tidak diubah.
+    """
+    if kontainer1 is kontainer2:
+        return components.salin()
+
+    hasil = components.salin()
+    for kontainer, keluar, masuk in ((kontainer1, barang1, barang2), (kontainer2, barang2, barang1)):
+        _kurangi_pelanggaran(hasil, kontainer, config)
+        hasil._tambah_kontainer(kontainer.kapasitas, kontainer.muatan_saat_ini, -1)
+        hasil._tambah_kontainer(kontainer.kapasitas, kontainer.muatan_saat_ini - keluar.ukuran + masuk.ukuran, 1)
+        _tambah_pelanggaran(hasil, kontainer, config, keluar=keluar, masuk=masuk)
 
-    # Penalti untuk Batasan Bonus
-    fragile_penalty = 0.0
+    if config.verify_delta:
+        _verifikasi_delta(state, hasil, config, [(kontainer1, barang1, kontainer2), (kontainer2, barang2, kontainer1)])
+    return hasil
+
+def _pelanggaran_kontainer(
+    kontainer: Optional[Kontainer],
+    config: ObjectiveConfig,
+    keluar: Optional[Barang] = None,
+    masuk: Optional[Barang] = None
+) -> Tuple[int, int]:
+    # Menghitung (pelanggaran rapuh, pelanggaran inkompatibel) sebuah kontainer,
+    # opsional setelah satu barang keluar dan/atau satu barang masuk, tanpa mengubahnya.
+    rapuh = 0
     if config.use_fragile_constraint:
-        for k in state.kontainer_list:
-            # Cek apakah ada barang rapuh di kontainer ini
-            if any(b.rapuh for b in k.barang_di_dalam):
-                # Hitung total ukuran barang non-rapuh
-                muatan_non_rapuh = sum(b.ukuran for b in k.barang_di_dalam if not b.rapuh)
-                if muatan_non_rapuh > config.fragile_threshold:
-                    fragile_penalty += FRAGILE_PENALTY
-
-    incompatible_penalty = 0.0
+        jumlah_rapuh = kontainer.jumlah_rapuh if kontainer is not None else 0
+        muatan_non_rapuh = kontainer.muatan_non_rapuh if kontainer is not None else 0
+        for barang, arah in ((keluar, -1), (masuk, 1)):
+            if barang is None:
+                continue
+            if barang.rapuh:
+                jumlah_rapuh += arah
+            else:
+                muatan_non_rapuh += arah * barang.ukuran
+        # Ada barang rapuh dan total ukuran barang non-rapuh melewati batas
+        if jumlah_rapuh > 0 and muatan_non_rapuh > config.fragile_threshold:
+            rapuh = 1
+
+    inkompatibel = 0
     if config.use_incompatible_constraint:
-        for k in state.kontainer_list:
-            tipe_barang = {b.tipe for b in k.barang_di_dalam if b.tipe is not None}
-            # Cek setiap pasangan tipe yang tidak kompatibel
-            for pair in config.incompatible_pairs:
-                if pair[0] in tipe_barang and pair[1] in tipe_barang:
-                    incompatible_penalty += INCOMPATIBLE_PENALTY
-
-    # Kombinasi Skor Final
-    # Skor utama adalah jumlah kontainer. Bonus kepadatan mengurangi skor sedikit.
-    # Penalti ditambahkan dengan bobot besar untuk menghindari solusi tidak valid.
-    total_score = (container_score + density_bonus + 
-                   fragile_penalty + incompatible_penalty)
-    
-    return total_score
+        jumlah_tipe = kontainer.jumlah_per_tipe if kontainer is not None else {}
+
+        def punya_tipe(tipe: str) -> bool:
+            jumlah = jumlah_tipe.get(tipe, 0)
+            if keluar is not None and keluar.tipe == tipe:
+                jumlah -= 1
+            if masuk is not None and masuk.tipe == tipe:
+                jumlah += 1
+            return jumlah > 0
+
+        # Cek setiap pasangan tipe yang tidak kompatibel
+        for pair in config.incompatible_pairs:
+            if punya_tipe(pair[0]) and punya_tipe(pair[1]):
+                inkompatibel += 1
+    return rapuh, inkompatibel
+
+def _kurangi_pelanggaran(komponen: ScoreComponents, kontainer: Kontainer, config: ObjectiveConfig) -> None:
+    rapuh, inkompatibel = _pelanggaran_kontainer(kontainer, config)
+    komponen.pelanggaran_rapuh -= rapuh
+    komponen.pelanggaran_inkompatibel -= inkompatibel
+
+def _tambah_pelanggaran(
+    komponen: ScoreComponents,
+    kontainer: Optional[Kontainer],
+    config: ObjectiveConfig,
+    keluar: Optional[Barang] = None,
+    masuk: Optional[Barang] = None
+) -> None:
+    rapuh, inkompatibel = _pelanggaran_kontainer(kontainer, config, keluar=keluar, masuk=masuk)
+    komponen.pelanggaran_rapuh += rapuh
+    komponen.pelanggaran_inkompatibel += inkompatibel
+
+def _verifikasi_delta(
+    state: State,
+    hasil: ScoreComponents,
+    config: ObjectiveConfig,
+    pemindahan: Sequence[Tuple[Kontainer, Barang, Optional[Kontainer]]]
+) -> None:
+    # Menerapkan pemindahan pada salinan state lalu membandingkan hasil delta
+    # dengan perhitungan ulang penuh.
+    salinan = state.salin()
+    posisi = {id(k): idx for idx, k in enumerate(state.kontainer_list)}
+    kosong = []
+    for asal, barang, tujuan in pemindahan:
+        asal_baru = salinan.kontainer_list[posisi[id(asal)]]
+        asal_baru.hapus_barang(barang)
+        if tujuan is None:
+            salinan.kontainer_list.append(Kontainer(id=-1, kapasitas=asal.kapasitas, barang_di_dalam=[barang]))
+        else:
+            salinan.kontainer_list[posisi[id(tujuan)]].tambah_barang(barang)
+        kosong.append(asal_baru)
+    for asal_baru in kosong:
+        if not asal_baru.barang_di_dalam:
+            salinan.kontainer_list = [k for k in salinan.kontainer_list if k is not asal_baru]
 
+    harapan = compute_components(salinan, config)
+    if harapan != hasil:
+        raise AssertionError(f"Evaluasi delta tidak konsisten: delta={hasil}, perhitungan penuh={harapan}")
@@ -0,0 +1,202 @@
+import heapq
+from typing import Dict, List, Optional, Sequence
+
+# Strategi penempatan yang didukung oleh pack_items
+STRATEGI_PENEMPATAN = ('first_fit', 'best_fit', 'worst_fit')
+
+
+class CapacityTree:
+    """
+    Segment tree maksimum atas sisa kapasitas setiap slot kontainer.
+
+    Mendukung pencarian slot paling kiri yang sisa kapasitasnya masih cukup
+    (query First-Fit) dan pembaruan sisa kapasitas satu slot, masing-masing
+    dalam O(log n).
+    """
+
+    def __init__(self, jumlah_slot: int, nilai_awal: int):
+        ukuran = 1
+        while ukuran < max(jumlah_slot, 1):
+            ukuran *= 2
+        self._ukuran = ukuran
+        self._jumlah_slot = jumlah_slot
+        # Daun di luar jumlah_slot diberi -1 agar tidak pernah terpilih
+        self._pohon = [-1] * (2 * ukuran)
+        for slot in range(jumlah_slot):
+            self._pohon[ukuran + slot] = nilai_awal
+        for node in range(ukuran - 1, 0, -1):
+            self._pohon[node] = max(self._pohon[2 * node], self._pohon[2 * node + 1])
+
+    def __len__(self) -> int:
+        return self._jumlah_slot
+
+    def perbesar(self, jumlah_slot: int, nilai_awal: int) -> None:
+        # Menambah slot hingga `jumlah_slot` (slot baru bernilai `nilai_awal`) dengan
+        # membangun ulang pohon; nilai slot lama dipertahankan. O(jumlah_slot).
+        if jumlah_slot <= self._jumlah_slot:
+            return
+        nilai_lama = [self[slot] for slot in range(self._jumlah_slot)]
+        self.__init__(jumlah_slot, nilai_awal)
+        for slot, nilai in enumerate(nilai_lama):
+            self._pohon[self._ukuran + slot] = nilai
+        for node in range(self._ukuran - 1, 0, -1):
+            self._pohon[node] = max(self._pohon[2 * node], self._pohon[2 * node + 1])
+
+    def __getitem__(self, slot: int) -> int:
+        return self._pohon[self._ukuran + slot]
+
+    @property
+    def maksimum(self) -> int:
+        # Sisa kapasitas terbesar di antara semua slot.
+        return self._pohon[1]
+
+    def perbarui(self, slot: int, nilai: int) -> None:
+        # Mengganti sisa kapasitas sebuah slot lalu memperbarui node di atasnya.
+        pohon = self._pohon
+        node = self._ukuran + slot
+        pohon[node] = nilai
+        node //= 2
+        while node:
+            baru = max(pohon[2 * node], pohon[2 * node + 1])
+            if pohon[node] == baru:
+                break
+            pohon[node] = baru
+            node //= 2
+
+    def cari_pertama(self, minimal: int) -> int:
+        # Mengembalikan slot paling kiri dengan sisa kapasitas >= minimal, atau -1.
+        pohon = self._pohon
+        if pohon[1] < minimal:
+            return -1
+        node = 1
+        while node < self._ukuran:
+            node *= 2
+            if pohon[node] < minimal:
+                node += 1
+        return node - self._ukuran
+
+
+class BestFitIndex:
+    """
+    Indeks kontainer menurut sisa kapasitas untuk query Best Fit.
+
+    Kontainer dikelompokkan per sisa kapasitas. `CapacityTree` atas nilai sisa
+    kapasitas (slot s bernilai s bila ada kontainer bersisa s) menemukan kelompok
+    tidak kosong terkecil yang masih muat, dan min-heap per kelompok memutus seri ke
+    ID terkecil. Penambahan, penghapusan, dan pencarian masing-masing O(log kapasitas)
+    teramortisasi; memori O(kapasitas + jumlah kontainer terindeks).
+    """
+
+    def __init__(self, kapasitas: int):
+        self._pohon = CapacityTree(kapasitas + 1, -1)
+        self._per_sisa: Dict[int, List[int]] = {}
+        self._jumlah_per_sisa: Dict[int, int] = {}
+        self._sisa: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._sisa)
+
+    def __contains__(self, kontainer_id: int) -> bool:
+        return kontainer_id in self._sisa
+
+    def tambah(self, kontainer_id: int, sisa: int) -> None:
+        # Mendaftarkan kontainer (yang belum terindeks) dengan sisa kapasitasnya.
+        self._sisa[kontainer_id] = sisa
+        heapq.heappush(self._per_sisa.setdefault(sisa, []), kontainer_id)
+        self._jumlah_per_sisa[sisa] = self._jumlah_per_sisa.get(sisa, 0) + 1
+        if self._jumlah_per_sisa[sisa] == 1:
+            self._pohon.perbarui(sisa, sisa)
+
+    def hapus(self, kontainer_id: int) -> None:
+        # Menghapus kontainer dari indeks; entri heap-nya dibuang saat tiba di puncak.
+        sisa = self._sisa.pop(kontainer_id)
+        self._jumlah_per_sisa[sisa] -= 1
+        if self._jumlah_per_sisa[sisa] == 0:
+            del self._jumlah_per_sisa[sisa]
+            del self._per_sisa[sisa]
+            self._pohon.perbarui(sisa, -1)
+
+    def cari(self, minimal: int) -> Optional[int]:
+        # ID kontainer dengan sisa kapasitas terkecil >= minimal (seri: ID terkecil), atau None.
+        sisa = self._pohon.cari_pertama(minimal)
+        if sisa < 0:
+            return None
+        heap = self._per_sisa[sisa]
+        while self._sisa.get(heap[0]) != sisa:
+            heapq.heappop(heap)
+        return heap[0]
+
+
+def pack_items(
+    ukuran: Sequence[int],
+    kapasitas: int,
+    strategi: str = 'first_fit',
+    decreasing: bool = True
+) -> List[List[int]]:
+    """
+    Mengepak barang ke kontainer dengan heuristik First/Best/Worst Fit.
+
+    First Fit memakai `CapacityTree` (O(log n) per barang); Best Fit memakai
+    `BestFitIndex` (O(log kapasitas) per barang); Worst Fit memakai max-heap.
+    Seri selalu diputus ke kontainer yang dibuka paling awal.
+
+    Args:
+        ukuran: Ukuran setiap barang; tidak boleh ada yang melebihi kapasitas.
+        kapasitas: Kapasitas setiap kontainer.
+        strategi: Salah satu dari 'first_fit', 'best_fit', 'worst_fit'.
+        decreasing: Urutkan barang dari yang terbesar sebelum ditempatkan (varian "Decreasing").
+
+    Returns:
+        List kontainer sesuai urutan dibuka, masing-masing berisi indeks barang
+        sesuai urutan penempatan.
+    """
+    if strategi not in STRATEGI_PENEMPATAN:
+        raise ValueError(f"Strategi penempatan '{strategi}' tidak dikenal. Pilihan: {STRATEGI_PENEMPATAN}")
+    if any(u > kapasitas for u in ukuran):
+        raise ValueError("Semua barang harus muat di dalam satu kontainer kosong.")
+
+    urutan = sorted(range(len(ukuran)), key=lambda i: ukuran[i], reverse=True) if decreasing else range(len(ukuran))
+    kontainer: List[List[int]] = []
+
+    if strategi == 'first_fit':
+        # Slot yang belum dibuka bernilai kapasitas penuh, sehingga query paling kiri
+        # otomatis membuka kontainer baru bila tidak ada kontainer terbuka yang muat.
+        pohon = CapacityTree(len(ukuran), kapasitas)
+        for i in urutan:
+            slot = pohon.cari_pertama(ukuran[i])
+            if slot == len(kontainer):
+                kontainer.append([])
+            kontainer[slot].append(i)
+            pohon.perbarui(slot, pohon[slot] - ukuran[i])
+
+    elif strategi == 'best_fit':
+        # Kontainer yang sudah penuh tidak didaftarkan kembali ke indeks
+        indeks = BestFitIndex(kapasitas)
+        sisa: List[int] = []
+        for i in urutan:
+            slot = indeks.cari(ukuran[i])
+            if slot is None:
+                slot = len(kontainer)
+                kontainer.append([])
+                sisa.append(kapasitas)
+            else:
+                indeks.hapus(slot)
+            kontainer[slot].append(i)
+            sisa[slot] -= ukuran[i]
+            if sisa[slot] > 0:
+                indeks.tambah(slot, sisa[slot])
+
+    else:
+        # Max-heap (sisa kapasitas dinegasikan, indeks kontainer)
+        heap: List[tuple] = []
+        for i in urutan:
+            if heap and -heap[0][0] >= ukuran[i]:
+                sisa_negatif, slot = heap[0]
+                kontainer[slot].append(i)
+                heapq.heapreplace(heap, (sisa_negatif + ukuran[i], slot))
+            else:
+                slot = len(kontainer)
+                kontainer.append([i])
+                heapq.heappush(heap, (ukuran[i] - kapasitas, slot))
+
+    return kontainer
@@ -0,0 +1,385 @@
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Union
+
+from src.core.data_structures import Barang, State
+from src.core.initial_state import generate_ffd_state, generate_bfd_state, generate_wfd_state, generate_random_state
+from src.core.objective_function import ObjectiveConfig, calculate_objective
+from src.core.lower_bound import compute_lower_bound
+from src.utils.history import History, HistoryRecorder
+from src.utils.anytime import CancelToken
+from src.algorithms.simulated_annealing import simulated_annealing
+from src.algorithms.parallel_tempering import parallel_tempering
+from src.algorithms.utils.cooling import JADWAL_PENDINGINAN, calibrate_initial_temperature, create_schedule
+from src.algorithms.genetic_algorithm import genetic_algorithm
+from src.algorithms.tabu_search import tabu_search
+from src.algorithms.island_model import island_genetic_algorithm, TOPOLOGI_MIGRASI
+from src.algorithms.utils.fitness_cache import UKURAN_CACHE_DEFAULT, FitnessCache
+from src.algorithms.hill_climbing import (
+    steepest_ascent_hill_climbing,
+    stochastic_hill_climbing,
+    hill_climbing_with_sideways_moves,
+    random_restart_hill_climbing,
+    first_improvement_hill_climbing,
+    RestartResult
+)
+
+# Pemetaan nama internal algoritma ke nama lengkap
+ALGO_NAME_MAP = {
+    'sa': 'Simulated Annealing',
+    'sa_pt': 'Parallel Tempering Simulated Annealing',
+    'ga': 'Genetic Algorithm',
+    'ga_island': 'Island-Model Genetic Algorithm',
+    'hc_steepest': 'Steepest Ascent Hill Climbing',
+    'hc_stochastic': 'Stochastic Hill Climbing',
+    'hc_sideways': 'Hill Climbing with Sideways Moves',
+    'hc_random_restart': 'Random-Restart Hill Climbing',
+    'hc_first': 'First-Improvement Hill Climbing',
+    'ts': 'Tabu Search'
+}
+
+# Nama metode state awal untuk ditampilkan
+NAMA_METODE_AWAL = {'ffd': 'FFD', 'bfd': 'BFD', 'wfd': 'WFD', 'random': 'Acak'}
+
+
+@dataclass
+class SolveResult:
+    """
+    Hasil satu pemanggilan algoritma melalui `run_algorithm`.
+
+    Attributes:
+        keadaan_akhir: State terbaik yang dikembalikan algoritma.
+        histori_skor: Histori skor algoritma.
+        histori_probabilitas: Histori probabilitas penerimaan (hanya SA biasa).
+        laporan: Baris statistik tambahan khusus algoritma (replika, pulau, cache fitness).
+    """
+    keadaan_akhir: State
+    histori_skor: History
+    histori_probabilitas: Optional[History] = None
+    laporan: List[str] = field(default_factory=list)
+
+    @property
+    def iterations(self) -> int:
+        return len(self.histori_skor) - 1
+
+
+def parse_suhu_awal(nilai: str) -> Union[float, str]:
+    # Argumen --suhu_awal: angka atau 'auto'.
+    if nilai == 'auto':
+        return nilai
+    try:
+        return float(nilai)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Suhu awal harus berupa angka atau 'auto', bukan '{nilai}'.")
+
+
+def add_solver_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Menambahkan argumen pemilihan dan konfigurasi algoritma ke sebuah parser.
+
+    Dipakai bersama oleh `src.main` (satu problem) dan `src.batch` (banyak problem),
+    sehingga kedua CLI menerima opsi algoritma yang sama.
+    """
+    # Argumen Umum
+    parser.add_argument("--algoritma", type=str, required=True, choices=['sa', 'hc', 'ga', 'ts'], help="Algoritma yang akan dijalankan.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed RNG (opsional) untuk replikasi hasil.")
+    parser.add_argument("--max_iter", type=int, default=1000, help="Jumlah iterasi maksimum (untuk SA, HC). Juga sebagai fallback untuk max_generasi GA.")
+    parser.add_argument("--time_limit", type=float, default=None, help="Batas waktu per run dalam detik; bila habis, solusi terbaik sejauh ini dikembalikan.")
+    parser.add_argument("--initial_state_method", type=str, default='ffd', choices=['ffd', 'bfd', 'wfd', 'random'], help="Metode pembuatan state awal.")
+    parser.add_argument("--problem_cache_dir", type=str, default=None, help="Direktori cache biner problem (dibuka dengan mmap pada run berikutnya). Default: tanpa cache.")
+
+    # Argumen GA
+    parser.add_argument("--max_generasi", type=int, default=None, help="Jumlah generasi maksimum untuk GA.")
+    parser.add_argument("--populasi_size", type=int, default=30, help="Ukuran populasi untuk GA.")
+    parser.add_argument("--crossover_rate", type=float, default=0.8, help="Peluang crossover untuk GA.")
+    parser.add_argument("--mutation_rate", type=float, default=0.2, help="Peluang mutasi untuk GA.")
+    parser.add_argument("--tournament_size", type=int, default=3, help="Ukuran turnamen seleksi GA.")
+    parser.add_argument("--elitism", type=int, default=1, help="Jumlah individu elit yang dipertahankan GA.")
+    parser.add_argument("--islands", type=int, default=1, help="Jumlah pulau (proses) untuk GA model pulau; 1 = GA biasa.")
+    parser.add_argument("--migration_interval", type=int, default=10, help="Jumlah generasi di antara dua migrasi GA model pulau.")
+    parser.add_argument("--migration_size", type=int, default=2, help="Jumlah individu terbaik yang dikirim setiap migrasi.")
+    parser.add_argument("--topology", type=str, default='ring', choices=list(TOPOLOGI_MIGRASI), help="Topologi migrasi GA model pulau.")
+    parser.add_argument("--fitness_cache_size", type=int, default=UKURAN_CACHE_DEFAULT, help="Jumlah genom unik yang diingat cache fitness GA (LRU); 0 = nonaktif.")
+    parser.add_argument("--deduplicate", action="store_true", help="Cegah individu GA dengan pengepakan yang sama muncul lebih dari sekali dalam satu generasi.")
+
+    # Argumen SA
+    parser.add_argument("--suhu_awal", type=parse_suhu_awal, default=1000.0, help="Suhu awal untuk SA, atau 'auto' untuk kalibrasi otomatis dari sampel gerakan acak.")
+    parser.add_argument("--target_acceptance", type=float, default=0.5, help="Target laju penerimaan gerakan memburuk untuk --suhu_awal auto dan jadwal 'adaptive'.")
+    parser.add_argument("--cooling_rate", type=float, default=0.99, help="Cooling rate untuk SA.")
+    parser.add_argument("--cooling_schedule", type=str, default='geometric', choices=list(JADWAL_PENDINGINAN), help="Jadwal pendinginan SA.")
+    parser.add_argument("--reheat_after", type=int, default=1000, help="Jumlah iterasi tanpa perbaikan sebelum pemanasan ulang (jadwal 'reheat').")
+    parser.add_argument("--max_stall_iter", type=int, default=None, help="Hentikan SA atau Tabu Search bila skor terbaik tidak membaik selama sekian iterasi.")
+    parser.add_argument("--replicas", type=int, default=1, help="Jumlah replika (proses) untuk mode parallel tempering SA; 1 = SA biasa.")
+    parser.add_argument("--suhu_min", type=float, default=0.01, help="Suhu replika paling dingin pada parallel tempering (suhu terpanas = --suhu_awal).")
+    parser.add_argument("--swap_interval", type=int, default=50, help="Jumlah langkah di antara dua percobaan pertukaran replika.")
+
+    # Argumen HC
+    parser.add_argument("--hc_variant", type=str, default='steepest', choices=['steepest', 'stochastic', 'sideways', 'random_restart', 'first'], help="Varian Hill Climbing yang akan digunakan.")
+    parser.add_argument("--max_sideways_moves", type=int, default=10, help="Jumlah maksimum gerakan menyamping untuk varian 'sideways'.")
+    parser.add_argument("--num_restarts", type=int, default=5, help="Jumlah restart untuk varian 'random_restart'.")
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah proses worker untuk menjalankan restart secara paralel (varian 'random_restart').")
+
+    # Argumen Tabu Search
+    parser.add_argument("--tabu_tenure", type=int, default=10, help="Jumlah iterasi sebuah pasangan (barang, kontainer asal) tetap tabu.")
+    parser.add_argument("--candidate_size", type=int, default=None, help="Jumlah gerakan acak yang dinilai per iterasi Tabu Search (default: seluruh lingkungan).")
+
+    # Argumen Constraint
+    parser.add_argument("--enable_fragile", action="store_true", help="Aktifkan constraint barang rapuh.")
+    parser.add_argument("--enable_incompatible", action="store_true", help="Aktifkan constraint barang tidak kompatibel.")
+
+
+def algorithm_key(args: argparse.Namespace) -> str:
+    # Nama internal algoritma (kunci ALGO_NAME_MAP) sesuai varian yang dipilih.
+    if args.algoritma == 'hc':
+        return f"hc_{args.hc_variant}"
+    if args.algoritma == 'sa' and args.replicas > 1:
+        return 'sa_pt'
+    if args.algoritma == 'ga' and args.islands > 1:
+        return 'ga_island'
+    return args.algoritma
+
+
+def objective_config(args: argparse.Namespace) -> ObjectiveConfig:
+    # Konfigurasi fungsi objektif dari argumen constraint.
+    return ObjectiveConfig(
+        use_fragile_constraint=args.enable_fragile,
+        use_incompatible_constraint=args.enable_incompatible
+    )
+
+
+def max_generations(args: argparse.Namespace) -> int:
+    # Jumlah generasi GA: --max_generasi, atau --max_iter bila tidak disetel.
+    return args.max_generasi if args.max_generasi is not None else args.max_iter
+
+
+def build_initial_state(items: Sequence[Barang], kapasitas: int, method: str, seed: Optional[int]) -> State:
+    """
+    Membuat state awal dengan metode `--initial_state_method`.
+
+    Args:
+        items: Barang yang akan ditempatkan.
+        kapasitas: Kapasitas kontainer.
+        method: 'ffd', 'bfd', 'wfd', atau 'random'.
+        seed: Seed untuk metode 'random' (opsional).
+    """
+    if method == 'random':
+        return generate_random_state(items, kapasitas, random.Random(seed) if seed is not None else random.Random())
+    if method == 'bfd':
+        return generate_bfd_state(items, kapasitas)
+    if method == 'wfd':
+        return generate_wfd_state(items, kapasitas)
+    return generate_ffd_state(items, kapasitas)
+
+
+def resolve_initial_temperature(
+    args: argparse.Namespace,
+    keadaan_awal: State,
+    obj_config: ObjectiveConfig,
+    seed: Optional[int]
+) -> Union[float, str]:
+    # Suhu awal SA; `--suhu_awal auto` dikalibrasi dari state awal.
+    if args.algoritma != 'sa' or args.suhu_awal != 'auto':
+        return args.suhu_awal
+    # RNG terpisah agar kalibrasi tidak menggeser urutan angka acak algoritma
+    return calibrate_initial_temperature(
+        keadaan_awal, obj_config, target_acceptance=args.target_acceptance,
+        rng=random.Random(seed) if seed is not None else random.Random()
+    )
+
+
+def run_algorithm(
+    args: argparse.Namespace,
+    keadaan_awal: State,
+    obj_config: ObjectiveConfig,
+    kapasitas: int,
+    batas_bawah: int,
+    seed: Optional[int],
+    suhu_awal: Union[float, str],
+    recorder: Optional[HistoryRecorder] = None,
+    cancel_token: Optional[CancelToken] = None,
+    on_restart: Optional[Callable[[RestartResult], None]] = None
+) -> SolveResult:
+    """
+    Menjalankan algoritma yang dipilih `args` dari sebuah state awal.
+
+    Args:
+        args: Argumen yang dibuat oleh `add_solver_arguments`.
+        keadaan_awal: State awal.
+        obj_config: Konfigurasi fungsi objektif.
+        kapasitas: Kapasitas kontainer.
+        batas_bawah: Batas bawah jumlah kontainer untuk penghentian dini.
+        seed: Seed RNG algoritma (opsional).
+        suhu_awal: Suhu awal SA hasil `resolve_initial_temperature`.
+        recorder: Perekam histori skor (opsional).
+        cancel_token: Token pembatalan kooperatif (opsional).
+        on_restart: Callback progres Random-Restart Hill Climbing (opsional).
+
+    Returns:
+        SolveResult berisi state akhir, histori, dan baris laporan tambahan.
+    """
+    rng = random.Random(seed) if seed is not None else None
+    laporan: List[str] = []
+    histori_probabilitas = None
+    umum = dict(lower_bound=batas_bawah, recorder=recorder, time_limit=args.time_limit, cancel_token=cancel_token)
+
+    if args.algoritma == 'sa':
+        if args.replicas > 1:
+            keadaan_akhir, histori_skor, pt_stats = parallel_tempering(
+                keadaan_awal=keadaan_awal,
+                config=obj_config,
+                num_replicas=args.replicas,
+                suhu_min=args.suhu_min,
+                suhu_max=max(suhu_awal, args.suhu_min),
+                max_iter=args.max_iter,
+                swap_interval=args.swap_interval,
+                rng=rng,
+                **umum
+            )
+            for suhu, rate in zip(pt_stats.temperatures, pt_stats.acceptance_rates):
+                laporan.append(f"  Replika T={suhu:.4g}: acceptance rate {rate:.2%}")
+            for tingkat, rate in enumerate(pt_stats.swap_rates):
+                laporan.append(f"  Swap T{tingkat}<->T{tingkat + 1}: {rate:.2%}")
+        else:
+            keadaan_akhir, histori_skor, histori_probabilitas = simulated_annealing(
+                keadaan_awal=keadaan_awal,
+                suhu_awal=suhu_awal,
+                cooling_rate=args.cooling_rate,
+                max_iter=args.max_iter,
+                config=obj_config,
+                rng=rng,
+                schedule=create_schedule(
+                    args.cooling_schedule, suhu_awal, args.cooling_rate, args.max_iter,
+                    target_acceptance=args.target_acceptance, reheat_after=args.reheat_after
+                ),
+                max_stall_iter=args.max_stall_iter,
+                **umum
+            )
+    elif args.algoritma == 'hc':
+        if args.hc_variant == 'steepest':
+            keadaan_akhir, histori_skor = steepest_ascent_hill_climbing(
+                initial_state=keadaan_awal, config=obj_config, max_iter=args.max_iter, **umum
+            )
+        elif args.hc_variant == 'stochastic':
+            keadaan_akhir, histori_skor = stochastic_hill_climbing(
+                initial_state=keadaan_awal, config=obj_config, max_iter=args.max_iter, **umum
+            )
+        elif args.hc_variant == 'sideways':
+            keadaan_akhir, histori_skor = hill_climbing_with_sideways_moves(
+                initial_state=keadaan_awal, config=obj_config, max_iter=args.max_iter,
+                max_sideways_moves=args.max_sideways_moves, **umum
+            )
+        elif args.hc_variant == 'first':
+            keadaan_akhir, histori_skor = first_improvement_hill_climbing(
+                initial_state=keadaan_awal, config=obj_config, max_iter=args.max_iter, rng=rng, **umum
+            )
+        elif args.hc_variant == 'random_restart':
+            keadaan_akhir, histori_skor = random_restart_hill_climbing(
+                initial_state=keadaan_awal,
+                config=obj_config,
+                num_restarts=args.num_restarts,
+                max_iter_per_restart=args.max_iter,
+                rng=rng,
+                kapasitas_kontainer=kapasitas,
+                workers=args.workers,
+                on_restart=on_restart,
+                **umum
+            )
+        else:
+            raise ValueError(f"Varian Hill Climbing '{args.hc_variant}' tidak dikenal.")
+    elif args.algoritma == 'ga':
+        ga_params = dict(
+            initial_state=keadaan_awal,
+            config=obj_config,
+            kapasitas_kontainer=kapasitas,
+            max_generations=max_generations(args),
+            population_size=args.populasi_size,
+            crossover_rate=args.crossover_rate,
+            mutation_rate=args.mutation_rate,
+            tournament_size=args.tournament_size,
+            elitism=args.elitism,
+            rng=rng,
+            deduplicate=args.deduplicate,
+            **umum
+        )
+        if args.islands > 1:
+            keadaan_akhir, histori_skor, histori_pulau = island_genetic_algorithm(
+                num_islands=args.islands,
+                migration_interval=args.migration_interval,
+                migration_size=args.migration_size,
+                topology=args.topology,
+                fitness_cache_size=args.fitness_cache_size,
+                **ga_params
+            )
+            for idx, histori in enumerate(histori_pulau):
+                laporan.append(f"  Pulau {idx}: skor terbaik {histori[-1]:.4f} setelah {len(histori) - 1} generasi")
+        else:
+            fitness_cache = FitnessCache(args.fitness_cache_size)
+            keadaan_akhir, histori_skor = genetic_algorithm(fitness_cache=fitness_cache, **ga_params)
+            laporan.append(f"  Cache fitness: {fitness_cache.hits} hit, {fitness_cache.misses} miss "
+                           f"(hit rate {fitness_cache.hit_rate:.2%})")
+    elif args.algoritma == 'ts':
+        keadaan_akhir, histori_skor = tabu_search(
+            initial_state=keadaan_awal,
+            config=obj_config,
+            max_iter=args.max_iter,
+            tenure=args.tabu_tenure,
+            candidate_size=args.candidate_size,
+            max_stall_iter=args.max_stall_iter,
+            rng=rng,
+            **umum
+        )
+    else:
+        raise ValueError(f"Algoritma '{args.algoritma}' tidak dikenal.")
+
+    return SolveResult(keadaan_akhir, histori_skor, histori_probabilitas, laporan)
+
+
+def solve_problem(
+    items: Sequence[Barang],
+    kapasitas: int,
+    args: argparse.Namespace,
+    cancel_token: Optional[CancelToken] = None
+) -> dict:
+    """
+    Menyelesaikan satu problem tanpa output konsol, log, atau plot.
+
+    Args:
+        items: Barang problem.
+        kapasitas: Kapasitas kontainer.
+        args: Argumen yang dibuat oleh `add_solver_arguments`.
+        cancel_token: Token pembatalan kooperatif (opsional).
+
+    Returns:
+        Dict ringkasan hasil (skor, jumlah kontainer, batas bawah, durasi, dll.).
+    """
+    obj_config = objective_config(args)
+    batas_bawah = compute_lower_bound(items, kapasitas)
+    keadaan_awal = build_initial_state(items, kapasitas, args.initial_state_method, args.seed)
+    skor_awal = calculate_objective(keadaan_awal, obj_config)
+
+    start_time = time.time()
+    suhu_awal = resolve_initial_temperature(args, keadaan_awal, obj_config, args.seed)
+    hasil = run_algorithm(args, keadaan_awal, obj_config, kapasitas, batas_bawah, args.seed, suhu_awal,
+                          cancel_token=cancel_token)
+    durasi = time.time() - start_time
+
+    keadaan_akhir = hasil.keadaan_akhir
+    jumlah_akhir = len(keadaan_akhir.kontainer_list)
+    return {
+        'algorithm': ALGO_NAME_MAP.get(algorithm_key(args), algorithm_key(args)),
+        'num_items': len(items),
+        'capacity': kapasitas,
+        'initial_score': skor_awal,
+        'final_score': calculate_objective(keadaan_akhir, obj_config),
+        'num_containers_initial': len(keadaan_awal.kontainer_list),
+        'num_containers_final': jumlah_akhir,
+        'lower_bound': batas_bawah,
+        'optimality_gap': (jumlah_akhir - batas_bawah) / batas_bawah if batas_bawah > 0 else 0.0,
+        'iterations': hasil.iterations,
+        'duration_seconds': durasi,
+        'seed': args.seed,
+        'containers': [[barang.id for barang in k.barang_di_dalam] for k in keadaan_akhir.kontainer_list],
+        'unallocated': [barang.id for barang in keadaan_akhir.barang_belum_dialokasi],
+    }
@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Optional
+
+
+class CancelToken:
+    """
+    Token pembatalan kooperatif untuk menghentikan algoritma dari luar.
+
+    Kode pemanggil (misalnya thread lain atau handler sinyal) memanggil `cancel()`;
+    algoritma memeriksa token di loop utamanya dan mengembalikan solusi terbaik
+    yang sudah ditemukan. Secara default token hanya berlaku di dalam satu proses;
+    algoritma multi-proses memeriksanya di proses induk.
+
+    Args:
+        event: Event alternatif, misalnya `multiprocessing.Event()` agar token dapat
+            diwariskan ke proses worker saat proses dibuat.
+    """
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class Budget:
+    """
+    Gabungan batas waktu dan token pembatalan yang diperiksa algoritma setiap iterasi.
+
+    Batas waktu disimpan sebagai tenggat absolut pada jam `time.monotonic()` (jam
+    sistem yang sama untuk semua proses), sehingga tenggat dapat dikirim ke proses
+    worker tanpa bergeser. Setelah habis, budget tetap habis.
+
+    Args:
+        time_limit: Batas waktu dalam detik sejak budget dibuat (opsional).
+        cancel_token: Token pembatalan (opsional).
+        deadline: Tenggat absolut `time.monotonic()`; dipakai worker yang menerima
+            tenggat dari proses induk. Tidak boleh diberikan bersama `time_limit`.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+        deadline: Optional[float] = None
+    ):
+        if time_limit is not None:
+            if time_limit < 0:
+                raise ValueError("time_limit tidak boleh negatif.")
+            if deadline is not None:
+                raise ValueError("time_limit dan deadline tidak dapat diberikan bersamaan.")
+            deadline = time.monotonic() + time_limit
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+        self.reason: Optional[str] = None
+
+    def exhausted(self) -> bool:
+        """
+        Mengecek apakah algoritma harus berhenti sekarang.
+
+        Returns:
+            True jika tenggat terlewati atau token dibatalkan; alasannya disimpan di
+            `reason` ('time_limit' atau 'cancelled').
+        """
+        if self.reason is not None:
+            return True
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            self.reason = 'cancelled'
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = 'time_limit'
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        # Sisa waktu dalam detik (None jika tanpa batas waktu).
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
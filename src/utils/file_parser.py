@@ -1,30 +1,43 @@
-import json
 from src.core.data_structures import Barang
+from typing import Optional
+from src.utils.problem_cache import load_problem_cached
+from src.utils.stream_parser import parse_problem_stream, problem_from_data
 
-def parse_problem(file_path: str) -> tuple[list[Barang], int]:
+def parse_problem(file_path: str, cache_dir: Optional[str] = None) -> tuple[list[Barang], int]:
     """
      Membaca file masalah dalam format JSON dan mengembalikannya sebagai daftar objek Barang
      dan kapasitas kontainer."
+
+     File dibaca secara bertahap dengan `parse_problem_stream` (file `.ndjson` dibaca
+     sebagai satu objek per baris), dan setiap barang divalidasi.
     
      Args:
          file_path: Path ke file JSON masalah.
+         cache_dir: Jika diisi, problem dibaca dari cache biner di direktori ini
+             (dibuat saat pertama kali) alih-alih di-parse ulang.
     
      Returns:
          Tuple berisi (list[Barang], kapasitas_kontainer).
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    if cache_dir is not None:
+        arrays, _ = load_problem_cached(file_path, cache_dir)
+    else:
+        arrays = parse_problem_stream(file_path)
+    return arrays.to_items(), arrays.kapasitas
 
-    kapasitas_kontainer = data['kapasitas_kontainer']
-    
-    daftar_barang = []
-    for item_data in data['barang']:
-        barang = Barang(
-            id=item_data['id'],
-            ukuran=item_data['ukuran'],
-            tipe=item_data.get('tipe'),
-            rapuh=item_data.get('rapuh', False)
-        )
-        daftar_barang.append(barang)
+def parse_problem_data(data: dict) -> tuple[list[Barang], int]:
+    """
+     Mengubah problem yang sudah di-decode dari JSON (misalnya satu baris JSONL)
+     menjadi daftar objek Barang dan kapasitas kontainer.
 
-    return daftar_barang, kapasitas_kontainer
+     Problem divalidasi dengan aturan yang sama seperti file yang dibaca
+     `parse_problem`; entri yang tidak valid menghasilkan ValueError.
+
+     Args:
+         data: Dict dengan kunci 'kapasitas_kontainer' dan 'barang'.
+
+     Returns:
+         Tuple berisi (list[Barang], kapasitas_kontainer).
+    """
+    arrays = problem_from_data(data)
+    return arrays.to_items(), arrays.kapasitas
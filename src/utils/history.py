@@ -0,0 +1,314 @@
+import os
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Mode perekam histori yang dapat dipilih dari CLI
+MODE_HISTORI = ('full', 'decimated', 'minmax', 'file')
+# Jumlah titik maksimum yang dibaca `BinaryFileHistory.points` untuk plot
+TITIK_PLOT_DEFAULT = 10000
+
+
+class HistoryRecorder(ABC):
+    """
+    Antarmuka perekam histori skor (atau probabilitas) per iterasi.
+
+    Algoritma hanya memanggil `append`, sehingga `list` biasa tetap dapat dipakai
+    sebagai perekam. Implementasi di modul ini membatasi memori untuk run panjang.
+    """
+
+    def __init__(self):
+        self._jumlah = 0
+        self._terakhir: Optional[float] = None
+
+    def append(self, nilai: float) -> None:
+        self._rekam(self._jumlah, float(nilai))
+        self._jumlah += 1
+        self._terakhir = float(nilai)
+
+    def __len__(self) -> int:
+        # Jumlah titik yang pernah ditambahkan, bukan jumlah titik yang disimpan.
+        return self._jumlah
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._terakhir
+
+    @abstractmethod
+    def points(self) -> Tuple[List[int], List[float]]:
+        """
+        Mengembalikan titik yang disimpan untuk keperluan plot.
+
+        Returns:
+            Pasangan (indeks iterasi, nilai), terurut menurut indeks; list Python,
+            atau array NumPy untuk `BinaryFileHistory`.
+        """
+
+    @abstractmethod
+    def spawn(self, nama: str) -> 'HistoryRecorder':
+        """
+        Membuat perekam kosong baru dengan konfigurasi yang sama.
+
+        Args:
+            nama: Nama histori baru (dipakai sebagai akhiran nama file oleh `BinaryFileHistory`).
+        """
+
+    @abstractmethod
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        # Menyimpan titik ke-`indeks`; dipanggil oleh `append`.
+        ...
+
+
+History = Union[List[float], HistoryRecorder]
+
+
+class FullHistory(HistoryRecorder):
+    # Menyimpan semua titik dalam array('d') (8 byte per titik, bukan ~32 byte untuk float Python).
+
+    def __init__(self):
+        super().__init__()
+        self._nilai = array('d')
+
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        self._nilai.append(nilai)
+
+    def __getitem__(self, indeks):
+        return self._nilai[indeks]
+
+    def __iter__(self):
+        return iter(self._nilai)
+
+    def points(self) -> Tuple[List[int], List[float]]:
+        return list(range(len(self._nilai))), self._nilai.tolist()
+
+    def spawn(self, nama: str) -> 'FullHistory':
+        return FullHistory()
+
+
+class DecimatedHistory(HistoryRecorder):
+    """
+    Menyimpan setiap titik ke-`step` ditambah titik terakhir.
+
+    Jika `max_points` diberikan, `step` digandakan (dan setengah titik lama dibuang)
+    setiap kali jumlah titik tersimpan melewati batas, sehingga memori tetap
+    konstan berapa pun panjang run.
+    """
+
+    def __init__(self, step: int = 1, max_points: Optional[int] = None):
+        super().__init__()
+        if step < 1:
+            raise ValueError("step minimal bernilai 1.")
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points minimal bernilai 2.")
+        self.step = step
+        self.max_points = max_points
+        self._step_awal = step
+        self._nilai = array('d')
+
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        if indeks % self.step:
+            return
+        self._nilai.append(nilai)
+        if self.max_points is not None and len(self._nilai) > self.max_points:
+            self._nilai = self._nilai[::2]
+            self.step *= 2
+
+    def points(self) -> Tuple[List[int], List[float]]:
+        xs = list(range(0, len(self._nilai) * self.step, self.step))
+        ys = self._nilai.tolist()
+        if self._jumlah and xs[-1] != self._jumlah - 1:
+            xs.append(self._jumlah - 1)
+            ys.append(self._terakhir)
+        return xs, ys
+
+    def spawn(self, nama: str) -> 'DecimatedHistory':
+        return DecimatedHistory(self._step_awal, self.max_points)
+
+
+class MinMaxHistory(HistoryRecorder):
+    """
+    Menyimpan nilai minimum dan maksimum setiap bucket iterasi.
+
+    Ukuran bucket dimulai dari `bucket_size` dan digandakan (dengan menggabungkan
+    bucket bertetangga) setiap kali jumlah bucket melewati `max_buckets`, sehingga
+    memori konstan namun lonjakan nilai tetap terlihat pada plot.
+    """
+
+    def __init__(self, max_buckets: int = 1000, bucket_size: int = 1):
+        super().__init__()
+        if max_buckets < 1 or bucket_size < 1:
+            raise ValueError("max_buckets dan bucket_size minimal bernilai 1.")
+        self.max_buckets = max_buckets
+        self.bucket_size = bucket_size
+        self._bucket_awal = bucket_size
+        # Per bucket: indeks dan nilai titik minimum serta maksimum
+        self._idx_min = array('q')
+        self._min = array('d')
+        self._idx_max = array('q')
+        self._max = array('d')
+
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        bucket = indeks // self.bucket_size
+        if bucket == len(self._min):
+            self._idx_min.append(indeks)
+            self._min.append(nilai)
+            self._idx_max.append(indeks)
+            self._max.append(nilai)
+        else:
+            if nilai < self._min[-1]:
+                self._idx_min[-1] = indeks
+                self._min[-1] = nilai
+            if nilai > self._max[-1]:
+                self._idx_max[-1] = indeks
+                self._max[-1] = nilai
+        if len(self._min) > self.max_buckets:
+            self._gabungkan_bucket()
+
+    def _gabungkan_bucket(self) -> None:
+        idx_min, nilai_min, idx_max, nilai_max = array('q'), array('d'), array('q'), array('d')
+        for awal in range(0, len(self._min), 2):
+            pasangan = range(awal, min(awal + 2, len(self._min)))
+            i = min(pasangan, key=lambda b: self._min[b])
+            j = max(pasangan, key=lambda b: self._max[b])
+            idx_min.append(self._idx_min[i])
+            nilai_min.append(self._min[i])
+            idx_max.append(self._idx_max[j])
+            nilai_max.append(self._max[j])
+        self._idx_min, self._min, self._idx_max, self._max = idx_min, nilai_min, idx_max, nilai_max
+        self.bucket_size *= 2
+
+    def points(self) -> Tuple[List[int], List[float]]:
+        titik = set()
+        for b in range(len(self._min)):
+            titik.add((self._idx_min[b], self._min[b]))
+            titik.add((self._idx_max[b], self._max[b]))
+        if self._jumlah:
+            titik.add((self._jumlah - 1, self._terakhir))
+        terurut = sorted(titik)
+        return [x for x, _ in terurut], [y for _, y in terurut]
+
+    def spawn(self, nama: str) -> 'MinMaxHistory':
+        return MinMaxHistory(self.max_buckets, self._bucket_awal)
+
+
+class BinaryFileHistory(HistoryRecorder):
+    """
+    Menulis setiap titik sebagai double 8 byte ke file biner di disk.
+
+    Hanya buffer sebesar `buffer_size` titik yang disimpan di memori. File dapat
+    dibaca kembali dengan `array('d').fromfile` atau `numpy.fromfile(path)`.
+    `points` membaca file lewat `numpy.memmap` dengan langkah tetap, sehingga plot
+    hanya memuat paling banyak `max_points` (+ titik terakhir) berapa pun panjang run.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 65536, max_points: Optional[int] = TITIK_PLOT_DEFAULT):
+        super().__init__()
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points minimal bernilai 2.")
+        self.path = path
+        self.buffer_size = buffer_size
+        self.max_points = max_points
+        self._buffer = array('d')
+        direktori = os.path.dirname(path)
+        if direktori:
+            os.makedirs(direktori, exist_ok=True)
+        self._file = open(path, 'wb')
+
+    def _rekam(self, indeks: int, nilai: float) -> None:
+        self._buffer.append(nilai)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._file.closed:
+            return
+        self._buffer.tofile(self._file)
+        self._buffer = array('d')
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'BinaryFileHistory':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def read(self) -> array:
+        # Membaca seluruh isi file (termasuk buffer yang belum ditulis).
+        self.flush()
+        nilai = array('d')
+        with open(self.path, 'rb') as f:
+            nilai.frombytes(f.read())
+        return nilai
+
+    def points(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Titik setiap langkah ke-ceil(n / max_points) ditambah titik terakhir, sebagai array NumPy.
+        self.flush()
+        n = os.path.getsize(self.path) // 8
+        if n == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        step = 1 if self.max_points is None else -(-n // self.max_points)
+        nilai = np.memmap(self.path, dtype=np.float64, mode='r', shape=(n,))
+        xs = np.arange(0, n, step, dtype=np.int64)
+        ys = np.array(nilai[::step])
+        if xs[-1] != n - 1:
+            xs = np.append(xs, n - 1)
+            ys = np.append(ys, nilai[n - 1])
+        del nilai
+        return xs, ys
+
+    def spawn(self, nama: str) -> 'BinaryFileHistory':
+        akar, ekstensi = os.path.splitext(self.path)
+        return BinaryFileHistory(f"{akar}_{nama}{ekstensi}", self.buffer_size, self.max_points)
+
+
+def create_recorder(
+    mode: str,
+    path: Optional[str] = None,
+    step: int = 1,
+    max_points: Optional[int] = None
+) -> HistoryRecorder:
+    """
+    Membuat perekam histori berdasarkan mode dari CLI.
+
+    Args:
+        mode: Salah satu dari 'full', 'decimated', 'minmax', 'file'.
+        path: Path file biner (wajib untuk mode 'file').
+        step: Jarak antar titik untuk mode 'decimated'.
+        max_points: Batas jumlah titik tersimpan untuk mode 'decimated' dan 'minmax',
+            atau jumlah titik yang dibaca untuk plot pada mode 'file'.
+
+    Returns:
+        Instance HistoryRecorder yang sesuai.
+    """
+    if mode == 'full':
+        return FullHistory()
+    if mode == 'decimated':
+        return DecimatedHistory(step, max_points)
+    if mode == 'minmax':
+        return MinMaxHistory(max_points or 1000)
+    if mode == 'file':
+        if path is None:
+            raise ValueError("Mode histori 'file' membutuhkan path.")
+        return BinaryFileHistory(path, max_points=max_points or TITIK_PLOT_DEFAULT)
+    raise ValueError(f"Mode histori '{mode}' tidak dikenal. Pilihan: {MODE_HISTORI}")
+
+
+def history_points(history: Union[Sequence[float], HistoryRecorder]) -> Tuple[List[int], List[float]]:
+    # Mengubah list biasa atau perekam menjadi pasangan (indeks, nilai) untuk plot.
+    if isinstance(history, HistoryRecorder):
+        return history.points()
+    return list(range(len(history))), list(history)
+
+
+def history_last(history: Union[Sequence[float], HistoryRecorder]) -> Optional[float]:
+    # Nilai terakhir dari list biasa atau perekam (None jika kosong).
+    if isinstance(history, HistoryRecorder):
+        return history.last
+    return history[-1] if len(history) else None
@@ -0,0 +1,181 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from hashlib import blake2b
+from typing import Dict, Tuple
+
+from src.utils.stream_parser import ProblemArrays, parse_problem_stream
+
+# Direktori default file cache (relatif terhadap direktori kerja, seperti src/results)
+DIREKTORI_CACHE_DEFAULT = os.path.join("src", "cache")
+EKSTENSI_CACHE = ".bpk"
+
+_MAGIC = b"BPKCACHE"
+_VERSI = 2
+# Tata letak byte kolom: urutan byte native dan lebar elemen ukuran/tipe/rapuh
+_TATA_LETAK_DATA = (sys.byteorder[0].upper() + ''.join(str(array(kode).itemsize) for kode in 'qib')).encode('ascii')
+# Penanda format yang ikut masuk ke kunci cache, sehingga perubahan format tidak pernah membuka file lama
+_TAG_FORMAT = _MAGIC + struct.pack("<I", _VERSI) + _TATA_LETAK_DATA
+# Header: magic, versi, tata letak data, jumlah barang, kapasitas, jumlah tipe, panjang byte ID, panjang byte nama tipe
+_HEADER = struct.Struct("<8sI4sqqqqq")
+_UKURAN_BACA = 1 << 20
+
+
+def hash_file(file_path: str, awalan: bytes = b'') -> str:
+    # Hash `awalan` diikuti isi file (blake2b 128-bit, heksadesimal) sebagai kunci cache.
+    h = blake2b(awalan, digest_size=16)
+    with open(file_path, 'rb') as f:
+        for potongan in iter(lambda: f.read(_UKURAN_BACA), b''):
+            h.update(potongan)
+    return h.hexdigest()
+
+
+def _tata_letak(n: int, jumlah_tipe: int, panjang_id: int, panjang_tipe: int) -> Dict[str, Tuple[int, int]]:
+    # Posisi (awal, akhir) setiap kolom di file; setiap kolom dimulai pada kelipatan 8 byte.
+    kolom = [
+        ('ukuran', 8 * n),
+        ('id_offset', 8 * (n + 1)),
+        ('tipe_offset', 8 * (jumlah_tipe + 1)),
+        ('tipe', 4 * n),
+        ('rapuh', n),
+        ('id_data', panjang_id),
+        ('tipe_data', panjang_tipe),
+    ]
+    letak = {}
+    posisi = _HEADER.size
+    for nama, panjang in kolom:
+        posisi += -posisi % 8
+        letak[nama] = (posisi, posisi + panjang)
+        posisi += panjang
+    return letak
+
+
+def write_problem_cache(arrays: ProblemArrays, cache_path: str) -> None:
+    """
+    Menulis `ProblemArrays` ke file cache biner.
+
+    Kolom ditulis apa adanya (urutan byte native) beserta tabel string untuk ID dan
+    nama tipe, sehingga file dapat dibuka kembali dengan `mmap` tanpa parsing. File
+    ditulis ke file sementara lalu di-rename, sehingga proses lain yang membuka cache
+    yang sama tidak pernah melihat file setengah jadi.
+
+    Args:
+        arrays: Problem yang akan disimpan.
+        cache_path: Path file cache tujuan.
+    """
+    n = len(arrays)
+    teks_tipe = [nama.encode('utf-8') for nama in arrays.tabel_tipe]
+    tipe_offset = [0]
+    for teks in teks_tipe:
+        tipe_offset.append(tipe_offset[-1] + len(teks))
+    id_data = memoryview(arrays._id_data)[:arrays._id_offset[n]]
+    letak = _tata_letak(n, len(teks_tipe), len(id_data), tipe_offset[-1])
+    isi = {
+        'ukuran': arrays.ukuran,
+        'id_offset': arrays._id_offset,
+        'tipe_offset': struct.pack(f"{len(tipe_offset)}q", *tipe_offset),
+        'tipe': arrays.tipe,
+        'rapuh': arrays.rapuh,
+        'id_data': id_data,
+        'tipe_data': b''.join(teks_tipe),
+    }
+
+    direktori = os.path.dirname(cache_path) or '.'
+    os.makedirs(direktori, exist_ok=True)
+    fd, path_sementara = tempfile.mkstemp(dir=direktori, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSI, _TATA_LETAK_DATA, n, arrays.kapasitas, len(teks_tipe), len(id_data), tipe_offset[-1]))
+            for nama, (awal, akhir) in letak.items():
+                f.write(b'\0' * (awal - f.tell()))
+                f.write(isi[nama])
+        os.replace(path_sementara, cache_path)
+    except BaseException:
+        os.unlink(path_sementara)
+        raise
+
+
+def open_problem_cache(cache_path: str) -> ProblemArrays:
+    """
+    Membuka file cache biner dengan `mmap` (hanya baca).
+
+    Kolom `ProblemArrays` yang dihasilkan adalah view `memoryview` langsung ke halaman
+    file, sehingga beberapa proses yang membuka file yang sama berbagi page cache
+    sistem operasi alih-alih masing-masing mem-parsing dan menyimpan salinan problem.
+
+    Args:
+        cache_path: Path file cache.
+
+    Returns:
+        ProblemArrays yang kolomnya dipetakan dari file.
+    """
+    with open(cache_path, 'rb') as f:
+        try:
+            peta = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"File cache '{cache_path}' kosong.") from None
+    view = memoryview(peta)
+    if len(view) < _HEADER.size:
+        raise ValueError(f"File cache '{cache_path}' rusak.")
+    magic, versi, tata_letak, n, kapasitas, jumlah_tipe, panjang_id, panjang_tipe = _HEADER.unpack_from(view)
+    if magic != _MAGIC or versi != _VERSI:
+        raise ValueError(f"File cache '{cache_path}' bukan cache problem versi {_VERSI}.")
+    if tata_letak != _TATA_LETAK_DATA:
+        raise ValueError(
+            f"File cache '{cache_path}' ditulis dengan tata letak data {tata_letak!r}, "
+            f"bukan {_TATA_LETAK_DATA!r}."
+        )
+    letak = _tata_letak(n, jumlah_tipe, panjang_id, panjang_tipe)
+    if len(view) < letak['tipe_data'][1]:
+        raise ValueError(f"File cache '{cache_path}' terpotong.")
+
+    def kolom(nama: str, format_kolom: str = 'B') -> memoryview:
+        awal, akhir = letak[nama]
+        return view[awal:akhir].cast(format_kolom)
+
+    tipe_offset = kolom('tipe_offset', 'q')
+    tipe_data = kolom('tipe_data')
+    tabel_tipe = [str(tipe_data[tipe_offset[k]:tipe_offset[k + 1]], 'utf-8') for k in range(jumlah_tipe)]
+    return ProblemArrays.dari_kolom(
+        kapasitas=kapasitas,
+        ukuran=kolom('ukuran', 'q'),
+        tipe=kolom('tipe', 'i'),
+        rapuh=kolom('rapuh', 'b'),
+        tabel_tipe=tabel_tipe,
+        id_data=kolom('id_data'),
+        id_offset=kolom('id_offset', 'q'),
+    )
+
+
+def cache_path_for(file_path: str, cache_dir: str = DIREKTORI_CACHE_DEFAULT) -> str:
+    # Path file cache untuk sebuah file problem, dikunci dengan hash format cache dan isi file.
+    return os.path.join(cache_dir, hash_file(file_path, _TAG_FORMAT) + EKSTENSI_CACHE)
+
+
+def load_problem_cached(file_path: str, cache_dir: str = DIREKTORI_CACHE_DEFAULT) -> Tuple[ProblemArrays, str]:
+    """
+    Memuat problem dari cache biner, atau mem-parsing file dan membuat cache-nya.
+
+    Kunci cache adalah hash penanda format cache dan isi file, sehingga file yang
+    diubah atau format cache yang berubah otomatis di-parse ulang, sedangkan salinan
+    file yang identik memakai cache yang sama. Cache yang rusak atau header-nya tidak
+    cocok dengan versi dan tata letak data saat ini ditulis ulang.
+
+    Args:
+        file_path: Path file problem (JSON atau NDJSON).
+        cache_dir: Direktori tempat file cache disimpan.
+
+    Returns:
+        Tuple (ProblemArrays yang dipetakan dari cache, path file cache).
+    """
+    cache_path = cache_path_for(file_path, cache_dir)
+    if os.path.exists(cache_path):
+        try:
+            return open_problem_cache(cache_path), cache_path
+        except ValueError:
+            pass
+    write_problem_cache(parse_problem_stream(file_path), cache_path)
+    return open_problem_cache(cache_path), cache_path
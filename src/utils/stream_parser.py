@@ -0,0 +1,334 @@
+import json
+import re
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from src.core.data_structures import Barang
+
+# Jumlah karakter yang dibaca dari file per potongan
+UKURAN_POTONGAN_DEFAULT = 1 << 20
+# Batas panjang satu entri barang; entri yang lebih panjang dianggap rusak
+# sehingga file yang tidak valid tidak dibaca seluruhnya ke memori
+BATAS_PANJANG_ENTRI = 1 << 20
+# Penanda barang tanpa tipe pada array `tipe`
+TANPA_TIPE = -1
+
+_BUKAN_SPASI = re.compile(r'\S')
+_SPASI = ' \t\r\n'
+# Pemisah antarelemen larik beserta spasi di sekitarnya
+_PEMISAH = re.compile(r'[ \t\r\n]*([,\]])[ \t\r\n]*')
+
+
+class ProblemArrays:
+    """
+    Problem bin packing dalam bentuk array bertipe yang ringkas.
+
+    Barang ke-i disimpan sebagai:
+        - ukuran[i] (`array('q')`)
+        - tipe[i] (`array('i')`): indeks ke `tabel_tipe`, atau `TANPA_TIPE`.
+        - rapuh[i] (`array('b')`): 1 bila rapuh.
+        - ID: byte UTF-8 yang digabung dalam satu `bytearray`, dibatasi oleh `_id_offset`.
+
+    Semua array mendukung buffer protocol, sehingga dapat dibungkus tanpa salinan
+    dengan `np.frombuffer(arrays.ukuran, dtype=np.int64)`.
+    """
+    __slots__ = ('kapasitas', 'ukuran', 'tipe', 'rapuh', 'tabel_tipe', '_kode_tipe', '_id_data', '_id_offset')
+
+    def __init__(self, kapasitas: Optional[int] = None):
+        self.kapasitas = kapasitas
+        self.ukuran = array('q')
+        self.tipe = array('i')
+        self.rapuh = array('b')
+        self.tabel_tipe: List[str] = []
+        self._kode_tipe: Dict[str, int] = {}
+        self._id_data = bytearray()
+        self._id_offset = array('q', [0])
+
+    @classmethod
+    def dari_kolom(cls, kapasitas: int, ukuran, tipe, rapuh, tabel_tipe: List[str], id_data, id_offset) -> 'ProblemArrays':
+        # Membungkus kolom yang sudah ada (mis. view memoryview dari file cache biner) tanpa menyalin.
+        arrays = cls.__new__(cls)
+        arrays.kapasitas = kapasitas
+        arrays.ukuran = ukuran
+        arrays.tipe = tipe
+        arrays.rapuh = rapuh
+        arrays.tabel_tipe = list(tabel_tipe)
+        arrays._kode_tipe = {nama: kode for kode, nama in enumerate(arrays.tabel_tipe)}
+        arrays._id_data = id_data
+        arrays._id_offset = id_offset
+        return arrays
+
+    def __len__(self) -> int:
+        return len(self.ukuran)
+
+    def tambah(self, barang_id: str, ukuran: int, tipe: Optional[str], rapuh: bool) -> None:
+        # Menambahkan satu barang yang sudah divalidasi ke ujung array.
+        self._id_data += barang_id.encode('utf-8')
+        self._id_offset.append(len(self._id_data))
+        self.ukuran.append(ukuran)
+        if tipe is None:
+            self.tipe.append(TANPA_TIPE)
+        else:
+            kode = self._kode_tipe.get(tipe)
+            if kode is None:
+                kode = self._kode_tipe[tipe] = len(self.tabel_tipe)
+                self.tabel_tipe.append(tipe)
+            self.tipe.append(kode)
+        self.rapuh.append(1 if rapuh else 0)
+
+    def id(self, indeks: int) -> str:
+        # ID barang ke-`indeks`, di-decode dari tabel ID.
+        return str(self._id_data[self._id_offset[indeks]:self._id_offset[indeks + 1]], 'utf-8')
+
+    def barang(self, indeks: int) -> Barang:
+        # Membuat objek Barang untuk barang ke-`indeks`.
+        kode = self.tipe[indeks]
+        return Barang(
+            id=self.id(indeks),
+            ukuran=self.ukuran[indeks],
+            tipe=None if kode == TANPA_TIPE else self.tabel_tipe[kode],
+            rapuh=bool(self.rapuh[indeks])
+        )
+
+    def to_items(self) -> List[Barang]:
+        # Mengubah seluruh barang menjadi daftar Barang untuk algoritma berbasis State.
+        return [self.barang(indeks) for indeks in range(len(self))]
+
+
+def _validasi_barang(entri: Any, nomor: int) -> Tuple[str, int, Optional[str], bool]:
+    # Memeriksa satu entri barang dan mengembalikan (id, ukuran, tipe, rapuh).
+    if not isinstance(entri, dict):
+        raise ValueError(f"Barang ke-{nomor} harus berupa objek JSON.")
+    barang_id = entri.get('id')
+    if not isinstance(barang_id, str):
+        raise ValueError(f"Barang ke-{nomor}: 'id' wajib ada dan berupa string.")
+    ukuran = entri.get('ukuran')
+    if not isinstance(ukuran, int) or isinstance(ukuran, bool) or ukuran <= 0:
+        raise ValueError(f"Barang '{barang_id}': 'ukuran' wajib berupa bilangan bulat positif.")
+    tipe = entri.get('tipe')
+    if tipe is not None and not isinstance(tipe, str):
+        raise ValueError(f"Barang '{barang_id}': 'tipe' harus berupa string.")
+    rapuh = entri.get('rapuh', False)
+    if not isinstance(rapuh, bool):
+        raise ValueError(f"Barang '{barang_id}': 'rapuh' harus berupa boolean.")
+    return barang_id, ukuran, tipe, rapuh
+
+
+def _tambah_barang(arrays: ProblemArrays, entri: Any, nomor: int, id_terpakai: Set[str]) -> None:
+    # Memvalidasi satu entri barang (termasuk ID unik) lalu menambahkannya ke `arrays`.
+    barang_id, ukuran, tipe, rapuh = _validasi_barang(entri, nomor)
+    if barang_id in id_terpakai:
+        raise ValueError(f"Barang ke-{nomor}: ID '{barang_id}' sudah dipakai barang lain.")
+    id_terpakai.add(barang_id)
+    arrays.tambah(barang_id, ukuran, tipe, rapuh)
+
+
+def _validasi_kapasitas(kapasitas: Any) -> int:
+    if kapasitas is None:
+        raise ValueError("Problem tidak memiliki 'kapasitas_kontainer'.")
+    if not isinstance(kapasitas, int) or isinstance(kapasitas, bool) or kapasitas <= 0:
+        raise ValueError("'kapasitas_kontainer' wajib berupa bilangan bulat positif.")
+    return kapasitas
+
+
+class _PemindaiJSON:
+    """
+    Pemindai JSON inkremental di atas stream teks.
+
+    Hanya potongan file yang sedang diproses yang disimpan di memori; setiap nilai
+    (mis. satu entri barang) di-decode sendiri-sendiri dengan `JSONDecoder.raw_decode`.
+    """
+
+    def __init__(self, stream: TextIO, ukuran_potongan: int):
+        self._stream = stream
+        self._ukuran_potongan = ukuran_potongan
+        self._decoder = json.JSONDecoder()
+        self._scan_once = self._decoder.scan_once
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _isi(self) -> None:
+        # Membuang bagian buffer yang sudah diproses lalu membaca potongan berikutnya.
+        potongan = self._stream.read(self._ukuran_potongan)
+        self._buf = self._buf[self._pos:] + potongan
+        self._pos = 0
+        self._eof = not potongan
+
+    def intip(self) -> str:
+        # Karakter non-spasi berikutnya tanpa mengonsumsinya ('' di akhir file).
+        while True:
+            cocok = _BUKAN_SPASI.search(self._buf, self._pos)
+            if cocok:
+                self._pos = cocok.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if self._eof:
+                return ''
+            self._isi()
+
+    def harap(self, karakter: str) -> None:
+        ditemukan = self.intip()
+        if ditemukan != karakter:
+            raise ValueError(f"JSON tidak valid: diharapkan '{karakter}', ditemukan '{ditemukan or 'akhir file'}'.")
+        self._pos += 1
+
+    def nilai(self, batas: Optional[int] = None) -> Any:
+        """
+        Membaca satu nilai JSON lengkap dari posisi saat ini.
+
+        Kegagalan decode di ujung buffer bisa berarti nilainya terpotong, sehingga
+        potongan berikutnya dibaca lalu decode diulang. Dengan `batas`, nilai yang
+        lebih panjang dari `batas` karakter dianggap tidak valid.
+        """
+        if self._pos >= len(self._buf) or self._buf[self._pos] in _SPASI:
+            self.intip()
+        while True:
+            try:
+                # scan_once adalah inti raw_decode tanpa pemindaian spasi di depan
+                hasil, akhir = self._scan_once(self._buf, self._pos)
+                # Angka di ujung buffer mungkin masih berlanjut di potongan berikutnya
+                if akhir < len(self._buf) or self._eof:
+                    self._pos = akhir
+                    return hasil
+            except (StopIteration, json.JSONDecodeError):
+                if self._eof or (batas is not None and len(self._buf) - self._pos > batas):
+                    self._gagal()
+            self._isi()
+
+    def _gagal(self) -> None:
+        # Mengulang decode dengan raw_decode untuk mendapatkan pesan error yang jelas.
+        try:
+            self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as e:
+            # Posisi pada e relatif terhadap buffer, bukan file, sehingga tidak ditampilkan
+            raise ValueError(f"JSON tidak valid: {e.msg}.") from None
+        raise ValueError("JSON tidak valid: nilai terlalu panjang.")
+
+    def larik(self, batas: Optional[int] = None) -> Iterator[Any]:
+        # Menghasilkan elemen larik JSON satu per satu; '[' harus sudah dikonsumsi.
+        if self.intip() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.nilai(batas)
+            cocok = _PEMISAH.match(self._buf, self._pos)
+            if cocok is not None:
+                self._pos = cocok.end()
+                pemisah = cocok.group(1)
+            else:
+                pemisah = self.intip()
+                if pemisah not in (',', ']'):
+                    raise ValueError(f"JSON tidak valid: diharapkan ',' atau ']', ditemukan '{pemisah or 'akhir file'}'.")
+                self._pos += 1
+            if pemisah == ']':
+                return
+
+
+def _baca_json(stream: TextIO, arrays: ProblemArrays, ukuran_potongan: int) -> None:
+    # Membaca dokumen {"kapasitas_kontainer": ..., "barang": [...]} (urutan kunci bebas).
+    pemindai = _PemindaiJSON(stream, ukuran_potongan)
+    id_terpakai: Set[str] = set()
+    pemindai.harap('{')
+    if pemindai.intip() == '}':
+        return
+    while True:
+        kunci = pemindai.nilai()
+        if not isinstance(kunci, str):
+            raise ValueError("JSON tidak valid: kunci objek harus berupa string.")
+        pemindai.harap(':')
+        if kunci == 'barang':
+            pemindai.harap('[')
+            for nomor, entri in enumerate(pemindai.larik(batas=BATAS_PANJANG_ENTRI), start=len(arrays) + 1):
+                _tambah_barang(arrays, entri, nomor, id_terpakai)
+        else:
+            nilai = pemindai.nilai()
+            if kunci == 'kapasitas_kontainer':
+                arrays.kapasitas = nilai
+        if pemindai.intip() == ',':
+            pemindai.harap(',')
+        else:
+            pemindai.harap('}')
+            break
+
+
+def _baca_ndjson(stream: TextIO, arrays: ProblemArrays) -> None:
+    # Setiap baris adalah satu objek: baris dengan 'kapasitas_kontainer' adalah header,
+    # baris lainnya satu barang.
+    id_terpakai: Set[str] = set()
+    for nomor_baris, baris in enumerate(stream, start=1):
+        if not baris.strip():
+            continue
+        try:
+            entri = json.loads(baris)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON tidak valid pada baris {nomor_baris}: {e}") from None
+        if isinstance(entri, dict) and 'kapasitas_kontainer' in entri:
+            if arrays.kapasitas is not None and arrays.kapasitas != entri['kapasitas_kontainer']:
+                raise ValueError(f"Baris {nomor_baris}: 'kapasitas_kontainer' berbeda dari header sebelumnya.")
+            arrays.kapasitas = entri['kapasitas_kontainer']
+        else:
+            _tambah_barang(arrays, entri, len(arrays) + 1, id_terpakai)
+
+
+def parse_problem_stream(
+    file_path: str,
+    format_file: Optional[str] = None,
+    ukuran_potongan: int = UKURAN_POTONGAN_DEFAULT
+) -> ProblemArrays:
+    """
+    Membaca file problem secara bertahap ke dalam `ProblemArrays` tanpa memuat
+    seluruh dokumen JSON ke memori.
+
+    Setiap entri barang divalidasi saat dibaca, lalu langsung ditulis ke array
+    bertipe, sehingga puncak memori hanya kelipatan kecil dari ukuran array akhir.
+
+    Args:
+        file_path: Path ke file problem.
+        format_file: 'json' (satu objek dengan 'kapasitas_kontainer' dan 'barang')
+            atau 'ndjson' (satu objek per baris: header berisi 'kapasitas_kontainer'
+            dan satu baris per barang). Default: 'ndjson' untuk ekstensi `.ndjson`,
+            selain itu 'json'.
+        ukuran_potongan: Jumlah karakter yang dibaca per potongan (format JSON).
+
+    Returns:
+        ProblemArrays berisi kapasitas dan seluruh barang.
+    """
+    if format_file is None:
+        format_file = 'ndjson' if file_path.endswith('.ndjson') else 'json'
+    if format_file not in ('json', 'ndjson'):
+        raise ValueError(f"Format file '{format_file}' tidak dikenal. Pilihan: 'json', 'ndjson'.")
+
+    arrays = ProblemArrays()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if format_file == 'json':
+            _baca_json(f, arrays, ukuran_potongan)
+        else:
+            _baca_ndjson(f, arrays)
+    arrays.kapasitas = _validasi_kapasitas(arrays.kapasitas)
+    return arrays
+
+
+
+def problem_from_data(data: Any) -> ProblemArrays:
+    """
+    Memvalidasi problem yang sudah di-decode dari JSON (misalnya satu baris JSONL)
+    dengan aturan yang sama seperti `parse_problem_stream`.
+
+    Args:
+        data: Objek dengan kunci 'kapasitas_kontainer' dan 'barang'.
+
+    Returns:
+        ProblemArrays berisi kapasitas dan seluruh barang.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Problem harus berupa objek JSON.")
+    daftar_barang = data.get('barang', [])
+    if not isinstance(daftar_barang, list):
+        raise ValueError("'barang' harus berupa array JSON.")
+    arrays = ProblemArrays()
+    id_terpakai: Set[str] = set()
+    for nomor, entri in enumerate(daftar_barang, start=1):
+        _tambah_barang(arrays, entri, nomor, id_terpakai)
+    arrays.kapasitas = _validasi_kapasitas(data.get('kapasitas_kontainer'))
+    return arrays
@@ -1,9 +1,17 @@
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import matplotlib.pyplot as plt
+import numpy as np
+
+from src.utils.history import History, history_points
+
+def _titik_plot(history: History) -> Tuple[np.ndarray, np.ndarray]:
+    # Titik histori sebagai array NumPy; array dari BinaryFileHistory dipakai tanpa disalin.
+    xs, ys = history_points(history)
+    return np.asarray(xs), np.asarray(ys, dtype=np.float64)
 
 def plot_progress(
-    score_history: List[float],
+    score_history: History,
     title: str,
     filename: str,
     algorithm_name: str,
@@ -18,7 +26,7 @@ def plot_progress(
     terhadap iterasi atau generasi.
 
     Args:
-        score_history: List berisi nilai skor di setiap iterasi/generasi.
+        score_history: List skor di setiap iterasi/generasi, atau perekam dari `src.utils.history`.
         title: Judul untuk plot.
         filename: Nama file untuk menyimpan plot (tanpa path).
         algorithm_name: Nama algoritma yang digunakan, untuk label.
@@ -29,7 +37,8 @@ def plot_progress(
         duration: Durasi eksekusi dalam detik.
     """
     fig, ax = plt.subplots(figsize=(12, 8))
-    ax.plot(score_history, label=f'Skor {algorithm_name}')
+    xs, ys = _titik_plot(score_history)
+    ax.plot(xs, ys, label=f'Skor {algorithm_name}')
     ax.set_xlabel("Iterasi / Generasi")
     ax.set_ylabel("Skor Fungsi Objektif")
     ax.set_title(title, pad=20)
@@ -59,7 +68,7 @@ def plot_progress(
     print(f"Plot skor disimpan di: {full_path}")
 
 def plot_sa_acceptance_probability(
-    prob_history: List[float],
+    prob_history: History,
     title: str,
     filename: str,
     plots_dir: str,
@@ -70,7 +79,7 @@ def plot_sa_acceptance_probability(
     Membuat dan menyimpan plot khusus untuk probabilitas penerimaan Simulated Annealing.
 
     Args:
-        prob_history: List probabilitas penerimaan per iterasi.
+        prob_history: List probabilitas penerimaan per iterasi, atau perekam dari `src.utils.history`.
         title: Judul untuk plot.
         filename: Nama file untuk menyimpan plot.
         plots_dir: Direktori absolut untuk menyimpan plot.
@@ -78,7 +87,8 @@ def plot_sa_acceptance_probability(
         duration: Durasi eksekusi dalam detik.
     """
     fig, ax = plt.subplots(figsize=(12, 8))
-    ax.plot(prob_history, color='tab:red', linestyle='None', marker='o', alpha=0.8, label='Acceptance Probability')
+    xs, ys = _titik_plot(prob_history)
+    ax.plot(xs, ys, color='tab:red', linestyle='None', marker='o', alpha=0.8, label='Acceptance Probability')
     ax.set_xlabel("Iterasi")
     ax.set_ylabel("Acceptance Probability")
     ax.set_title(title, pad=20)
@@ -1,10 +1,59 @@
+import json
+import math
+import multiprocessing
+import os
+import numpy as np
 import pytest
 import random
+import threading
+import time
 from src.core.data_structures import Barang, State, Kontainer
-from src.core.objective_function import ObjectiveConfig, calculate_objective
-from src.algorithms.hill_climbing import steepest_ascent_hill_climbing
-from src.algorithms.genetic_algorithm import genetic_algorithm
+from src.core.objective_function import ObjectiveConfig, calculate_objective, compute_components
+from src.algorithms.utils.moves import (
+    RelocateMove,
+    SwapMove,
+    best_move,
+    get_all_neighbors,
+    iter_all_moves,
+    iter_prioritized_moves,
+    random_move,
+)
+from src.algorithms.utils.vectorized import best_move_vectorized
+from src.core.initial_state import generate_random_state
+from src.utils.history import MinMaxHistory
+from src.algorithms.hill_climbing import (
+    steepest_ascent_hill_climbing,
+    stochastic_hill_climbing,
+    hill_climbing_with_sideways_moves,
+    first_improvement_hill_climbing,
+    random_restart_hill_climbing,
+    iter_random_restarts,
+)
+import src.algorithms.hill_climbing as hill_climbing
+from src.algorithms.genetic_algorithm import genetic_algorithm, _next_generation
+from src.algorithms.utils.genome import GenomeSpace
+from src.algorithms.utils.fitness_cache import FitnessCache
+import src.batch as batch_module
+from src.batch import main as batch_main
+from src.algorithms.online_packer import OnlinePacker, KEBIJAKAN_ONLINE, KEBIJAKAN_REOPTIMISASI
+from src.core.packing import pack_items
+from src.benchmark.generator import KELAS_INSTANCE, generate_instance
+from src.benchmark.harness import compare_to_baseline, run_benchmarks
+import src.algorithms.island_model as island_model
+from src.algorithms.island_model import island_genetic_algorithm, migration_targets
 from src.algorithms.simulated_annealing import simulated_annealing
+import src.algorithms.parallel_tempering as parallel_tempering_module
+from src.algorithms.parallel_tempering import parallel_tempering, temperature_ladder
+from src.utils.anytime import CancelToken
+from src.algorithms.tabu_search import tabu_search, tabu_attributes, _reverse_attributes
+from src.algorithms.utils.cooling import (
+    CoolingSchedule,
+    LundyMeesCooling,
+    ReheatingCooling,
+    GeometricCooling,
+    calibrate_initial_temperature,
+    sample_uphill_deltas,
+)
 
 def test_steepest_ascent_finds_optimal_solution():
     """
@@ -120,3 +169,763 @@ def test_genetic_algorithm_improves_solution():
 
     # Seharusnya bisa menemukan solusi optimal (2 kontainer) atau tetap di 3
     assert len(final_state.kontainer_list) in [2, 3]
+
+
+def test_moves_apply_and_undo_restore_state():
+    """
+    Menguji apakah setiap gerakan relokasi/pertukaran dapat dinilai tanpa diterapkan,
+    diterapkan secara langsung, lalu dibatalkan hingga state kembali seperti semula.
+    """
+    state = State(
+        kontainer_list=[
+            Kontainer(id=0, kapasitas=100, barang_di_dalam=[Barang("A", 50), Barang("B", 30)]),
+            Kontainer(id=1, kapasitas=100, barang_di_dalam=[Barang("C", 60)]),
+            Kontainer(id=2, kapasitas=100, barang_di_dalam=[Barang("D", 20)]),
+        ]
+    )
+    config = ObjectiveConfig()
+    components = compute_components(state, config)
+    snapshot = [(k.id, [b.id for b in k.barang_di_dalam]) for k in state.kontainer_list]
+
+    moves = list(iter_all_moves(state))
+    assert len(moves) == len(get_all_neighbors(state))
+    for move, neighbor in zip(moves, get_all_neighbors(state)):
+        predicted = move.evaluate(state, components, config).score()
+        move.apply(state)
+        assert predicted == calculate_objective(state, config) == calculate_objective(neighbor, config)
+        move.undo(state)
+        assert [(k.id, [b.id for b in k.barang_di_dalam]) for k in state.kontainer_list] == snapshot
+        assert [k.muatan_saat_ini for k in state.kontainer_list] == [80, 60, 20]
+
+
+def test_vectorized_best_move_matches_scalar():
+    """
+    Menguji apakah penilaian lingkungan tervektorisasi memilih gerakan dan skor yang
+    sama persis dengan jalur skalar, termasuk saat constraint bonus aktif.
+    """
+    rng = random.Random(3)
+    items = [
+        Barang(id=f"X{i}", ukuran=rng.randint(5, 60), tipe=rng.choice(["makanan", "kimia", "buku"]), rapuh=rng.random() < 0.2)
+        for i in range(120)
+    ]
+    for config in (ObjectiveConfig(), ObjectiveConfig(use_fragile_constraint=True, use_incompatible_constraint=True)):
+        state = generate_random_state(items, 100, rng)
+        components = compute_components(state, config)
+        scalar_move, _, scalar_score = best_move(state, components, config)
+        vector_move, _, vector_score = best_move_vectorized(state, components, config)
+        assert repr(vector_move) == repr(scalar_move)
+        assert vector_score == scalar_score
+
+        final_scalar, history_scalar = steepest_ascent_hill_climbing(state, config, max_iter=20, vectorized=False)
+        final_vector, history_vector = steepest_ascent_hill_climbing(state, config, max_iter=20, vectorized=True)
+        assert history_vector == history_scalar
+
+
+def test_parallel_random_restart_matches_serial(capsys):
+    """
+    Menguji bahwa Random-Restart paralel memberikan hasil yang sama dengan versi
+    berurutan untuk seed yang sama, dan bahwa semua restart dilaporkan melalui
+    callback tanpa mencetak apa pun ke stdout.
+    """
+    rng = random.Random(7)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(25)]
+    initial_state = generate_random_state(items, 100, random.Random(1))
+    config = ObjectiveConfig()
+
+    dilaporkan = []
+    serial_state, serial_history = random_restart_hill_climbing(
+        initial_state, config, num_restarts=4, max_iter_per_restart=50, rng=random.Random(3), workers=1,
+        on_restart=lambda result: dilaporkan.append(result.index)
+    )
+    assert dilaporkan == [0, 1, 2, 3, 4]
+    parallel_state, parallel_history = random_restart_hill_climbing(
+        initial_state, config, num_restarts=4, max_iter_per_restart=50, rng=random.Random(3), workers=2
+    )
+    assert parallel_history == serial_history
+    assert calculate_objective(parallel_state, config) == calculate_objective(serial_state, config)
+
+    results = list(iter_random_restarts(
+        initial_state, config, num_restarts=4, max_iter_per_restart=50, rng=random.Random(3), workers=2
+    ))
+    assert sorted(r.index for r in results) == [0, 1, 2, 3, 4]
+    assert capsys.readouterr().out == ""
+
+
+def _restart_lambat(index, *args, **kwargs):
+    # Restart acak yang sengaja lambat; pencarian ke-0 berjalan normal.
+    if index > 0:
+        time.sleep(5)
+    return _run_restart_asli(index, *args, **kwargs)
+
+
+_run_restart_asli = hill_climbing._run_restart
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="patch restart diwariskan lewat fork")
+def test_parallel_random_restart_returns_without_waiting_for_running_restarts(monkeypatch):
+    """
+    Menguji bahwa Random-Restart paralel kembali begitu batas bawah tercapai, tanpa
+    menunggu restart lain yang masih berjalan di worker.
+    """
+    monkeypatch.setattr(hill_climbing, '_run_restart', _restart_lambat)
+    items = [Barang(id=f"B{i}", ukuran=50) for i in range(4)]
+    initial_state = generate_random_state(items, 100, random.Random(1))
+    config = ObjectiveConfig()
+
+    mulai = time.monotonic()
+    results = list(iter_random_restarts(
+        initial_state, config, num_restarts=3, max_iter_per_restart=50, rng=random.Random(3),
+        lower_bound=2, workers=2
+    ))
+    assert time.monotonic() - mulai < 2.5
+    assert [r.index for r in results] == [0]
+    assert len(results[0].state.kontainer_list) == 2
+
+
+def test_island_model_is_deterministic_and_reports_all_islands():
+    """
+    Menguji GA model pulau: hasil sama untuk seed yang sama, histori tersedia
+    untuk setiap pulau, dan histori global tidak pernah memburuk.
+    """
+    assert migration_targets(1, 4, 'ring') == [2]
+    assert migration_targets(1, 4, 'fully_connected') == [0, 2, 3]
+
+    rng = random.Random(5)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(20)]
+    initial_state = generate_random_state(items, 100, random.Random(2))
+    config = ObjectiveConfig()
+    kwargs = dict(num_islands=3, migration_interval=3, migration_size=1, max_generations=9, population_size=6)
+
+    best_state, history, island_histories = island_genetic_algorithm(
+        initial_state, config, topology='fully_connected', rng=random.Random(11), **kwargs
+    )
+    _, _, ulang = island_genetic_algorithm(
+        initial_state, config, topology='fully_connected', rng=random.Random(11), **kwargs
+    )
+
+    assert island_histories == ulang
+    assert len(island_histories) == 3
+    assert all(len(h) == 10 for h in island_histories)
+    assert history == sorted(history, reverse=True)
+    assert calculate_objective(best_state, config) == pytest.approx(history[-1])
+
+
+class _BarrierLambat:
+    # Barrier yang menahan pulau sesaat setelah lolos, sebelum keputusan berhenti dibaca.
+    def __init__(self, barrier, jeda):
+        self._barrier = barrier
+        self._jeda = jeda
+
+    def wait(self):
+        hasil = self._barrier.wait()
+        time.sleep(self._jeda)
+        return hasil
+
+    def abort(self):
+        self._barrier.abort()
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="patch pulau diwariskan lewat fork")
+def test_island_model_early_stop_on_ring_does_not_deadlock(monkeypatch):
+    """
+    Menguji bahwa pulau yang mencapai batas bawah lebih awal pada topologi ring tidak
+    membuat pulau lain berhenti sebelum mengirim migran epoch yang sedang berjalan
+    (sebelumnya pulau penerima menunggu migran selamanya).
+    """
+    worker_asli = island_model._island_worker
+
+    def worker(index, initial_state, config, kapasitas, ga_params, seed, lower_bound, inbox, outboxes,
+               jumlah_pengirim, barrier, *sisa):
+        if index == 1:
+            # Pulau 1 "mencapai batas bawah" pada generasi keempat (epoch 1)
+            panggilan = iter(range(1000))
+            monkeypatch.setattr(island_model, 'reached_lower_bound', lambda *args: next(panggilan) >= 3)
+        elif index == 2:
+            # Pulau 2 tertahan setelah barrier epoch 0 sampai pulau 1 meminta berhenti
+            barrier = _BarrierLambat(barrier, 1.0)
+        worker_asli(index, initial_state, config, kapasitas, ga_params, seed, lower_bound, inbox, outboxes,
+                    jumlah_pengirim, barrier, *sisa)
+
+    monkeypatch.setattr(island_model, '_island_worker', worker)
+    rng = random.Random(5)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(20)]
+    initial_state = generate_random_state(items, 100, random.Random(2))
+
+    hasil = []
+    thread = threading.Thread(target=lambda: hasil.append(island_genetic_algorithm(
+        initial_state, ObjectiveConfig(), num_islands=3, topology='ring', migration_interval=2,
+        migration_size=1, max_generations=20, population_size=6, rng=random.Random(1)
+    )), daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "model pulau macet setelah satu pulau berhenti lebih awal"
+    _, _, island_histories = hasil[0]
+    assert len(island_histories) == 3
+    assert all(len(h) < 21 for h in island_histories)
+
+
+def test_parallel_tempering_reports_best_and_rates():
+    """
+    Menguji parallel tempering: hasil deterministik untuk seed yang sama, skor
+    tidak memburuk, dan statistik tersedia untuk setiap replika.
+    """
+    assert temperature_ladder(1.0, 100.0, 3) == pytest.approx([1.0, 10.0, 100.0])
+
+    rng = random.Random(9)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(20)]
+    initial_state = generate_random_state(items, 100, random.Random(3))
+    config = ObjectiveConfig()
+
+    best_state, history, stats = parallel_tempering(
+        initial_state, config, num_replicas=3, suhu_min=0.01, suhu_max=1.0,
+        max_iter=200, swap_interval=20, rng=random.Random(4)
+    )
+    _, ulang, _ = parallel_tempering(
+        initial_state, config, num_replicas=3, suhu_min=0.01, suhu_max=1.0,
+        max_iter=200, swap_interval=20, rng=random.Random(4)
+    )
+
+    assert history == ulang
+    assert history == sorted(history, reverse=True)
+    assert calculate_objective(best_state, config) == pytest.approx(history[-1])
+    assert len(stats.acceptance_rates) == 3 and len(stats.swap_rates) == 2
+    assert all(0.0 <= rate <= 1.0 for rate in stats.acceptance_rates + stats.swap_rates)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="patch replika diwariskan lewat fork")
+def test_parallel_tempering_raises_when_a_replica_dies(monkeypatch):
+    """
+    Menguji bahwa replika yang mati tanpa membalas (mis. di-kill) menimbulkan error,
+    bukan membuat proses induk menunggu selamanya.
+    """
+    worker_asli = parallel_tempering_module._replica_worker
+
+    def worker(index, *args):
+        if index == 1:
+            os._exit(9)
+        worker_asli(index, *args)
+
+    monkeypatch.setattr(parallel_tempering_module, '_replica_worker', worker)
+    items = [Barang(id=f"B{i:02d}", ukuran=10 + i) for i in range(10)]
+    initial_state = generate_random_state(items, 100, random.Random(3))
+
+    mulai = time.monotonic()
+    with pytest.raises(RuntimeError, match="Replika 1"):
+        parallel_tempering(initial_state, ObjectiveConfig(), num_replicas=3, suhu_min=0.01, suhu_max=1.0,
+                           max_iter=200, swap_interval=20, rng=random.Random(4))
+    assert time.monotonic() - mulai < 10
+
+
+def test_simulated_annealing_in_place_keeps_best_snapshot():
+    """
+    Menguji SA in-place: state awal tidak berubah, state terbaik yang dikembalikan
+    sesuai dengan skor terendah di histori, dan hasil deterministik dengan rng yang sama.
+    """
+    rng = random.Random(21)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(30)]
+    initial_state = generate_random_state(items, 100, random.Random(6))
+    config = ObjectiveConfig()
+    skor_awal = calculate_objective(initial_state, config)
+
+    best_state, history, probabilities = simulated_annealing(
+        initial_state, suhu_awal=0.5, cooling_rate=0.995, max_iter=2000, config=config, rng=random.Random(8)
+    )
+    _, ulang, _ = simulated_annealing(
+        initial_state, suhu_awal=0.5, cooling_rate=0.995, max_iter=2000, config=config, rng=random.Random(8)
+    )
+
+    assert calculate_objective(initial_state, config) == skor_awal
+    assert history == ulang
+    assert len(history) == len(probabilities)
+    assert calculate_objective(best_state, config) == pytest.approx(min(history))
+    assert sorted(b.id for k in best_state.kontainer_list for b in k.barang_di_dalam) == sorted(b.id for b in items)
+
+    # Dengan perekam, histori yang dikembalikan adalah perekam itu sendiri
+    recorder = MinMaxHistory(max_buckets=16)
+    _, histori, probabilitas = simulated_annealing(
+        initial_state, suhu_awal=0.5, cooling_rate=0.995, max_iter=2000, config=config, rng=random.Random(8), recorder=recorder
+    )
+    assert histori is recorder and isinstance(probabilitas, MinMaxHistory)
+    assert len(recorder) == len(history) and recorder.last == history[-1]
+    assert min(recorder.points()[1]) == min(history)
+
+
+def test_simulated_annealing_neutral_moves_do_not_snapshot(monkeypatch):
+    """
+    Menguji bahwa gerakan netral (delta 0) dari state terbaik tidak menyalin state:
+    pada dataran skor, satu-satunya salinan adalah salinan state awal.
+    """
+    # Dua kontainer penuh berisi barang berukuran sama: setiap pertukaran netral,
+    # setiap relokasi memperburuk skor dan ditolak pada suhu yang sangat rendah
+    items = [Barang(id=f"B{i}", ukuran=25) for i in range(8)]
+    initial_state = State([
+        Kontainer(id=0, kapasitas=100, barang_di_dalam=items[:4]),
+        Kontainer(id=1, kapasitas=100, barang_di_dalam=items[4:]),
+    ])
+    config = ObjectiveConfig()
+    salin_asli = State.salin
+    jumlah_salin = []
+
+    def salin_terhitung(self):
+        jumlah_salin.append(1)
+        return salin_asli(self)
+
+    monkeypatch.setattr(State, "salin", salin_terhitung)
+    best_state, history, probabilities = simulated_annealing(
+        initial_state, suhu_awal=1e-9, cooling_rate=0.99, max_iter=500, config=config, rng=random.Random(3)
+    )
+
+    assert sum(p == 1.0 for p in probabilities[1:]) > 0
+    assert len(jumlah_salin) == 1
+    assert calculate_objective(best_state, config) == pytest.approx(min(history))
+
+
+def test_cooling_calibration_schedules_and_stall_stop():
+    """
+    Menguji kalibrasi suhu awal (laju penerimaan sampel sesuai target), jadwal
+    Lundy-Mees yang mencapai suhu akhir, pemanasan ulang, dan penghentian SA saat stagnan.
+    """
+    rng = random.Random(4)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(40)]
+    initial_state = generate_random_state(items, 100, random.Random(9))
+    config = ObjectiveConfig()
+
+    deltas = sample_uphill_deltas(initial_state, config, rng=random.Random(1))
+    suhu = calibrate_initial_temperature(initial_state, config, target_acceptance=0.5, rng=random.Random(1))
+    assert deltas and all(0 < d < 1e5 for d in deltas)
+    assert sum(math.exp(-d / suhu) for d in deltas) / len(deltas) == pytest.approx(0.5, abs=1e-6)
+    with pytest.raises(ValueError):
+        calibrate_initial_temperature(initial_state, config, target_acceptance=1.0)
+
+    jadwal = LundyMeesCooling.dari_suhu_akhir(10.0, 0.01, 500)
+    for _ in range(500):
+        jadwal.update(1.0, False, False)
+    assert jadwal.suhu == pytest.approx(0.01)
+
+    reheat = ReheatingCooling(GeometricCooling(10.0, 0.5), stall_iter=5)
+    for _ in range(5):
+        reheat.update(1.0, False, False)
+    assert reheat.jumlah_pemanasan == 1 and reheat.suhu == pytest.approx(5.0)
+    with pytest.raises(TypeError):
+        CoolingSchedule(10.0)
+
+    _, history, _ = simulated_annealing(
+        initial_state, suhu_awal=suhu, cooling_rate=0.999, max_iter=100000, config=config,
+        rng=random.Random(2), max_stall_iter=300
+    )
+    assert len(history) - 1 < 100000
+
+
+def test_time_limit_and_cancel_token_return_anytime_result():
+    """
+    Menguji mode anytime: token yang sudah dibatalkan mengembalikan state awal,
+    dan batas waktu menghentikan run yang iterasinya praktis tak terbatas.
+    """
+    rng = random.Random(12)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(40)]
+    initial_state = generate_random_state(items, 100, random.Random(3))
+    config = ObjectiveConfig()
+    skor_awal = calculate_objective(initial_state, config)
+
+    token = CancelToken()
+    token.cancel()
+    runs = [
+        lambda **kw: simulated_annealing(initial_state, 1.0, 0.99, 1000, config, **kw),
+        lambda **kw: steepest_ascent_hill_climbing(initial_state, config, 1000, **kw),
+        lambda **kw: stochastic_hill_climbing(initial_state, config, 1000, **kw),
+        lambda **kw: random_restart_hill_climbing(initial_state, config, 5, 1000, rng=random.Random(1), **kw),
+    ]
+    for run in runs:
+        state, history = run(cancel_token=token)[:2]
+        assert len(history) == 1
+        assert calculate_objective(state, config) == pytest.approx(skor_awal)
+
+    state, history = genetic_algorithm(initial_state, config, max_generations=1000, rng=random.Random(1), cancel_token=token)
+    assert len(history) == 1
+
+    mulai = time.monotonic()
+    state, history, _ = simulated_annealing(
+        initial_state, 1.0, 0.9999, 10 ** 9, config, rng=random.Random(2), time_limit=0.2
+    )
+    assert time.monotonic() - mulai < 2.0
+    assert calculate_objective(state, config) == pytest.approx(min(history))
+    assert calculate_objective(state, config) <= skor_awal
+
+
+def test_first_improvement_hill_climbing_scans_full_neighborhood_lazily():
+    """
+    Menguji urutan prioritas (himpunan gerakan sama dengan lingkungan penuh, kontainer
+    asal termuda lebih dulu) dan hasil First-Improvement HC yang deterministik dengan rng.
+    """
+    rng = random.Random(17)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(30)]
+    initial_state = generate_random_state(items, 100, random.Random(5))
+    config = ObjectiveConfig()
+
+    def kunci(move):
+        # Pertukaran (a, b) dan (b, a) adalah gerakan yang sama
+        if hasattr(move, 'barang1'):
+            return frozenset([(move.barang1.id, move.kontainer1.id), (move.barang2.id, move.kontainer2.id)])
+        return (move.barang.id, move.asal.id, None if move.tujuan is None else move.tujuan.id)
+
+    prioritas = list(iter_prioritized_moves(initial_state, random.Random(1)))
+    semua = [kunci(move) for move in iter_all_moves(initial_state)]
+    assert len(prioritas) == len(semua) and set(map(kunci, prioritas)) == set(semua)
+    muatan_minimum = min(k.muatan_saat_ini for k in initial_state.kontainer_list)
+    assert prioritas[0].asal.muatan_saat_ini == muatan_minimum
+
+    final_state, history = first_improvement_hill_climbing(initial_state, config, 1000, rng=random.Random(3))
+    _, ulang = first_improvement_hill_climbing(initial_state, config, 1000, rng=random.Random(3))
+    assert history == ulang
+    assert history[-1] <= history[0]
+    assert calculate_objective(final_state, config) == pytest.approx(history[-1])
+    # Berhenti di optimum lokal: tidak ada tetangga yang lebih baik
+    _, _, skor_tetangga_terbaik = best_move(final_state, compute_components(final_state, config), config)
+    assert skor_tetangga_terbaik >= history[-1]
+
+
+def test_tabu_search_keeps_best_and_never_worse_than_steepest():
+    """
+    Menguji atribut tabu dan Tabu Search: fase turunnya identik dengan Steepest Ascent
+    (aspirasi selalu mengizinkan perbaikan), sehingga hasilnya tidak lebih buruk, dan
+    dari optimum lokal pencarian benar-benar keluar alih-alih mengulang gerakan kosong.
+    """
+    kontainer_a = Kontainer(id=0, kapasitas=100, barang_di_dalam=[Barang(id="A", ukuran=40)])
+    kontainer_b = Kontainer(id=1, kapasitas=100, barang_di_dalam=[Barang(id="B", ukuran=30)])
+    barang_a, barang_b = kontainer_a.barang_di_dalam[0], kontainer_b.barang_di_dalam[0]
+    assert tabu_attributes(RelocateMove(barang_a, kontainer_a, kontainer_b)) == (("A", 1),)
+    assert tabu_attributes(RelocateMove(barang_a, kontainer_a, None)) == (("A", None),)
+    assert set(tabu_attributes(SwapMove(barang_a, kontainer_a, barang_b, kontainer_b))) == {("A", 1), ("B", 0)}
+    # Kontainer asal yang hanya berisi barang itu akan hilang (ID-nya dipakai ulang),
+    # sehingga yang dilarang adalah kembali ke kontainer sendiri, bukan ke ID tersebut
+    assert _reverse_attributes(RelocateMove(barang_a, kontainer_a, kontainer_b)) == (("A", None),)
+
+    rng = random.Random(31)
+    items = [Barang(id=f"B{i:02d}", ukuran=rng.randint(10, 60)) for i in range(30)]
+    initial_state = generate_random_state(items, 100, random.Random(4))
+    config = ObjectiveConfig()
+
+    hc_state, hc_history = steepest_ascent_hill_climbing(initial_state, config, 1000, vectorized=False)
+    best_state, history = tabu_search(initial_state, config, 300, tenure=7)
+    assert len(history) == 301
+    assert calculate_objective(best_state, config) == pytest.approx(min(history))
+    assert min(history) <= hc_history[-1]
+    assert sorted(b.id for k in best_state.kontainer_list for b in k.barang_di_dalam) == sorted(b.id for b in items)
+
+    # Dari optimum lokal, setiap iterasi mengubah solusi; skor tidak tertahan di satu nilai
+    _, dari_optimum = tabu_search(hc_state, config, 50, tenure=7)
+    assert dari_optimum[0] == hc_history[-1]
+    assert len(set(dari_optimum)) > 1
+
+    _, sampel = tabu_search(initial_state, config, 200, candidate_size=50, rng=random.Random(1), max_stall_iter=50)
+    assert len(sampel) <= 201
+
+
+def test_genome_space_matches_state_objective_and_repairs_children():
+    """
+    Menguji bahwa skor genom sama dengan skor State hasil decode (termasuk constraint),
+    encode/decode konsisten, dan anak hasil crossover/mutasi selalu valid.
+    """
+    rng = random.Random(5)
+    items = [
+        Barang(id=f"B{i}", ukuran=rng.randint(5, 120),
+               tipe=rng.choice(['makanan', 'kimia', 'umum']), rapuh=rng.random() < 0.3)
+        for i in range(60)
+    ]
+    config = ObjectiveConfig(use_fragile_constraint=True, use_incompatible_constraint=True)
+    space = GenomeSpace(items, 100, config)
+
+    for _ in range(30):
+        parent1, parent2 = space.random_genome(rng), space.random_genome(rng)
+        child1, child2 = space.crossover(parent1, parent2, rng)
+        space.mutate(child1, rng)
+        for genome in (parent1, child1, child2):
+            state = space.decode(genome)
+            assert space.score(genome) == pytest.approx(calculate_objective(state, config))
+            assert (space.encode(state) == genome).all()
+            assert all(k.muatan_saat_ini <= 100 for k in state.kontainer_list)
+            # Barang yang lebih besar dari kapasitas tetap tidak dialokasikan
+            assert {b.id for b in state.barang_belum_dialokasi} == {b.id for b in items if b.ukuran > 100}
+            assert sum(len(k.barang_di_dalam) for k in state.kontainer_list) + len(state.barang_belum_dialokasi) == 60
+
+    initial_state = generate_random_state(items, 100, random.Random(1))
+    hasil = [
+        genetic_algorithm(initial_state, config, max_generations=15, population_size=8, rng=random.Random(3))
+        for _ in range(2)
+    ]
+    assert hasil[0][1] == hasil[1][1]
+    assert hasil[0][1][-1] <= calculate_objective(initial_state, config)
+    assert hasil[0][1][-1] == pytest.approx(calculate_objective(hasil[0][0], config))
+
+
+def test_fitness_cache_is_lru_and_does_not_change_ga_result():
+    """
+    Menguji cache fitness: genom dengan partisi sama (urutan kontainer berbeda) berbagi
+    entri, entri terlama dibuang, dan GA memberi hasil yang sama dengan atau tanpa cache.
+    """
+    items = [Barang(id=f"B{i}", ukuran=10 + i) for i in range(6)]
+    space = GenomeSpace(items, 100, ObjectiveConfig())
+    state = State(kontainer_list=[
+        Kontainer(id=0, kapasitas=100, barang_di_dalam=items[:3]),
+        Kontainer(id=1, kapasitas=100, barang_di_dalam=items[3:]),
+    ])
+    dibalik = State(kontainer_list=[
+        Kontainer(id=7, kapasitas=100, barang_di_dalam=items[3:]),
+        Kontainer(id=3, kapasitas=100, barang_di_dalam=items[:3]),
+    ])
+    cache = FitnessCache(maxsize=1)
+    pemanggilan = []
+
+    def hitung(genome):
+        pemanggilan.append(genome)
+        return space.score(genome)
+
+    cache.get_or_compute(space.encode(state), hitung)
+    cache.get_or_compute(space.encode(dibalik), hitung)
+    assert (cache.hits, cache.misses, len(pemanggilan)) == (1, 1, 1)
+    cache.get_or_compute(space.encode(State(kontainer_list=[
+        Kontainer(id=0, kapasitas=100, barang_di_dalam=list(items))])), hitung)
+    cache.get_or_compute(space.encode(state), hitung)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 1)
+
+    rng = random.Random(11)
+    barang = [Barang(id=f"C{i}", ukuran=rng.randint(5, 60)) for i in range(80)]
+    initial_state = generate_random_state(barang, 100, random.Random(2))
+    hasil = {}
+    for ukuran in (0, 4096):
+        cache = FitnessCache(ukuran)
+        hasil[ukuran] = genetic_algorithm(
+            initial_state, ObjectiveConfig(), max_generations=20, population_size=10,
+            rng=random.Random(4), fitness_cache=cache,
+        )[1]
+        assert cache.hits + cache.misses == 10 * 21
+    assert hasil[0] == hasil[4096]
+    assert cache.hits > 0
+
+
+def test_zobrist_hash_is_order_independent_and_incremental():
+    """
+    Menguji hash Zobrist: tidak bergantung urutan/ID kontainer, diperbarui gerakan dalam
+    O(1) dengan hasil sama seperti perhitungan ulang, dan konsisten dengan hash genom GA.
+    """
+    rng = random.Random(8)
+    items = [Barang(id=f"B{i}", ukuran=rng.randint(5, 60)) for i in range(40)]
+    a = State(kontainer_list=[Kontainer(id=0, kapasitas=100, barang_di_dalam=items[:2]),
+                              Kontainer(id=1, kapasitas=100, barang_di_dalam=[items[2]])])
+    b = State(kontainer_list=[Kontainer(id=4, kapasitas=100, barang_di_dalam=[items[2]]),
+                              Kontainer(id=9, kapasitas=100, barang_di_dalam=[items[1], items[0]])])
+    c = State(kontainer_list=[Kontainer(id=0, kapasitas=100, barang_di_dalam=[items[0], items[2]]),
+                              Kontainer(id=1, kapasitas=100, barang_di_dalam=[items[1]])])
+    assert a.kode_hash == b.kode_hash != c.kode_hash
+
+    def hitung_ulang(state):
+        return State(kontainer_list=[
+            Kontainer(id=k.id, kapasitas=k.kapasitas, barang_di_dalam=list(k.barang_di_dalam))
+            for k in state.kontainer_list
+        ]).kode_hash
+
+    state = generate_random_state(items, 100, rng)
+    for _ in range(300):
+        move = random_move(state, rng)
+        sesudah = move.resulting_hash(state)
+        move.apply(state)
+        assert state.kode_hash == sesudah == hitung_ulang(state)
+        if rng.random() < 0.3:
+            move.undo(state)
+            assert state.kode_hash == hitung_ulang(state)
+
+    space = GenomeSpace(items, 100, ObjectiveConfig())
+    genome = space.encode(state)
+    assert space.kode_hash(genome) == state.kode_hash
+
+    # Opsi deduplicate: generasi baru tidak berisi dua pengepakan yang sama
+    populasi = np.array([genome] * 10)
+    skor = [space.score(g) for g in populasi]
+    baru, _ = _next_generation(populasi, skor, space, FitnessCache(), 0.8, 0.2, 3, 2, random.Random(1), True)
+    assert len({space.kode_hash(g) for g in baru}) == len(baru)
+
+
+def test_sideways_hill_climbing_never_revisits_a_state(monkeypatch):
+    """
+    Menguji bahwa HC sideways tidak memantul di antara dua state pada plateau:
+    setiap state yang dilalui (dilacak dengan hash Zobrist) berbeda.
+    """
+    rng = random.Random(3)
+    items = [Barang(id=f"S{i}", ukuran=rng.choice([20, 25, 30, 50])) for i in range(60)]
+    initial_state = generate_random_state(items, 100, random.Random(3))
+    dikunjungi = []
+
+    # Catat hash state setiap kali sebuah gerakan diterapkan
+    for kelas in (RelocateMove, SwapMove):
+        def apply(self, state, _asli=kelas.apply):
+            _asli(self, state)
+            dikunjungi.append(state.kode_hash)
+        monkeypatch.setattr(kelas, 'apply', apply)
+
+    hill_climbing_with_sideways_moves(initial_state, ObjectiveConfig(), max_iter=500, max_sideways_moves=30)
+    assert len(dikunjungi) > 30
+    assert len(set(dikunjungi)) == len(dikunjungi)
+    assert initial_state.kode_hash not in dikunjungi
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_solves_files_and_jsonl_streams(tmp_path, jobs):
+    """
+    Menguji mode batch: semua problem dari direktori dan file JSONL diselesaikan,
+    problem yang rusak atau tidak valid dicatat sebagai error tanpa menghentikan batch.
+    """
+    for nama, kapasitas in (("a", 100), ("b", 50)):
+        data = {"kapasitas_kontainer": kapasitas,
+                "barang": [{"id": f"{nama}{i}", "ukuran": 10 + i} for i in range(8)]}
+        (tmp_path / f"{nama}.json").write_text(json.dumps(data))
+    (tmp_path / "stream.jsonl").write_text(
+        json.dumps({"id": "c", "kapasitas_kontainer": 40, "barang": [{"id": "c0", "ukuran": 30}]}) + "\n\n{rusak\n"
+        + json.dumps({"id": "negatif", "kapasitas_kontainer": 40, "barang": [{"id": "n0", "ukuran": -3}]}) + "\n"
+        + json.dumps({"id": "kembar", "kapasitas_kontainer": 40,
+                      "barang": [{"id": "k0", "ukuran": 5}, {"id": "k0", "ukuran": 6}]}) + "\n"
+        + json.dumps({"id": "tanpa_kapasitas", "barang": [{"id": "t0", "ukuran": 5}]}) + "\n"
+    )
+    output = tmp_path / "hasil.out"
+    batch_main([str(tmp_path), "--algoritma", "hc", "--jobs", str(jobs), "--output", str(output), "--format", "jsonl"])
+
+    hasil = {r["problem"]: r for r in map(json.loads, output.read_text().splitlines())}
+    assert set(hasil) == {"a", "b", "c", f"{tmp_path / 'stream.jsonl'}:3", "negatif", "kembar", "tanpa_kapasitas"}
+    assert sorted(r["index"] for r in hasil.values()) == list(range(7))
+    assert hasil["a"]["status"] == "ok" and hasil["a"]["num_items"] == 8
+    assert hasil["c"]["num_containers_final"] == 1
+    assert hasil[f"{tmp_path / 'stream.jsonl'}:3"]["status"] == "error"
+    # Record JSONL divalidasi seperti file problem: setiap record tidak valid menjadi baris error
+    assert "bilangan bulat positif" in hasil["negatif"]["error"]
+    assert "sudah dipakai" in hasil["kembar"]["error"]
+    assert "kapasitas_kontainer" in hasil["tanpa_kapasitas"]["error"]
+    assert all(hasil[p]["status"] == "error" for p in ("negatif", "kembar", "tanpa_kapasitas"))
+
+
+def test_batch_stdout_contains_only_results(tmp_path, monkeypatch, capsys):
+    """
+    Menguji bahwa output konsol dari solver tidak bercampur dengan hasil JSONL
+    ketika batch menulis ke stdout (default `--output -`).
+    """
+    solve_asli = batch_module.solve_problem
+
+    def solve_berisik(*args, **kwargs):
+        print("progres solver")
+        return solve_asli(*args, **kwargs)
+
+    monkeypatch.setattr(batch_module, "solve_problem", solve_berisik)
+    data = {"kapasitas_kontainer": 100, "barang": [{"id": f"x{i}", "ukuran": 10 + i} for i in range(6)]}
+    (tmp_path / "x.json").write_text(json.dumps(data))
+    batch_main([str(tmp_path / "x.json"), "--algoritma", "hc", "--hc_variant", "random_restart", "--num_restarts", "2"])
+
+    keluaran = capsys.readouterr()
+    baris = keluaran.out.splitlines()
+    assert len(baris) == 1 and json.loads(baris[0])["status"] == "ok"
+    assert "progres solver" in keluaran.err
+
+
+def test_online_packer_policies_place_every_item_within_capacity():
+    """
+    Menguji OnlinePacker: setiap kebijakan menempatkan semua barang tanpa melebihi
+    kapasitas, kontainer tertutup tidak disimpan, dan Best-Fit online identik dengan
+    pack_items best_fit tanpa pengurutan.
+    """
+    rng = random.Random(5)
+    items = [Barang(id=f"O{i}", ukuran=rng.randint(1, 70)) for i in range(400)]
+    for kebijakan in KEBIJAKAN_ONLINE:
+        for opsi in ({}, {'max_open_bins': 3}, {'reoptimize_every': 25, 'reoptimize_iter': 10}):
+            if 'reoptimize_every' in opsi and kebijakan in ('next_fit', 'harmonic'):
+                with pytest.raises(ValueError):
+                    OnlinePacker(100, kebijakan, **opsi)
+                continue
+            tertutup = []
+            packer = OnlinePacker(100, kebijakan, on_close=tertutup.append, **opsi)
+            for barang in items:
+                packer.add(barang)
+                if 'max_open_bins' in opsi and kebijakan != 'harmonic':
+                    assert len(packer.open_bins) <= opsi['max_open_bins']
+            packer.close_all()
+            assert len(packer.closed_bins) == 0
+            assert packer.jumlah_kontainer == len(tertutup)
+            assert all(k.muatan_saat_ini <= 100 for k in tertutup)
+            assert sorted(b.id for k in tertutup for b in k.barang_di_dalam) == sorted(b.id for b in items)
+
+    packer = OnlinePacker(100, 'best_fit')
+    kontainer_ids = packer.add_batch(items, decreasing=False)
+    offline = pack_items([b.ukuran for b in items], 100, 'best_fit', decreasing=False)
+    assert packer.jumlah_kontainer == len(offline)
+    assert all(kontainer_ids[i] == slot + 1 for slot, isi in enumerate(offline) for i in isi)
+
+    # Harmonic-k: barang kelas j (ukuran dalam (C/(j+1), C/j]) dikemas tepat j per kontainer
+    packer = OnlinePacker(100, 'harmonic', harmonic_k=3, keep_closed=10)
+    for i in range(4):
+        packer.add(Barang(id=f"H{i}", ukuran=40))
+    assert [len(k.barang_di_dalam) for k in packer.closed_bins] == [2, 2]
+
+
+def test_online_reoptimization_keeps_every_item_with_constraints():
+    """
+    Menguji reoptimisasi online dengan constraint rapuh/inkompatibel: local search
+    dapat membuka kontainer baru, yang harus mendapat ID unik sehingga tidak ada
+    barang yang hilang atau kontainer yang tertimpa.
+    """
+    config = ObjectiveConfig(use_fragile_constraint=True, use_incompatible_constraint=True)
+    packer = OnlinePacker(100, 'first_fit', reoptimize_every=3, config=config)
+    kontainer_ids = [packer.add(b) for b in (
+        Barang(id="a", ukuran=20, tipe="makanan"), Barang(id="b", ukuran=20, tipe="kimia"),
+        Barang(id="c", ukuran=90), Barang(id="d", ukuran=95), Barang(id="e", ukuran=50)
+    )]
+    assert kontainer_ids[3] != kontainer_ids[2]
+    semua = packer.close_all()
+    assert sorted(b.id for k in semua for b in k.barang_di_dalam) == ["a", "b", "c", "d", "e"]
+
+    rng = random.Random(11)
+    items = [Barang(id=f"R{i}", ukuran=rng.randint(5, 60), tipe=rng.choice(["makanan", "kimia", None]),
+                    rapuh=rng.random() < 0.3) for i in range(300)]
+    for kebijakan in KEBIJAKAN_REOPTIMISASI:
+        tertutup = []
+        packer = OnlinePacker(100, kebijakan, on_close=tertutup.append, max_open_bins=6,
+                              reoptimize_every=7, reoptimize_iter=20, config=config)
+        for barang in items:
+            packer.add(barang)
+        packer.close_all()
+        assert len({k.id for k in tertutup}) == len(tertutup) == packer.jumlah_kontainer
+        assert all(k.muatan_saat_ini <= 100 for k in tertutup)
+        assert sorted(b.id for k in tertutup for b in k.barang_di_dalam) == sorted(b.id for b in items)
+
+
+def test_instance_generator_is_reproducible_and_triplets_are_optimal():
+    """
+    Menguji generator instance: seed yang sama menghasilkan instance identik, dan
+    kelas triplet Falkenauer mengisi tepat n/3 kontainer.
+    """
+    for kelas in KELAS_INSTANCE:
+        instance = generate_instance(kelas, 60, seed=4)
+        assert instance == generate_instance(kelas, 60, seed=4)
+        assert all(0 < b.ukuran <= instance.kapasitas for b in instance.items)
+    assert generate_instance('scholl_1', 60, seed=4) != generate_instance('scholl_1', 60, seed=5)
+
+    triplet = generate_instance('falkenauer_t', 300, seed=2, peluang_tipe=0.0)
+    assert triplet.optimum == 100
+    assert sum(b.ukuran for b in triplet.items) == 100 * triplet.kapasitas
+    assert all(250 < b.ukuran < 500 and b.tipe is None for b in triplet.items)
+
+
+def test_benchmark_harness_flags_regressions_against_baseline():
+    """
+    Menguji harness benchmark: hasil dicatat per (benchmark, kelas, n), instance di
+    atas batas ukuran dilewati, dan perbandingan dengan baseline mendeteksi regresi.
+    """
+    hasil = run_benchmarks(['falkenauer_u'], [20, 200], ['objective', 'neighbors', 'hc'],
+                           min_time=0.01, max_iter=50, time_limit=2.0, log=lambda _: None)
+    per_kunci = {(h['benchmark'], h['n']): h for h in hasil}
+    assert per_kunci[('neighbors', 200)]['status'] == 'skipped'
+    assert per_kunci[('objective', 20)]['ops_per_sec'] > 0
+    assert per_kunci[('hc', 20)]['num_containers'] >= per_kunci[('hc', 20)]['lower_bound']
+    assert per_kunci[('hc', 20)]['peak_memory_bytes'] > 0
+
+    assert compare_to_baseline(hasil, hasil) == []
+    lebih_cepat = [dict(h, ops_per_sec=h['ops_per_sec'] * 10) if 'ops_per_sec' in h else h for h in hasil]
+    regresi = compare_to_baseline(hasil, lebih_cepat)
+    assert {(r['benchmark'], r['metric']) for r in regresi} == {('objective', 'ops_per_sec'), ('neighbors', 'ops_per_sec')}
+    skor_lebih_baik = [dict(h, final_score=h['final_score'] / 2) if 'final_score' in h else h for h in hasil]
+    assert {r['metric'] for r in compare_to_baseline(hasil, skor_lebih_baik)} == {'final_score'}
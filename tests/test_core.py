@@ -1,13 +1,26 @@
 import unittest
+import random
 import sys
 import os
+import tempfile
+import json
+from unittest import mock
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.core.data_structures import Barang, Kontainer, State
-from src.core.objective_function import calculate_objective, ObjectiveConfig
-from src.core.initial_state import generate_ffd_state
-from src.utils.file_parser import parse_problem
+from src.core.objective_function import (
+    calculate_objective, ObjectiveConfig, compute_components, relocation_delta, swap_delta
+)
+from src.core.initial_state import generate_ffd_state, generate_bfd_state, generate_wfd_state
+from src.core.packing import BestFitIndex, CapacityTree, pack_items
+from src.utils.file_parser import parse_problem, parse_problem_data
+from src.utils.stream_parser import parse_problem_stream, TANPA_TIPE
+from src.utils import problem_cache
+from src.utils.problem_cache import load_problem_cached, open_problem_cache, cache_path_for
+from src.core.array_state import ArrayState, TANPA_KONTAINER
+from src.utils.history import HistoryRecorder, FullHistory, DecimatedHistory, MinMaxHistory, BinaryFileHistory, history_points
+from src.core.lower_bound import lower_bound_l1, lower_bound_l2, compute_lower_bound, reached_lower_bound
 
 class TestCoreComponents(unittest.TestCase):
 
@@ -28,6 +41,34 @@ class TestCoreComponents(unittest.TestCase):
         self.assertTrue(kontainer.bisa_tambah_barang(Barang('B02', 90)))
         self.assertFalse(kontainer.bisa_tambah_barang(Barang('B03', 91)))
 
+    def test_kontainer_cached_aggregates(self):
+        # Mengecek agregat kontainer selalu konsisten setelah barang ditambah atau dihapus
+        rapuh = Barang('R01', 10, tipe='elektronik', rapuh=True)
+        makanan = Barang('M01', 30, tipe='makanan')
+        kimia = Barang('K01', 20, tipe='kimia')
+        kontainer = Kontainer(id=0, kapasitas=100, barang_di_dalam=[rapuh, makanan])
+        self.assertEqual(kontainer.muatan_saat_ini, 40)
+        self.assertEqual(kontainer.muatan_non_rapuh, 30)
+        self.assertEqual(kontainer.jumlah_rapuh, 1)
+
+        kontainer.tambah_barang(kimia)
+        self.assertEqual(kontainer.muatan_saat_ini, 60)
+        self.assertTrue(kontainer.punya_tipe('kimia'))
+
+        kontainer.hapus_barang(makanan)
+        kontainer.hapus_barang(rapuh)
+        self.assertEqual(kontainer.muatan_saat_ini, 20)
+        self.assertEqual(kontainer.muatan_non_rapuh, 20)
+        self.assertEqual(kontainer.jumlah_rapuh, 0)
+        self.assertFalse(kontainer.punya_tipe('makanan'))
+        self.assertEqual(kontainer.jumlah_per_tipe, {'kimia': 1})
+
+        # Salinan membawa agregat tanpa berbagi list barang
+        salinan = kontainer.salin()
+        salinan.tambah_barang(makanan)
+        self.assertEqual(salinan.muatan_saat_ini, 50)
+        self.assertEqual(kontainer.muatan_saat_ini, 20)
+
     def test_file_parser(self):
         # Mengecek fungsi parse_problem dari file_parser
         file_path = 'src/data/problem_A.json'
@@ -42,6 +83,79 @@ class TestCoreComponents(unittest.TestCase):
         self.assertEqual(item1.tipe, 'makanan')
         self.assertFalse(item1.rapuh)
 
+    def test_stream_parser(self):
+        # Mengecek parser bertahap: hasil sama dengan json.load untuk JSON dan NDJSON,
+        # termasuk saat entri terpotong di batas potongan, dan entri rusak ditolak
+        data = {
+            "barang": [{"id": f"B{i}", "ukuran": 10 + i, "tipe": ["a", "b", None][i % 3], "rapuh": i % 4 == 0}
+                       for i in range(50)],
+            "catatan": {"sumber": "uji"},
+            "kapasitas_kontainer": 100,
+        }
+        barang_list, kapasitas = parse_problem_data(data)
+        with tempfile.TemporaryDirectory() as tmp:
+            path_json = os.path.join(tmp, "problem.json")
+            with open(path_json, "w") as f:
+                json.dump(data, f, indent=2)
+            for ukuran_potongan in (1, 7, 4096):
+                arrays = parse_problem_stream(path_json, ukuran_potongan=ukuran_potongan)
+                self.assertEqual(arrays.kapasitas, kapasitas)
+                self.assertEqual(arrays.to_items(), barang_list)
+            self.assertEqual(arrays.tabel_tipe, ["a", "b"])
+            self.assertEqual(arrays.tipe[2], TANPA_TIPE)
+            self.assertEqual(list(arrays.ukuran), [b.ukuran for b in barang_list])
+
+            path_ndjson = os.path.join(tmp, "problem.ndjson")
+            with open(path_ndjson, "w") as f:
+                f.write(json.dumps({"kapasitas_kontainer": 100}) + "\n")
+                f.writelines(json.dumps(entri) + "\n" for entri in data["barang"])
+            self.assertEqual(parse_problem(path_ndjson), (barang_list, kapasitas))
+
+            with open(path_json, "w") as f:
+                json.dump({"kapasitas_kontainer": 100, "barang": [{"id": "X", "ukuran": -5}]}, f)
+            with self.assertRaises(ValueError):
+                parse_problem_stream(path_json)
+
+            # ID barang harus unik, baik di file maupun pada problem yang sudah di-decode
+            with open(path_ndjson, "w") as f:
+                f.write('{"kapasitas_kontainer": 100}\n{"id": "X", "ukuran": 5}\n{"id": "X", "ukuran": 6}\n')
+            with self.assertRaises(ValueError):
+                parse_problem_stream(path_ndjson)
+            with self.assertRaises(ValueError):
+                parse_problem_data({"kapasitas_kontainer": 100, "barang": [{"id": "X", "ukuran": 0}]})
+
+    def test_problem_cache(self):
+        # Mengecek cache biner: dibuat sekali per isi file, dibuka ulang via mmap dengan
+        # hasil yang sama, dan ditulis ulang bila file cache rusak
+        barang_list, kapasitas = parse_problem('src/data/problem.json')
+        with tempfile.TemporaryDirectory() as tmp:
+            arrays, cache_path = load_problem_cached('src/data/problem.json', tmp)
+            self.assertEqual((arrays.to_items(), arrays.kapasitas), (barang_list, kapasitas))
+            waktu_tulis = os.path.getmtime(cache_path)
+
+            arrays_ulang, path_ulang = load_problem_cached('src/data/problem.json', tmp)
+            self.assertEqual(path_ulang, cache_path)
+            self.assertEqual(os.path.getmtime(cache_path), waktu_tulis)
+            self.assertEqual(arrays_ulang.to_items(), barang_list)
+            self.assertEqual(parse_problem('src/data/problem.json', cache_dir=tmp), (barang_list, kapasitas))
+
+            with open(cache_path, 'wb') as f:
+                f.write(b'rusak')
+            with self.assertRaises(ValueError):
+                open_problem_cache(cache_path)
+            arrays_baru, _ = load_problem_cached('src/data/problem.json', tmp)
+            self.assertEqual(arrays_baru.to_items(), barang_list)
+
+            # Format cache ikut menjadi kunci: format lain tidak pernah membuka file lama
+            with mock.patch.object(problem_cache, '_TAG_FORMAT', problem_cache._TAG_FORMAT + b'x'):
+                self.assertNotEqual(cache_path_for('src/data/problem.json', tmp), cache_path)
+            # Header dengan tata letak data lain (mis. urutan byte berbeda) ditolak saat dibuka
+            with mock.patch.object(problem_cache, '_TATA_LETAK_DATA', b'B841'):
+                problem_cache.write_problem_cache(arrays_baru, cache_path)
+            with self.assertRaises(ValueError):
+                open_problem_cache(cache_path)
+            self.assertEqual(load_problem_cached('src/data/problem.json', tmp)[0].to_items(), barang_list)
+
     def test_ffd_state_generator(self):
         # Mengecek generator keadaan awal menggunakan heuristik First Fit Decreasing
         barang_list = [Barang('B01', 30), Barang('B02', 80), Barang('B03', 20)]
@@ -61,6 +175,69 @@ class TestCoreComponents(unittest.TestCase):
         self.assertEqual(c2.muatan_saat_ini, 30)
         self.assertIn(Barang('B01', 30), c2.barang_di_dalam)
 
+    def test_capacity_tree_and_fit_strategies(self):
+        # Mengecek query First-Fit pada segment tree dan hasil BFD/WFD
+        pohon = CapacityTree(4, 100)
+        pohon.perbarui(0, 20)
+        pohon.perbarui(1, 70)
+        self.assertEqual(pohon.cari_pertama(50), 1)
+        self.assertEqual(pohon.cari_pertama(80), 2)
+        self.assertEqual(pohon.cari_pertama(10), 0)
+        self.assertEqual(CapacityTree(2, 30).cari_pertama(31), -1)
+
+        self.assertEqual(pack_items([40, 60, 10], 70, 'first_fit', decreasing=False), [[0, 2], [1]])
+        self.assertEqual(pack_items([40, 60, 10], 70, 'best_fit', decreasing=False), [[0], [1, 2]])
+        self.assertEqual(pack_items([50, 30, 20, 15], 70, 'first_fit'), [[0, 2], [1, 3]])
+        self.assertEqual(pack_items([50, 30, 20, 15], 70, 'worst_fit'), [[0, 3], [1, 2]])
+
+        # Indeks Best-Fit: sisa terkecil yang muat, seri ke ID terkecil, entri terhapus diabaikan
+        indeks = BestFitIndex(100)
+        for kontainer_id, sisa in ((3, 40), (1, 40), (2, 15), (4, 90)):
+            indeks.tambah(kontainer_id, sisa)
+        self.assertEqual(indeks.cari(20), 1)
+        indeks.hapus(1)
+        self.assertEqual(indeks.cari(20), 3)
+        self.assertEqual(indeks.cari(0), 2)
+        self.assertIsNone(indeks.cari(91))
+        self.assertEqual(len(indeks), 3)
+
+        # Best Fit sama dengan pencarian linear sisa kapasitas terkecil yang muat
+        ukuran = [(i * 37) % 61 + 1 for i in range(300)]
+        sisa_ref, kontainer_ref = [], []
+        for i in sorted(range(len(ukuran)), key=lambda i: ukuran[i], reverse=True):
+            kandidat = [(s, b) for b, s in enumerate(sisa_ref) if s >= ukuran[i]]
+            slot = min(kandidat)[1] if kandidat else len(sisa_ref)
+            if slot == len(sisa_ref):
+                sisa_ref.append(70)
+                kontainer_ref.append([])
+            sisa_ref[slot] -= ukuran[i]
+            kontainer_ref[slot].append(i)
+        self.assertEqual(pack_items(ukuran, 70, 'best_fit'), kontainer_ref)
+
+        barang_list = [Barang('B01', 30), Barang('B02', 80), Barang('B03', 20), Barang('B04', 120)]
+        for generator in (generate_bfd_state, generate_wfd_state):
+            state = generator(barang_list, 100)
+            self.assertEqual(sum(len(k.barang_di_dalam) for k in state.kontainer_list), 3)
+            self.assertEqual([b.id for b in state.barang_belum_dialokasi], ['B04'])
+            self.assertTrue(all(k.muatan_saat_ini <= 100 for k in state.kontainer_list))
+
+    def test_lower_bounds(self):
+        # L2 lebih ketat dari L1 ketika banyak barang berukuran lebih dari setengah kapasitas
+        self.assertEqual(lower_bound_l1([60, 60, 60], 100), 2)
+        self.assertEqual(lower_bound_l2([60, 60, 60], 100), 3)
+        self.assertEqual(lower_bound_l2([60, 50, 40, 30, 20], 100), 2)
+
+        # Barang yang melebihi kapasitas diabaikan
+        barang = [Barang('B01', 70), Barang('B02', 30), Barang('B03', 150)]
+        self.assertEqual(compute_lower_bound(barang, 100), 1)
+        self.assertEqual(compute_lower_bound([], 100), 0)
+
+        state = generate_ffd_state(barang[:2], 100)
+        skor = calculate_objective(state, ObjectiveConfig())
+        self.assertTrue(reached_lower_bound(skor, len(state.kontainer_list), 1))
+        self.assertFalse(reached_lower_bound(skor, len(state.kontainer_list), None))
+        self.assertFalse(reached_lower_bound(skor + 1e6, len(state.kontainer_list), 1))
+
     def test_objective_function_base(self):
         # Mengecek komponen dasar (jumlah kontainer & kepadatan) dari fungsi objektif
         config = ObjectiveConfig()
@@ -121,5 +298,129 @@ class TestCoreComponents(unittest.TestCase):
         state_incompatible_ok = State([k_incompatible_ok])
         self.assertTrue(calculate_objective(state_incompatible_ok, config_incompatible) < 500_000)
 
+    def test_delta_evaluation_matches_full_recomputation(self):
+        # Mengecek evaluasi delta relokasi & penukaran terhadap perhitungan ulang penuh
+        barang_list, kapasitas = parse_problem('src/data/problem.json')
+        barang_list = [b for b in barang_list if b.ukuran <= kapasitas]
+        rng = random.Random(7)
+        config = ObjectiveConfig(use_fragile_constraint=True, use_incompatible_constraint=True, verify_delta=True)
+        state = generate_ffd_state(barang_list, kapasitas)
+        komponen = compute_components(state, config)
+
+        for _ in range(200):
+            asal, lain = rng.sample(state.kontainer_list, 2)
+            barang = rng.choice(asal.barang_di_dalam)
+            if rng.random() < 0.5:
+                tujuan = rng.choice([lain, None])
+                hasil = relocation_delta(state, komponen, asal, barang, tujuan, config)
+                asal.hapus_barang(barang)
+                if tujuan is None:
+                    state.kontainer_list.append(Kontainer(len(state.kontainer_list), kapasitas, [barang]))
+                else:
+                    tujuan.tambah_barang(barang)
+                if not asal.barang_di_dalam:
+                    state.kontainer_list.remove(asal)
+            else:
+                barang_lain = rng.choice(lain.barang_di_dalam)
+                hasil = swap_delta(state, komponen, asal, barang, lain, barang_lain, config)
+                asal.hapus_barang(barang)
+                lain.hapus_barang(barang_lain)
+                asal.tambah_barang(barang_lain)
+                lain.tambah_barang(barang)
+            komponen = hasil
+            self.assertEqual(komponen.score(), calculate_objective(state, config))
+
+    def test_array_state_round_trip(self):
+        # Mengecek konversi State <-> ArrayState mempertahankan alokasi barang
+        k1 = Kontainer(0, 100, [Barang('B01', 60), Barang('B02', 30)])
+        k2 = Kontainer(1, 100, [Barang('B03', 50)])
+        state = State([k1, k2], barang_belum_dialokasi=[Barang('B04', 150)])
+        array_state = ArrayState.dari_state(state)
+
+        self.assertEqual(array_state.jumlah_kontainer, 2)
+        self.assertEqual(array_state.muatan[array_state.kontainer_dari[array_state.indeks_barang('B02')]], 90)
+        self.assertEqual(array_state.kontainer_dari[array_state.indeks_barang('B04')], TANPA_KONTAINER)
+
+        hasil = array_state.ke_state()
+        self.assertEqual([[b.id for b in k.barang_di_dalam] for k in hasil.kontainer_list], [['B01', 'B02'], ['B03']])
+        self.assertEqual([b.id for b in hasil.barang_belum_dialokasi], ['B04'])
+        self.assertAlmostEqual(calculate_objective(hasil, ObjectiveConfig()), calculate_objective(state, ObjectiveConfig()))
+
+    def test_array_state_moves_and_copy(self):
+        # Mengecek pemindahan, penukaran, dan independensi salinan ArrayState
+        state = State([
+            Kontainer(0, 100, [Barang('B01', 60)]),
+            Kontainer(1, 100, [Barang('B02', 30), Barang('B03', 10)]),
+        ])
+        asli = ArrayState.dari_state(state)
+        salinan = asli.salin()
+        b01, b02, b03 = (salinan.indeks_barang(i) for i in ('B01', 'B02', 'B03'))
+
+        salinan.pindahkan(b03, salinan.kontainer_dari[b01])
+        self.assertEqual(salinan.muatan[salinan.kontainer_dari[b01]], 70)
+        salinan.tukar(b01, b02)
+        self.assertEqual(salinan.kontainer_dari[b02], salinan.kontainer_dari[b03])
+        self.assertEqual(salinan.muatan[salinan.kontainer_dari[b02]], 40)
+
+        salinan.pindahkan(b01, salinan.kontainer_dari[b02])
+        self.assertEqual(salinan.jumlah_kontainer, 1)
+        baru = salinan.pindahkan_ke_kontainer_baru(b03)
+        self.assertEqual(salinan.jumlah_kontainer, 2)
+        self.assertEqual(salinan.muatan[baru], 10)
+
+        # State asli tidak ikut berubah
+        self.assertEqual(asli.jumlah_kontainer, 2)
+        self.assertEqual(asli.muatan[asli.kontainer_dari[b03]], 40)
+
+    def test_array_state_singleton_move_to_new_container(self):
+        # Barang satu-satunya di kontainernya tetap di kontainer itu, meski semua kontainer terpakai
+        state = State([Kontainer(0, 100, [Barang('B01', 60)]), Kontainer(1, 100, [Barang('B02', 30)])])
+        array_state = ArrayState.dari_state(state)
+        b01 = array_state.indeks_barang('B01')
+        asal = array_state.kontainer_dari[b01]
+
+        self.assertEqual(array_state.pindahkan_ke_kontainer_baru(b01), asal)
+        self.assertEqual(array_state.jumlah_kontainer, 2)
+        self.assertEqual(array_state.muatan[asal], 60)
+
+    def test_history_recorders(self):
+        # Semua perekam menghitung titik yang ditambahkan; versi hemat memori membatasi titik tersimpan
+        nilai = [float((i * 37) % 101) for i in range(1000)]
+        perekam = [FullHistory(), DecimatedHistory(step=10), DecimatedHistory(max_points=64), MinMaxHistory(max_buckets=50)]
+        for r in perekam:
+            for v in nilai:
+                r.append(v)
+            self.assertEqual(len(r), 1000)
+            self.assertEqual(r.last, nilai[-1])
+            xs, ys = r.points()
+            self.assertEqual(xs, sorted(xs))
+            self.assertEqual((xs[-1], ys[-1]), (999, nilai[-1]))
+            self.assertTrue(all(ys[k] == nilai[x] for k, x in enumerate(xs)))
+
+        self.assertEqual(perekam[0].points()[1], nilai)
+        self.assertEqual(perekam[1].points()[0][:3], [0, 10, 20])
+        self.assertLessEqual(len(perekam[2].points()[0]), 65)
+        # Min/max global tetap terlihat meskipun bucket digabung
+        self.assertIn(min(nilai), perekam[3].points()[1])
+        self.assertIn(max(nilai), perekam[3].points()[1])
+        self.assertIsInstance(perekam[3].spawn('prob'), MinMaxHistory)
+        self.assertEqual(history_points([3.0, 2.0]), ([0, 1], [3.0, 2.0]))
+        # Perekam tanpa implementasi points/spawn/_rekam tidak dapat dibuat
+        with self.assertRaises(TypeError):
+            HistoryRecorder()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with BinaryFileHistory(os.path.join(tmp, 'skor.bin'), buffer_size=100, max_points=64) as r:
+                for v in nilai:
+                    r.append(v)
+                self.assertEqual(r.read().tolist(), nilai)
+                # Titik plot dibaca dengan langkah tetap: terbatas, terurut, dan memuat titik terakhir
+                xs, ys = r.points()
+                self.assertLessEqual(len(xs), 65)
+                self.assertEqual((int(xs[-1]), float(ys[-1])), (999, nilai[-1]))
+                self.assertTrue(all(ys[k] == nilai[x] for k, x in enumerate(xs)))
+                with r.spawn('prob') as prob:
+                    self.assertTrue(prob.path.endswith('skor_prob.bin'))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file